@@ -1,11 +1,90 @@
 """AI Engine for OpenRouter integration."""
 
-from typing import Optional
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine
+    orjson = None
+
 from ..config import get_settings
 
+# Response cache bounds
+_CACHE_MAX_ENTRIES = 256
+_CACHE_TTL_SECONDS = 600.0
+
+LENGTH_GUIDE = {
+    "short": "Keep it brief, under 100 characters",
+    "medium": "Around 150-280 characters",
+    "long": "Detailed post, up to 500 characters",
+}
+
+POST_TONE_MAP = {
+    "friendly": "warm, approachable, use emojis occasionally",
+    "professional": "formal, informative, business-oriented",
+    "casual": "relaxed, conversational, like talking to a friend",
+    "authoritative": "confident, knowledgeable, expert tone",
+}
+
+RESPONSE_TONE_MAP = {
+    "friendly": "warm and approachable",
+    "professional": "formal and helpful",
+    "casual": "casual and friendly",
+    "authoritative": "confident and expert",
+}
+
+# Shared static prefix for all system prompts. Keeping the identical text
+# first maximizes provider-side prompt-cache prefix hits across the three
+# generation flows; role-specific instructions follow the prefix.
+SYSTEM_PROMPT_PREFIX = """You are MediaAgent, a social media assistant promoting a product.
+Stay authentic and truthful. Don't make up specific numbers or claims.
+If you don't know something, be honest about it."""
+
+POST_SYSTEM_PROMPT = SYSTEM_PROMPT_PREFIX + """
+
+Act as a content generator: create engaging posts tailored to the specified
+brand voice and audience. Always include relevant hashtags."""
+
+LEAD_SEARCH_SYSTEM_PROMPT = SYSTEM_PROMPT_PREFIX + """
+
+Act as a marketing expert helping find potential customers: generate relevant
+search queries to find people interested in similar products."""
+
+RESPONSE_SYSTEM_TEMPLATE = SYSTEM_PROMPT_PREFIX + """
+
+Act as a social media manager responding to user comments/messages.
+Keep responses {tone} and helpful, and don't be overly salesy."""
+
+POST_PROMPT_TEMPLATE = """Generate a {post_type} social media post for a product called "{product_name}".
+Product description: {product_description}
+Brand voice: {brand_voice}
+Target audience interests: {target_audience}
+Length: {length}
+
+Create only the post content, no explanations or prefixes."""
+
+RESPONSE_PROMPT_TEMPLATE = """Product: {product_name}
+Product info: {product_description}
+
+User message/comment: "{user_message}"
+
+Write a natural, engaging response."""
+
+LEAD_SEARCH_PROMPT_TEMPLATE = """Product: {product_name}
+Description: {product_description}
+Target audience: {target_audience}
+Platform: {platform}
+
+Generate 5 specific hashtags and 5 specific keywords/accounts to search for.
+Format as a simple list, one per line.
+Focus on people who would be interested in this type of product."""
+
 
 class AIEngine:
     """AI Engine using OpenRouter API."""
@@ -14,6 +93,54 @@ class AIEngine:
         self.settings = get_settings()
         self.base_url = "https://openrouter.ai/api/v1"
         self.model = self.settings.openrouter_model
+        # One persistent client so every call reuses pooled connections
+        # instead of paying a fresh TCP + TLS handshake per request.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=httpx.Timeout(60.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={
+                "Authorization": f"Bearer {self.settings.openrouter_api_key}",
+                "Content-Type": "application/json",
+                "HTTP-Referer": "http://localhost:8080",
+                "X-Title": "MediaAgent",
+            },
+        )
+
+        # Small LRU of recent responses so repeated identical prompts
+        # (UI re-renders, unchanged product settings) skip the API call.
+        self._resp_cache: OrderedDict[str, tuple[float, str]] = OrderedDict()
+
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self._client.aclose()
+
+    @staticmethod
+    def _cache_key(model: str, messages: list, max_tokens: int, temperature: float) -> str:
+        key_data = {"m": model, "msgs": messages, "t": temperature, "mx": max_tokens}
+        if orjson is not None:
+            raw = orjson.dumps(key_data, option=orjson.OPT_SORT_KEYS)
+        else:
+            raw = json.dumps(key_data, sort_keys=True).encode()
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        entry = self._resp_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, content = entry
+        if time.time() - stored_at > _CACHE_TTL_SECONDS:
+            del self._resp_cache[key]
+            return None
+        self._resp_cache.move_to_end(key)
+        return content
+
+    def _cache_put(self, key: str, content: str):
+        self._resp_cache[key] = (time.time(), content)
+        self._resp_cache.move_to_end(key)
+        while len(self._resp_cache) > _CACHE_MAX_ENTRIES:
+            self._resp_cache.popitem(last=False)
 
     async def generate(
         self,
@@ -21,23 +148,43 @@ class AIEngine:
         system_prompt: Optional[str] = None,
         max_tokens: int = 500,
         temperature: float = 0.7,
+        cache: bool = True,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
     ) -> str:
-        """Generate text using OpenRouter API."""
+        """Generate text using OpenRouter API.
+
+        With stream=True the completion is read as server-sent events and
+        each content delta is passed to on_token as it arrives, so callers
+        can render incrementally instead of waiting for the full response.
+        """
         if not self.settings.openrouter_api_key:
             raise ValueError("OpenRouter API key not configured")
 
-        headers = {
-            "Authorization": f"Bearer {self.settings.openrouter_api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "http://localhost:8080",
-            "X-Title": "MediaAgent",
-        }
-
         messages = []
         if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
+            # Content-part form with cache_control lets OpenRouter cache the
+            # static system prefix server-side (Anthropic-style prompt caching),
+            # cutting input cost and time-to-first-token on repeat calls.
+            messages.append({
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            })
         messages.append({"role": "user", "content": prompt})
 
+        cache_key = None
+        if cache:
+            cache_key = self._cache_key(self.model, messages, max_tokens, temperature)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                if on_token is not None:
+                    on_token(cached)
+                return cached
+
         payload = {
             "model": self.model,
             "messages": messages,
@@ -45,15 +192,43 @@ class AIEngine:
             "temperature": temperature,
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
+        if stream:
+            content = await self._generate_stream(payload, on_token)
+        else:
+            response = await self._client.post("/chat/completions", json=payload)
+            response.raise_for_status()
+            data = orjson.loads(response.content) if orjson is not None else response.json()
+            content = data["choices"][0]["message"]["content"]
+        if cache_key is not None:
+            self._cache_put(cache_key, content)
+        return content
+
+    async def _generate_stream(
+        self,
+        payload: dict,
+        on_token: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Stream a completion as SSE frames and return the joined text."""
+        payload = dict(payload, stream=True)
+        loads = orjson.loads if orjson is not None else json.loads
+        parts: list[str] = []
+
+        async with self._client.stream("POST", "/chat/completions", json=payload) as response:
             response.raise_for_status()
-            data = response.json()
-            return data["choices"][0]["message"]["content"]
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                chunk = loads(data)
+                delta = chunk["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    parts.append(delta)
+                    if on_token is not None:
+                        on_token(delta)
+
+        return "".join(parts)
 
     async def generate_post(
         self,
@@ -65,32 +240,16 @@ class AIEngine:
         length: str = "medium",
     ) -> str:
         """Generate a social media post."""
-        length_guide = {
-            "short": "Keep it brief, under 100 characters",
-            "medium": "Around 150-280 characters",
-            "long": "Detailed post, up to 500 characters",
-        }
-
-        tone_map = {
-            "friendly": "warm, approachable, use emojis occasionally",
-            "professional": "formal, informative, business-oriented",
-            "casual": "relaxed, conversational, like talking to a friend",
-            "authoritative": "confident, knowledgeable, expert tone",
-        }
-
-        system_prompt = """You are a social media content generator. 
-Create engaging posts tailored to the specified brand voice and audience.
-Always include relevant hashtags. Don't make up specific numbers or claims."""
-
-        prompt = f"""Generate a {post_type} social media post for a product called "{product_name}".
-Product description: {product_description}
-Brand voice: {tone_map.get(brand_voice, brand_voice)}
-Target audience interests: {target_audience}
-Length: {length_guide.get(length, length_guide['medium'])}
+        prompt = POST_PROMPT_TEMPLATE.format_map({
+            "post_type": post_type,
+            "product_name": product_name,
+            "product_description": product_description,
+            "brand_voice": POST_TONE_MAP.get(brand_voice, brand_voice),
+            "target_audience": target_audience,
+            "length": LENGTH_GUIDE.get(length, LENGTH_GUIDE["medium"]),
+        })
 
-Create only the post content, no explanations or prefixes."""
-
-        return await self.generate(prompt, system_prompt=system_prompt, max_tokens=600)
+        return await self.generate(prompt, system_prompt=POST_SYSTEM_PROMPT, max_tokens=600)
 
     async def generate_response(
         self,
@@ -100,24 +259,15 @@ Create only the post content, no explanations or prefixes."""
         user_message: str,
     ) -> str:
         """Generate a response to user engagement."""
-        tone_map = {
-            "friendly": "warm and approachable",
-            "professional": "formal and helpful",
-            "casual": "casual and friendly",
-            "authoritative": "confident and expert",
-        }
-
-        system_prompt = f"""You are a social media manager responding to user comments/messages.
-Keep responses {tone_map.get(brand_voice, 'friendly')} and helpful.
-Stay authentic and don't be overly salesy.
-If you don't know something, be honest about it."""
-
-        prompt = f"""Product: {product_name}
-Product info: {product_description}
-
-User message/comment: "{user_message}"
+        system_prompt = RESPONSE_SYSTEM_TEMPLATE.format_map({
+            "tone": RESPONSE_TONE_MAP.get(brand_voice, "friendly"),
+        })
 
-Write a natural, engaging response."""
+        prompt = RESPONSE_PROMPT_TEMPLATE.format_map({
+            "product_name": product_name,
+            "product_description": product_description,
+            "user_message": user_message,
+        })
 
         return await self.generate(prompt, system_prompt=system_prompt, max_tokens=300)
 
@@ -130,29 +280,24 @@ Write a natural, engaging response."""
         platform: str = "twitter",
     ) -> list[dict]:
         """Generate search suggestions for lead discovery."""
-        system_prompt = """You are a social media marketing expert helping find potential customers.
-Generate relevant search queries to find people interested in similar products."""
-
-        prompt = f"""Product: {product_name}
-Description: {product_description}
-Target audience: {target_audience}
-Platform: {platform}
-
-Generate 5 specific hashtags and 5 specific keywords/accounts to search for.
-Format as a simple list, one per line.
-Focus on people who would be interested in this type of product."""
+        prompt = LEAD_SEARCH_PROMPT_TEMPLATE.format_map({
+            "product_name": product_name,
+            "product_description": product_description,
+            "target_audience": target_audience,
+            "platform": platform,
+        })
 
-        result = await self.generate(prompt, system_prompt=system_prompt, max_tokens=300)
+        result = await self.generate(
+            prompt, system_prompt=LEAD_SEARCH_SYSTEM_PROMPT, max_tokens=300
+        )
         return {"suggestions": result}
 
 
-# Global AI engine instance
-_ai_engine: Optional[AIEngine] = None
+# Global AI engine instance, built once at import time so concurrent
+# callers never race a lazy initializer.
+_ai_engine = AIEngine()
 
 
 def get_ai_engine() -> AIEngine:
     """Get AI engine instance."""
-    global _ai_engine
-    if _ai_engine is None:
-        _ai_engine = AIEngine()
     return _ai_engine
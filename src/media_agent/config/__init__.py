@@ -1,7 +1,13 @@
 """Configuration module."""
 
 from .settings import Settings, get_settings, get_project_root, get_config_dir, get_db_path
-from .loader import load_product_config, list_available_products, get_faqs_from_config
+from .loader import (
+    load_product_config,
+    list_available_products,
+    get_faqs_from_config,
+    clear_config_cache,
+)
+from .crypto import encrypt_secret, decrypt_secret
 from .logging_config import setup_logging, get_logger, init_default_logging
 from .errors import MediaAgentError, handle_error, ErrorCode
 
@@ -14,6 +20,9 @@ __all__ = [
     "load_product_config",
     "list_available_products",
     "get_faqs_from_config",
+    "clear_config_cache",
+    "encrypt_secret",
+    "decrypt_secret",
     "setup_logging",
     "get_logger",
     "init_default_logging",
@@ -0,0 +1,54 @@
+"""Symmetric encryption helpers for stored credentials."""
+
+import os
+from functools import lru_cache
+from typing import Optional
+
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from .settings import get_settings, get_config_dir
+
+_NONCE_SIZE = 12  # standard 96-bit AES-GCM nonce
+
+
+@lru_cache
+def _get_key() -> bytes:
+    """Get the 256-bit AES key, generating and persisting one on first use.
+
+    The key comes from the SECRET_KEY environment variable (hex) when
+    set; otherwise it lives in config/secret.key next to the cookie
+    files, created with owner-only permissions.
+    """
+    settings = get_settings()
+    if settings.secret_key:
+        return bytes.fromhex(settings.secret_key)
+
+    key_path = get_config_dir() / "secret.key"
+    if key_path.exists():
+        return bytes.fromhex(key_path.read_text().strip())
+
+    key = AESGCM.generate_key(bit_length=256)
+    key_path.parent.mkdir(parents=True, exist_ok=True)
+    key_path.write_text(key.hex())
+    key_path.chmod(0o600)
+    return key
+
+
+def encrypt_secret(plaintext: str) -> bytes:
+    """Encrypt a secret with AES-GCM, returning nonce || ciphertext.
+
+    AES-GCM runs on AES-NI where available, so this is effectively free
+    next to the base64/text round-tripping it replaces, and the output
+    is stored as raw bytes without the ~33% base64 overhead.
+    """
+    nonce = os.urandom(_NONCE_SIZE)
+    ciphertext = AESGCM(_get_key()).encrypt(nonce, plaintext.encode("utf-8"), None)
+    return nonce + ciphertext
+
+
+def decrypt_secret(blob: Optional[bytes]) -> Optional[str]:
+    """Decrypt a nonce || ciphertext blob produced by encrypt_secret."""
+    if not blob:
+        return None
+    nonce, ciphertext = blob[:_NONCE_SIZE], blob[_NONCE_SIZE:]
+    return AESGCM(_get_key()).decrypt(nonce, ciphertext, None).decode("utf-8")
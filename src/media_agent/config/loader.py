@@ -1,33 +1,43 @@
 """Product configuration loader."""
 
 import json
+from functools import lru_cache
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json works fine
+    orjson = None
+
 from ..config import get_config_dir
 
 
+@lru_cache(maxsize=32)
 def load_product_config(product_name: str) -> Optional[dict]:
     """Load product configuration from JSON file."""
     config_dir = get_config_dir() / "products"
-    
-    # Try different extensions
-    for ext in [".json", ".yaml", ".yml"]:
-        config_path = config_dir / f"{product_name.lower()}{ext}"
-        if config_path.exists():
-            with open(config_path, "r") as f:
-                if ext == ".json":
-                    return json.load(f)
-                # Add yaml support if needed
-    
+
+    # One directory scan instead of a stat() per candidate extension;
+    # .json wins over .yaml/.yml when both exist.
+    matches = {p.suffix: p for p in config_dir.glob(f"{product_name.lower()}.*")}
+    for ext in (".json", ".yaml", ".yml"):
+        config_path = matches.get(ext)
+        if config_path is not None:
+            if ext == ".json":
+                raw = config_path.read_bytes()
+                return orjson.loads(raw) if orjson is not None else json.loads(raw)
+            # Add yaml support if needed
+
     return None
 
 
+@lru_cache(maxsize=1)
 def list_available_products() -> list[str]:
     """List all available product configs."""
     config_dir = get_config_dir() / "products"
     if not config_dir.exists():
         return []
-    
+
     products = []
     for f in config_dir.iterdir():
         if f.suffix in [".json", ".yaml", ".yml"]:
@@ -35,6 +45,17 @@ def list_available_products() -> list[str]:
     return products
 
 
+def clear_config_cache():
+    """Invalidate cached config lookups after files or env change."""
+    from .settings import get_settings
+
+    load_product_config.cache_clear()
+    list_available_products.cache_clear()
+    get_faqs_from_config.cache_clear()
+    get_settings.cache_clear()
+
+
+@lru_cache(maxsize=32)
 def get_faqs_from_config(product_name: str) -> list[dict]:
     """Extract FAQs from product config."""
     config = load_product_config(product_name)
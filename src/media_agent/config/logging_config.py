@@ -5,6 +5,13 @@ import sys
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 
+# Single prebuilt formatter shared by all handlers; logging.Formatter is
+# stateless so there is no need to construct one per setup_logging call.
+_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
 
 def setup_logging(
     log_level: str = "INFO",
@@ -30,16 +37,10 @@ def setup_logging(
     # Clear any existing handlers
     logger.handlers.clear()
     
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
     
     # File handler (if log_file is provided)
@@ -53,7 +54,7 @@ def setup_logging(
             backupCount=backup_count,
         )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
     
     return logger
@@ -28,6 +28,10 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./media_agent.db",
         description="Database URL"
     )
+    secret_key: str = Field(
+        default="",
+        description="Hex-encoded 256-bit key for credential encryption"
+    )
 
 
 @lru_cache
@@ -1,8 +1,10 @@
 """Content generation module."""
 
 from .faq_matcher import FAQMatcher, get_faq_matcher
+from .keyword_automaton import KeywordAutomaton
 
 __all__ = [
     "FAQMatcher",
     "get_faq_matcher",
+    "KeywordAutomaton",
 ]
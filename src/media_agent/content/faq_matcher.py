@@ -1,10 +1,80 @@
 """FAQ matcher service."""
 
+import math
+from collections import Counter
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..models.database import get_faqs
+from .keyword_automaton import KeywordAutomaton
+
+
+@lru_cache(maxsize=256)
+def parse_keywords(keywords: str) -> tuple[str, ...]:
+    """Split a comma-separated keyword string into cleaned lowercase terms."""
+    return tuple(k.strip().lower() for k in keywords.split(",") if k.strip())
+
+
+@lru_cache(maxsize=256)
+def build_keyword_automaton(keywords: str) -> Optional[KeywordAutomaton]:
+    """Build a single-pass matcher over the deduped keyword terms.
+
+    Aho-Corasick reports every term present in the text, including terms
+    that are prefixes of longer ones — a first-match regex alternation
+    cannot, so it undercounted overlapping keywords. Returns None when
+    the string holds no usable keywords.
+    """
+    terms = tuple(dict.fromkeys(parse_keywords(keywords)))
+    if not terms:
+        return None
+    return KeywordAutomaton(list(terms))
+
+
+@lru_cache(maxsize=512)
+def _tokenize(text: str) -> tuple[str, ...]:
+    """Split text into lowercase tokens.
+
+    Cached so repeat lookups against the same FAQ corpus reuse the
+    lowered tokens instead of re-allocating them per call.
+    """
+    return tuple(text.lower().split())
+
+
+def _build_idf(documents: list[tuple[str, ...]]) -> dict[str, float]:
+    """Compute smoothed inverse document frequency over a token corpus."""
+    doc_count = len(documents)
+    doc_freq: Counter = Counter()
+    for tokens in documents:
+        doc_freq.update(set(tokens))
+    return {
+        term: math.log((1 + doc_count) / (1 + freq)) + 1.0
+        for term, freq in doc_freq.items()
+    }
+
+
+def _tfidf_vector(tokens: tuple[str, ...], idf: dict[str, float]) -> dict[str, float]:
+    """Build a sparse TF-IDF vector for one document."""
+    if not tokens:
+        return {}
+    counts = Counter(tokens)
+    total = len(tokens)
+    return {term: (count / total) * idf.get(term, 1.0) for term, count in counts.items()}
+
+
+def _cosine_similarity(a: dict[str, float], b: dict[str, float]) -> float:
+    """Cosine similarity between two sparse vectors."""
+    if not a or not b:
+        return 0.0
+    if len(b) < len(a):
+        a, b = b, a
+    dot = sum(weight * b[term] for term, weight in a.items() if term in b)
+    if dot == 0.0:
+        return 0.0
+    norm_a = math.sqrt(sum(w * w for w in a.values()))
+    norm_b = math.sqrt(sum(w * w for w in b.values()))
+    return dot / (norm_a * norm_b)
 
 
 class FAQMatcher:
@@ -15,25 +85,30 @@ class FAQMatcher:
 
     def _calculate_keyword_score(self, query: str, faq_keywords: str) -> float:
         """Calculate keyword matching score."""
+        return self._keyword_score_lowered(query.lower(), faq_keywords)
+
+    @staticmethod
+    def _keyword_score_lowered(query_lower: str, faq_keywords: str) -> float:
+        """Keyword score for a query that is already lowercased."""
         if not faq_keywords:
             return 0.0
 
-        query_lower = query.lower()
-        keywords = [k.strip().lower() for k in faq_keywords.split(",")]
+        automaton = build_keyword_automaton(faq_keywords)
+        if automaton is None:
+            return 0.0
 
-        matches = sum(1 for kw in keywords if kw in query_lower)
-        return matches / len(keywords) if keywords else 0.0
+        matched = automaton.find_distinct(query_lower)
+        return len(matched) / len(automaton.patterns)
 
     def _calculate_text_similarity(self, query: str, question: str) -> float:
-        """Calculate simple text similarity."""
-        query_words = set(query.lower().split())
-        question_words = set(question.lower().split())
-
-        if not query_words or not question_words:
-            return 0.0
-
-        intersection = query_words.intersection(question_words)
-        return len(intersection) / max(len(query_words), len(question_words))
+        """Calculate TF-IDF weighted cosine similarity between two texts."""
+        query_tokens = _tokenize(query)
+        question_tokens = _tokenize(question)
+        idf = _build_idf([query_tokens, question_tokens])
+        return _cosine_similarity(
+            _tfidf_vector(query_tokens, idf),
+            _tfidf_vector(question_tokens, idf),
+        )
 
     async def find_matching_faq(
         self,
@@ -43,13 +118,24 @@ class FAQMatcher:
     ) -> Optional[tuple]:
         """Find the best matching FAQ for a query."""
         faqs = await get_faqs(session, product_id)
+        if not faqs:
+            return None
+
+        # Vectorize the whole FAQ corpus once so rare terms weigh more
+        # than boilerplate words shared by every question.
+        question_tokens = [_tokenize(faq.question) for faq in faqs]
+        idf = _build_idf(question_tokens)
+        query_vector = _tfidf_vector(_tokenize(query), idf)
+
+        # Lowercase the query once rather than per FAQ inside the loop.
+        query_lower = query.lower()
 
         best_match = None
         best_score = 0.0
 
-        for faq in faqs:
-            keyword_score = self._calculate_keyword_score(query, faq.keywords or "")
-            similarity_score = self._calculate_text_similarity(query, faq.question)
+        for faq, tokens in zip(faqs, question_tokens):
+            keyword_score = self._keyword_score_lowered(query_lower, faq.keywords or "")
+            similarity_score = _cosine_similarity(query_vector, _tfidf_vector(tokens, idf))
             combined_score = (keyword_score * 0.6) + (similarity_score * 0.4)
 
             if combined_score > best_score:
@@ -62,13 +148,11 @@ class FAQMatcher:
         return None
 
 
-# Global FAQ matcher instance
-_faq_matcher: Optional[FAQMatcher] = None
+# Global FAQ matcher instance, built once at import time so concurrent
+# callers never race a lazy initializer.
+_faq_matcher = FAQMatcher()
 
 
 def get_faq_matcher() -> FAQMatcher:
     """Get FAQ matcher instance."""
-    global _faq_matcher
-    if _faq_matcher is None:
-        _faq_matcher = FAQMatcher()
     return _faq_matcher
@@ -0,0 +1,72 @@
+"""Aho-Corasick automaton for multi-keyword scanning."""
+
+from collections import deque
+
+
+class KeywordAutomaton:
+    """Match many keywords against a text in a single pass.
+
+    Builds an Aho-Corasick automaton over the given patterns so scanning
+    costs O(len(text)) regardless of how many keywords are registered,
+    instead of one substring search per keyword.
+    """
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = [p.lower() for p in patterns]
+        # Trie nodes: per-node goto table, failure link and matched pattern ids
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[list[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            self._add_pattern(pattern, index)
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern: str, index: int):
+        node = 0
+        for char in pattern:
+            nxt = self._goto[node].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append(index)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                self._output[child].extend(self._output[self._fail[child]])
+
+    def find_distinct(self, text: str) -> set[int]:
+        """Return the indices of all patterns occurring in text."""
+        found: set[int] = set()
+        node = 0
+        for char in text.lower():
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                found.update(self._output[node])
+        return found
+
+    def contains_any(self, text: str) -> bool:
+        """Check whether any pattern occurs in text."""
+        node = 0
+        for char in text.lower():
+            while node and char not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(char, 0)
+            if self._output[node]:
+                return True
+        return False
@@ -1,14 +1,18 @@
 """Lead discovery service."""
 
-from typing import Optional
+import asyncio
+import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..agents.ai_engine import get_ai_engine
+from ..content.keyword_automaton import KeywordAutomaton
 from ..models.database import create_lead
 from ..models.models import Lead
 from ..platforms import get_platform_registry
 
+logger = logging.getLogger(__name__)
+
 
 class LeadDiscovery:
     """Service for discovering potential leads."""
@@ -23,6 +27,9 @@ class LeadDiscovery:
             "link in bio tool", "creator tools", "social media links",
             "personal brand", "influencer", "content creator"
         ]
+        # Scan all product keywords in one pass over the text instead of
+        # one substring search per keyword.
+        self._keyword_automaton = KeywordAutomaton(self.product_keywords)
 
     async def get_search_suggestions(
         self,
@@ -47,8 +54,15 @@ class LeadDiscovery:
         username: str = "",
         password: str = "",
         limit: int = 20,
+        text_max_len: int = 80,
     ) -> list[dict]:
-        """Search for leads on a specific platform using Playwright."""
+        """Search for leads on a specific platform using Playwright.
+
+        Scoring runs on the full scraped text, but only text_max_len
+        characters are kept in the returned dicts — callers only ever
+        display a preview, so the multi-KB blobs are dropped at the
+        parse boundary instead of being carried around.
+        """
         try:
             registry = get_platform_registry()
             adapter = registry.get_adapter(platform, username, password)
@@ -59,49 +73,55 @@ class LeadDiscovery:
             
             # Search
             results = await adapter.search(query, limit=limit)
-            
-            # Parse and score results
-            leads = []
-            for result in results:
-                score = self._calculate_relevance_score(result.get("text", ""), query)
-                leads.append({
+
+            # Parse and score results in one batch
+            scores = self._score_texts([r.get("text", "") for r in results], query)
+            return [
+                {
                     "platform": platform,
                     "username": result.get("username", ""),
-                    "text": result.get("text", ""),
+                    "text": result.get("text", "")[:text_max_len],
                     "relevance_score": score,
-                })
-            
-            return leads
+                }
+                for result, score in zip(results, scores)
+            ]
             
         except Exception as e:
-            print(f"Lead search error: {e}")
+            logger.error("Lead search error on %s: %s", platform, e)
             return []
 
+    def _score_texts(self, texts: list[str], query: str) -> list[float]:
+        """Score a whole batch of result texts against one query."""
+        query_lower = query.lower()
+        scores = []
+
+        for text in texts:
+            if not text:
+                scores.append(0.0)
+                continue
+
+            text_lower = text.lower()
+            score = 0.0
+
+            # Check for product keywords
+            score += 0.2 * len(self._keyword_automaton.find_distinct(text_lower))
+
+            # Check for query relevance
+            if query_lower in text_lower:
+                score += 0.3
+
+            # Boost for multiple mentions
+            count = text_lower.count(query_lower)
+            if count > 1:
+                score += 0.1
+
+            scores.append(min(score, 1.0))
+
+        return scores
+
     def _calculate_relevance_score(self, text: str, query: str) -> float:
         """Calculate relevance score based on keyword matching."""
-        if not text:
-            return 0.0
-        
-        text_lower = text.lower()
-        query_lower = query.lower()
-        
-        score = 0.0
-        
-        # Check for product keywords
-        for keyword in self.product_keywords:
-            if keyword in text_lower:
-                score += 0.2
-        
-        # Check for query relevance
-        if query_lower in text_lower:
-            score += 0.3
-        
-        # Boost for multiple mentions
-        count = text_lower.count(query_lower)
-        if count > 1:
-            score += 0.1
-        
-        return min(score, 1.0)
+        return self._score_texts([text], query)[0]
 
     async def search_leads(
         self,
@@ -114,28 +134,31 @@ class LeadDiscovery:
         platform: str = "twitter",
     ) -> list[dict]:
         """Search for potential leads."""
-        # Get AI suggestions
-        suggestions = await self.get_search_suggestions(
+        # Kick off AI suggestions in the background; the platform searches
+        # don't depend on them, so there is no reason to wait first.
+        suggestions_task = asyncio.create_task(self.get_search_suggestions(
             product_name, product_description, target_audience
-        )
-        
+        ))
+
         # Build search queries
         search_queries = [query] if query else []
-        
+
         # Add keyword-based searches
         for keyword in self.product_keywords[:5]:
             search_queries.append(keyword)
-        
-        # Search for leads
-        all_leads = []
-        
-        for search_query in search_queries[:5]:  # Limit searches
-            leads = await self.search_leads_on_platform(
+
+        # Run the capped set of searches concurrently instead of one by one
+        lead_batches = await asyncio.gather(*(
+            self.search_leads_on_platform(
                 platform=platform,
                 query=search_query,
                 limit=10,
             )
-            all_leads.extend(leads)
+            for search_query in search_queries[:5]  # Limit searches
+        ))
+        all_leads = [lead for batch in lead_batches for lead in batch]
+
+        await suggestions_task
         
         # Remove duplicates and sort by score
         seen = set()
@@ -146,9 +169,53 @@ class LeadDiscovery:
                 unique_leads.append(lead)
         
         unique_leads.sort(key=lambda x: x["relevance_score"], reverse=True)
-        
+
         return unique_leads[:20]  # Return top 20
 
+    async def stream_leads(
+        self,
+        product_id: int,
+        product_name: str,
+        product_description: str,
+        target_audience: str,
+        query: str,
+        platform: str = "twitter",
+        limit: int = 20,
+    ):
+        """Yield unique leads as each platform search completes.
+
+        Streaming counterpart of search_leads for interactive callers:
+        the first lead arrives after the fastest search instead of after
+        all of them, at the cost of global score ordering.
+        """
+        search_queries = [query] if query else []
+        for keyword in self.product_keywords[:5]:
+            search_queries.append(keyword)
+
+        tasks = [
+            asyncio.create_task(self.search_leads_on_platform(
+                platform=platform,
+                query=search_query,
+                limit=10,
+            ))
+            for search_query in search_queries[:5]  # Limit searches
+        ]
+
+        seen = set()
+        yielded = 0
+        try:
+            for next_batch in asyncio.as_completed(tasks):
+                for lead in await next_batch:
+                    if lead["username"] and lead["username"] not in seen:
+                        seen.add(lead["username"])
+                        yield lead
+                        yielded += 1
+                        if yielded >= limit:
+                            return
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def save_lead(
         self,
         session: AsyncSession,
@@ -202,17 +269,15 @@ class LeadDiscovery:
             return False
             
         except Exception as e:
-            print(f"Engage error: {e}")
+            logger.error("Engage error for %s on %s: %s", username, platform, e)
             return False
 
 
-# Global lead discovery instance
-_lead_discovery: Optional[LeadDiscovery] = None
+# Global lead discovery instance, built once at import time so concurrent
+# callers never race a lazy initializer.
+_lead_discovery = LeadDiscovery()
 
 
 def get_lead_discovery() -> LeadDiscovery:
     """Get lead discovery instance."""
-    global _lead_discovery
-    if _lead_discovery is None:
-        _lead_discovery = LeadDiscovery()
     return _lead_discovery
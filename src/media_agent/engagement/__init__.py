@@ -1,8 +1,10 @@
 """Engagement module for auto-response."""
 
 from .auto_response import AutoResponder, get_auto_responder
+from .response_cache import SemanticResponseCache
 
 __all__ = [
     "AutoResponder",
+    "SemanticResponseCache",
     "get_auto_responder",
 ]
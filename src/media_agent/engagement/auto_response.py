@@ -1,17 +1,56 @@
 """Auto-response service for monitoring and replying to engagement."""
 
+import asyncio
+import contextlib
+import hashlib
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..models.database import get_db, get_products, get_faqs, log_activity
+from ..content.faq_matcher import parse_keywords
+from ..content.keyword_automaton import KeywordAutomaton
+from ..models.database import get_db, get_product, get_faqs, log_activity, increment_analytics
 from ..platforms import get_platform_registry
 from ..agents.ai_engine import get_ai_engine
+from .response_cache import SemanticResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Exact-match response cache bounds
+_EXACT_CACHE_MAX_ENTRIES = 5000
+_EXACT_CACHE_TTL_SECONDS = 3600.0
+
+# Products and FAQs change rarely; cache them briefly so every mention
+# doesn't pay a SELECT plus ORM hydration.
+_LOOKUP_CACHE_TTL_SECONDS = 60.0
+
+# How long a logged-in adapter is trusted before logging in again
+_ADAPTER_LOGIN_TTL_SECONDS = 3600.0
+
+
+@dataclass(slots=True, frozen=True)
+class ProductSnapshot:
+    """Immutable product view safe to share across concurrent mentions."""
+
+    id: int
+    name: str
+    description: str
+    brand_voice: str
+
+
+@dataclass(slots=True, frozen=True)
+class FAQSnapshot:
+    """Immutable FAQ view safe to share across concurrent mentions."""
+
+    id: int
+    question: str
+    answer: str
+
 
 class AutoResponder:
     """Service for automatically responding to mentions and comments."""
@@ -21,6 +60,26 @@ class AutoResponder:
         self.is_running = False
         self._check_interval = 120  # Check every 2 minutes
         self._last_check: dict = {}  # Track last check per platform
+        # Reuse answers for paraphrased repeats of the same question
+        self._semantic_cache = SemanticResponseCache()
+        # Exact repeats (bots, retries) are answered from a plain dict
+        # before the semantic layer is even consulted.
+        self._exact_cache: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._cache_stats = {"hits": 0, "misses": 0}
+        # One keyword automaton per product so every mention is matched
+        # against all FAQ terms in a single pass over the text.
+        # product_id -> (faq fingerprint, owning-FAQ index per pattern, automaton)
+        self._faq_automaton_cache: dict[int, tuple[tuple, list[int], KeywordAutomaton]] = {}
+        # Short-TTL lookup caches: product_id -> (expires_at, value).
+        # FAQ entries carry a parallel tuple of pre-split, pre-lowercased
+        # match terms so the hot path never re-parses keyword strings.
+        self._product_cache: dict[int, tuple[float, object]] = {}
+        self._faq_cache: dict[int, tuple[float, list, tuple]] = {}
+        # Logged-in adapters: (platform, username) -> (adapter, login_ts)
+        self._adapter_cache: dict[tuple[str, str], tuple[object, float]] = {}
+        # Keep references to fire-and-forget logging tasks so they aren't
+        # garbage-collected mid-flight.
+        self._background_tasks: set = set()
 
     async def start(self):
         """Start the auto-responder."""
@@ -32,6 +91,95 @@ class AutoResponder:
         self.is_running = False
         logger.info("Auto-responder stopped")
 
+    async def _get_product_cached(
+        self, session: AsyncSession, product_id: int
+    ) -> Optional[ProductSnapshot]:
+        """Fetch a product snapshot, reusing a recent lookup when available.
+
+        Snapshots are plain frozen dataclasses, so the hot path avoids ORM
+        descriptor overhead and the cached value is safe to share across
+        coroutines without touching a session.
+        """
+        entry = self._product_cache.get(product_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        product = await get_product(session, product_id)
+        if product is None:
+            return None
+        snapshot = ProductSnapshot(
+            id=product.id,
+            name=product.name,
+            description=product.description or "",
+            brand_voice=product.brand_voice,
+        )
+        self._product_cache[product_id] = (
+            time.monotonic() + _LOOKUP_CACHE_TTL_SECONDS, snapshot
+        )
+        return snapshot
+
+    async def _get_faqs_cached(self, session: AsyncSession, product_id: int) -> tuple[list, tuple]:
+        """Fetch a product's FAQs plus their precomputed match terms.
+
+        Returns the FAQ list and a parallel tuple holding each FAQ's
+        lowered question/keyword terms, built once per cache refresh.
+        """
+        entry = self._faq_cache.get(product_id)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1], entry[2]
+
+        rows = await get_faqs(session, product_id)
+        faqs = [
+            FAQSnapshot(id=faq.id, question=faq.question, answer=faq.answer)
+            for faq in rows
+        ]
+        faq_terms = tuple(
+            parse_keywords(faq.question) + parse_keywords(faq.keywords or "")
+            for faq in rows
+        )
+        self._faq_cache[product_id] = (
+            time.monotonic() + _LOOKUP_CACHE_TTL_SECONDS, faqs, faq_terms
+        )
+        return faqs, faq_terms
+
+    def _log_in_background(self, action: str, product_id: int, platform: str, details: str):
+        """Write an activity row and counter bump off the critical path."""
+
+        async def _write():
+            db = get_db()
+            async with db.async_session_maker() as session:
+                await log_activity(
+                    session,
+                    action=action,
+                    product_id=product_id,
+                    platform=platform,
+                    details=details,
+                )
+                await increment_analytics(session, product_id, platform, responses_sent=1)
+
+        task = asyncio.create_task(_write())
+        self._background_tasks.add(task)
+
+        def _finished(t):
+            self._background_tasks.discard(t)
+            if not t.cancelled() and t.exception() is not None:
+                logger.error("Background activity log failed: %s", t.exception())
+
+        task.add_done_callback(_finished)
+
+    async def _get_logged_in_adapter(self, platform: str, username: str, password: str):
+        """Return a logged-in adapter, reusing a recent login when possible."""
+        key = (platform, username)
+        entry = self._adapter_cache.get(key)
+        if entry is not None and time.monotonic() - entry[1] < _ADAPTER_LOGIN_TTL_SECONDS:
+            return entry[0]
+
+        registry = get_platform_registry()
+        adapter = registry.get_adapter(platform, username, password)
+        await adapter.login()
+        self._adapter_cache[key] = (adapter, time.monotonic())
+        return adapter
+
     async def check_and_respond(
         self,
         platform: str,
@@ -41,48 +189,50 @@ class AutoResponder:
     ):
         """Check for new mentions and respond."""
         if not username or not password:
-            logger.warning(f"No credentials for {platform}, skipping auto-response")
+            logger.warning("No credentials for %s, skipping auto-response", platform)
             return
 
         db = get_db()
         async with db.async_session_maker() as session:
             # Get product info
-            products = await get_products(session)
-            product = next((p for p in products if p.id == product_id), None)
-            
+            product = await self._get_product_cached(session, product_id)
+
             if not product:
-                logger.warning(f"Product {product_id} not found")
+                logger.warning("Product %s not found", product_id)
                 return
 
             # Get FAQs
-            faqs = await get_faqs(session, product_id)
+            faqs, faq_terms = await self._get_faqs_cached(session, product_id)
 
             # Get platform adapter
             try:
-                registry = get_platform_registry()
-                adapter = registry.get_adapter(platform, username, password)
-                await adapter.login()
+                adapter = await self._get_logged_in_adapter(platform, username, password)
 
                 # Get mentions
                 since_id = self._last_check.get(platform)
                 mentions = await adapter.get_mentions(since_id)
 
-                # Process each mention
+                # Process each mention; activity rows accumulate in the
+                # session and are committed once after the batch.
                 for mention in mentions:
                     await self._process_mention(
                         session=session,
                         adapter=adapter,
                         product=product,
                         faqs=faqs,
+                        faq_terms=faq_terms,
                         mention=mention,
                         platform=platform,
                     )
 
+                if mentions:
+                    await session.commit()
+
                 # Update last check
                 self._last_check[platform] = datetime.utcnow().isoformat()
 
             except Exception as e:
-                logger.error(f"Auto-response error for {platform}: {e}")
+                logger.error("Auto-response error for %s: %s", platform, e)
 
     async def _process_mention(
         self,
@@ -90,43 +240,43 @@ class AutoResponder:
         adapter,
         product,
         faqs,
+        faq_terms: tuple,
         mention: dict,
         platform: str,
     ):
         """Process a single mention and generate response."""
         try:
             text = mention.get("text", "")
-            
-            # Try to find matching FAQ
-            matched_faq = None
-            for faq in faqs:
-                if self._keyword_match(text, faq.question) or self._keyword_match(text, faq.keywords or ""):
-                    matched_faq = faq
-                    break
+
+            # Start the AI generation speculatively; the FAQ scan is
+            # synchronous, so on a hit the task is cancelled before it
+            # ever runs and no request is sent.
+            ai_task = asyncio.create_task(self._generate_ai_response(product, text))
+
+            matched_faq = self._match_faq(product.id, faqs, faq_terms, text.lower())
 
             if matched_faq:
+                ai_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await ai_task
                 response = matched_faq.answer
                 response_source = f"FAQ: {matched_faq.question}"
             else:
-                # Use AI to generate response
-                response = await self.ai_engine.generate_response(
-                    product_name=product.name,
-                    product_description=product.description or "",
-                    brand_voice=product.brand_voice,
-                    user_message=text,
-                )
+                response = await ai_task
                 response_source = "AI-generated"
 
-            # Log the response
+            # Log the response; committed in one batch by the caller
             await log_activity(
                 session,
                 action=f"Auto-responded to {platform} mention",
                 product_id=product.id,
                 platform=platform,
                 details=f"Query: {text[:50]}... | Response: {response[:50]}... | Source: {response_source}",
+                commit=False,
             )
 
-            logger.info(f"Generated response for {platform}: {response[:50]}...")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Generated response for %s: %s...", platform, response[:50])
 
             # Note: Actual posting would require implementing reply functionality
             # For now, we just log it
@@ -134,20 +284,76 @@ class AutoResponder:
             return response
 
         except Exception as e:
-            logger.error(f"Error processing mention: {e}")
+            logger.error("Error processing mention: %s", e)
             return None
 
-    def _keyword_match(self, text: str, keywords: str) -> bool:
-        """Check if text contains any keyword."""
-        if not keywords:
-            return False
-        
-        text_lower = text.lower()
-        for keyword in keywords.split(","):
-            keyword = keyword.strip().lower()
-            if keyword and keyword in text_lower:
-                return True
-        return False
+    @staticmethod
+    def _exact_cache_key(product_id: int, brand_voice: str, text: str) -> str:
+        raw = f"{product_id}\x00{brand_voice}\x00{text.strip().lower()}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _exact_cache_get(self, key: str) -> Optional[str]:
+        entry = self._exact_cache.get(key)
+        if entry is None:
+            return None
+        response, stored_at = entry
+        if time.time() - stored_at > _EXACT_CACHE_TTL_SECONDS:
+            del self._exact_cache[key]
+            return None
+        self._exact_cache.move_to_end(key)
+        return response
+
+    def _exact_cache_put(self, key: str, response: str):
+        self._exact_cache[key] = (response, time.time())
+        self._exact_cache.move_to_end(key)
+        while len(self._exact_cache) > _EXACT_CACHE_MAX_ENTRIES:
+            self._exact_cache.popitem(last=False)
+
+    async def _generate_ai_response(self, product, text: str) -> str:
+        """Generate an AI response, reusing cached answers for repeat intents."""
+        exact_key = self._exact_cache_key(product.id, product.brand_voice, text)
+        cached = self._exact_cache_get(exact_key)
+        if cached is None:
+            cached = self._semantic_cache.get(product.id, product.brand_voice, text)
+        if cached is not None:
+            self._cache_stats["hits"] += 1
+            logger.debug("Response cache hit for product %s", product.id)
+            return cached
+        self._cache_stats["misses"] += 1
+
+        response = await self.ai_engine.generate_response(
+            product_name=product.name,
+            product_description=product.description or "",
+            brand_voice=product.brand_voice,
+            user_message=text,
+        )
+        self._exact_cache_put(exact_key, response)
+        self._semantic_cache.put(product.id, product.brand_voice, text, response)
+        return response
+
+    def _match_faq(self, product_id: int, faqs, faq_terms: tuple, text_lower: str):
+        """Match a mention against all FAQ terms in one automaton scan."""
+        if not faqs:
+            return None
+
+        cached = self._faq_automaton_cache.get(product_id)
+        if cached is not None and cached[0] == faq_terms:
+            _, owners, automaton = cached
+        else:
+            patterns = []
+            owners = []
+            for index, terms in enumerate(faq_terms):
+                for term in terms:
+                    patterns.append(term)
+                    owners.append(index)
+            automaton = KeywordAutomaton(patterns)
+            self._faq_automaton_cache[product_id] = (faq_terms, owners, automaton)
+
+        matches = automaton.find_distinct(text_lower)
+        if not matches:
+            return None
+        # Preserve the old first-FAQ-wins ordering
+        return faqs[min(owners[i] for i in matches)]
 
     async def respond_to_comment(
         self,
@@ -162,53 +368,42 @@ class AutoResponder:
         db = get_db()
         async with db.async_session_maker() as session:
             # Get product info
-            products = await get_products(session)
-            product = next((p for p in products if p.id == product_id), None)
-            
+            product = await self._get_product_cached(session, product_id)
+
             if not product:
                 return None
 
             # Get FAQs
-            faqs = await get_faqs(session, product_id)
+            faqs, faq_terms = await self._get_faqs_cached(session, product_id)
 
             # Try FAQ match first
-            matched_faq = None
-            for faq in faqs:
-                if self._keyword_match(comment, faq.question) or self._keyword_match(comment, faq.keywords or ""):
-                    matched_faq = faq
-                    break
+            matched_faq = self._match_faq(product_id, faqs, faq_terms, comment.lower())
 
             if matched_faq:
                 response = matched_faq.answer
             else:
                 # Use AI
-                response = await self.ai_engine.generate_response(
-                    product_name=product.name,
-                    product_description=product.description or "",
-                    brand_voice=product.brand_voice,
-                    user_message=comment,
-                )
+                response = await self._generate_ai_response(product, comment)
 
             # Post the response
             try:
-                registry = get_platform_registry()
-                adapter = registry.get_adapter(platform, username, password)
-                await adapter.login()
-                
+                adapter = await self._get_logged_in_adapter(platform, username, password)
+
                 await adapter.comment(post_id, response)
-                
-                await log_activity(
-                    session,
+
+                # Logged in the background so the caller gets the
+                # response without waiting on the commits.
+                self._log_in_background(
                     action=f"Replied to comment on {platform}",
                     product_id=product_id,
                     platform=platform,
                     details=f"Comment: {comment[:50]}... | Response: {response[:50]}...",
                 )
-                
+
                 return response
                 
             except Exception as e:
-                logger.error(f"Error posting response: {e}")
+                logger.error("Error posting response: %s", e)
                 return None
 
 
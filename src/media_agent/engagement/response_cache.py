@@ -0,0 +1,116 @@
+"""Semantic cache for AI-generated engagement responses."""
+
+import math
+import time
+from collections import Counter, OrderedDict
+from typing import Optional
+
+# Cache bounds
+_CACHE_MAX_ENTRIES = 512
+_CACHE_TTL_SECONDS = 3600.0
+
+
+def _vectorize(text: str) -> dict[str, float]:
+    """Build a unit-length term-frequency vector for one message."""
+    tokens = text.lower().split()
+    if not tokens:
+        return {}
+    counts = Counter(tokens)
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return {term: count / norm for term, count in counts.items()}
+
+
+def _cosine(a: dict[str, float], b: dict[str, float]) -> float:
+    """Dot product of two unit vectors (their cosine similarity)."""
+    if len(b) < len(a):
+        a, b = b, a
+    return sum(weight * b[term] for term, weight in a.items() if term in b)
+
+
+class SemanticResponseCache:
+    """Reuse stored responses for paraphrased repeats of the same question.
+
+    Lookups compare a term-frequency vector of the incoming message against
+    cached messages for the same product and brand voice; a hit above the
+    similarity threshold returns the stored answer without an LLM call.
+    An inverted token index keeps lookups proportional to the number of
+    entries sharing at least one token with the query, not the cache size.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.9,
+        max_entries: int = _CACHE_MAX_ENTRIES,
+        ttl_seconds: float = _CACHE_TTL_SECONDS,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (scope, vector, response, stored_at); ordered for LRU eviction
+        self._entries: OrderedDict[int, tuple[tuple, dict, str, float]] = OrderedDict()
+        # (scope, token) -> keys of entries containing that token
+        self._token_index: dict[tuple, set[int]] = {}
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    def _remove(self, key: int):
+        scope, vector, _, _ = self._entries.pop(key)
+        for term in vector:
+            bucket = self._token_index.get((scope, term))
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._token_index[(scope, term)]
+
+    def get(self, product_id: int, brand_voice: str, text: str) -> Optional[str]:
+        """Return a cached response for a similar enough message, if any."""
+        scope = (product_id, brand_voice)
+        vector = _vectorize(text)
+        if not vector:
+            self.misses += 1
+            return None
+
+        # Only entries sharing a token can have nonzero similarity.
+        candidates: set[int] = set()
+        for term in vector:
+            candidates |= self._token_index.get((scope, term), set())
+
+        now = time.time()
+        best_key = None
+        best_score = 0.0
+        expired = []
+        for key in candidates:
+            entry_scope, entry_vector, response, stored_at = self._entries[key]
+            if now - stored_at > self.ttl_seconds:
+                expired.append(key)
+                continue
+            score = _cosine(vector, entry_vector)
+            if score > best_score:
+                best_score = score
+                best_key = key
+
+        for key in expired:
+            self._remove(key)
+
+        if best_key is not None and best_score >= self.similarity_threshold:
+            self._entries.move_to_end(best_key)
+            self.hits += 1
+            return self._entries[best_key][2]
+
+        self.misses += 1
+        return None
+
+    def put(self, product_id: int, brand_voice: str, text: str, response: str):
+        """Store a generated response for later similarity lookups."""
+        scope = (product_id, brand_voice)
+        vector = _vectorize(text)
+        if not vector:
+            return
+        key = self._next_id
+        self._next_id += 1
+        self._entries[key] = (scope, vector, response, time.time())
+        for term in vector:
+            self._token_index.setdefault((scope, term), set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
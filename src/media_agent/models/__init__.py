@@ -1,9 +1,11 @@
 """Models module."""
 
-from .models import Base, Product, Post, FAQ, Lead, PlatformCredential, ActivityLog, Analytics, PostTemplate, Campaign, EngagementQueue
+from .models import Base, Product, Post, FAQ, Lead, PlatformCredential, ActivityLog, Analytics, PostTemplate, Campaign, EngagementQueue, split_csv, join_csv
 
 __all__ = [
     "Base",
+    "split_csv",
+    "join_csv",
     "Product",
     "Post",
     "FAQ",
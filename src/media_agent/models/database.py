@@ -1,12 +1,14 @@
 """Database connection and operations."""
 
+import asyncio
 from typing import AsyncGenerator, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy import select, func, Integer
+from sqlalchemy.orm import selectinload
+from sqlalchemy import delete, event, insert, lambda_stmt, select, update, func, case, literal
 
 from ..config import get_settings
-from ..models import Base, Product, Post, FAQ, Lead, PlatformCredential, ActivityLog, Analytics
+from ..models import Base, Product, Post, FAQ, Lead, PlatformCredential, ActivityLog, Analytics, join_csv
 
 
 class Database:
@@ -14,21 +16,66 @@ class Database:
 
     def __init__(self):
         settings = get_settings()
-        self.engine = create_async_engine(
-            settings.database_url,
-            echo=settings.debug,
-        )
+        # Larger compiled-statement cache: the engagement/scheduler loops
+        # reissue the same statement shapes constantly
+        engine_kwargs = {"echo": settings.debug, "query_cache_size": 1200}
+        if not settings.database_url.startswith("sqlite"):
+            # Server databases: keep a warm pool so each session reuses an
+            # open connection instead of paying a fresh handshake, and
+            # recycle/ping so stale connections never reach callers
+            engine_kwargs.update(
+                pool_size=20,
+                max_overflow=10,
+                pool_pre_ping=True,
+                pool_recycle=1800,
+            )
+        self.engine = create_async_engine(settings.database_url, **engine_kwargs)
+        if settings.database_url.startswith("sqlite"):
+            self._tune_sqlite(self.engine)
         self.async_session_maker = async_sessionmaker(
             self.engine,
             class_=AsyncSession,
             expire_on_commit=False,
         )
 
+    @staticmethod
+    def _tune_sqlite(engine):
+        """Apply SQLite PRAGMAs on every new connection.
+
+        WAL lets readers proceed concurrently with writers and NORMAL
+        synchronous drops the per-commit fsync; the remaining PRAGMAs
+        give SQLite a larger page cache and in-memory temp storage.
+        """
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.execute("PRAGMA cache_size=-65536")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.close()
+
     async def init_db(self):
         """Initialize database tables."""
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
+    async def warm_pool(self, connections: int = 5):
+        """Open and release a few connections at startup.
+
+        The first user action then reuses an already-connected socket
+        instead of paying the connect handshake (TCP+TLS+auth on server
+        databases) on the interactive path.
+        """
+        conns = await asyncio.gather(
+            *(self.engine.connect() for _ in range(connections))
+        )
+        try:
+            await asyncio.gather(*(c.execute(select(1)) for c in conns))
+        finally:
+            await asyncio.gather(*(c.close() for c in conns))
+
     async def get_session(self) -> AsyncGenerator[AsyncSession, None]:
         """Get database session."""
         async with self.async_session_maker() as session:
@@ -64,18 +111,32 @@ async def create_product(
         name=name,
         description=description,
         brand_voice=brand_voice,
-        target_audience=target_audience,
+        target_audience=join_csv(target_audience),
     )
     session.add(product)
     await session.commit()
-    await session.refresh(product)
     return product
 
 
-async def get_products(session: AsyncSession) -> list[Product]:
-    """Get all products."""
-    result = await session.execute(select(Product).order_by(Product.created_at.desc()))
-    return list(result.scalars().all())
+async def get_products(
+    session: AsyncSession,
+    include_related: bool = False,
+) -> list[Product]:
+    """Get all products.
+
+    With include_related=True the posts/faqs/leads collections are
+    loaded up front with selectin queries (four queries total) instead
+    of one lazy SELECT per product touched.
+    """
+    query = select(Product).order_by(Product.created_at.desc())
+    if include_related:
+        query = query.options(
+            selectinload(Product.posts),
+            selectinload(Product.faqs),
+            selectinload(Product.leads),
+        )
+    result = await session.execute(query)
+    return result.scalars().all()
 
 
 async def get_product(session: AsyncSession, product_id: int) -> Optional[Product]:
@@ -86,22 +147,60 @@ async def get_product(session: AsyncSession, product_id: int) -> Optional[Produc
     return result.scalar_one_or_none()
 
 
+async def get_product_with_context(
+    session: AsyncSession,
+    product_id: int,
+) -> Optional[Product]:
+    """Get a product with its posts and FAQs loaded up front.
+
+    Dialog flows read these collections after the session closes; two
+    selectin queries here beat a lazy-load round-trip (or a
+    MissingGreenlet on a detached instance) per collection touched.
+    """
+    result = await session.execute(
+        select(Product)
+        .options(selectinload(Product.posts), selectinload(Product.faqs))
+        .where(Product.id == product_id)
+    )
+    return result.scalar_one_or_none()
+
+
 async def update_product(
     session: AsyncSession,
     product_id: int,
     **kwargs,
 ) -> Optional[Product]:
     """Update a product."""
-    product = await get_product(session, product_id)
+    product = await session.get(Product, product_id)
     if product:
         for key, value in kwargs.items():
             if hasattr(product, key):
                 setattr(product, key, value)
         await session.commit()
-        await session.refresh(product)
     return product
 
 
+async def update_product_fields(
+    session: AsyncSession,
+    product_id: int,
+    commit: bool = True,
+    **changes,
+) -> None:
+    """Update specific product columns with a Core UPDATE.
+
+    Skips the instance SELECT that update_product pays and writes only
+    the columns passed; callers diff against what they already have and
+    send just the changed fields.
+    """
+    if not changes:
+        return
+    await session.execute(
+        update(Product).where(Product.id == product_id).values(**changes)
+    )
+    if commit:
+        await session.commit()
+
+
 async def delete_product(session: AsyncSession, product_id: int) -> bool:
     """Delete a product."""
     product = await get_product(session, product_id)
@@ -131,39 +230,92 @@ async def create_post(
     )
     session.add(post)
     await session.commit()
-    await session.refresh(post)
     return post
 
 
+async def get_post(session: AsyncSession, post_id: int) -> Optional[Post]:
+    """Get a single post by id.
+
+    session.get checks the identity map first and otherwise issues one
+    primary-key SELECT.
+    """
+    return await session.get(Post, post_id)
+
+
+async def get_due_posts(
+    session: AsyncSession,
+    now,
+    limit: int = 100,
+) -> list[Post]:
+    """Get scheduled posts whose time has come, oldest first.
+
+    Filters in SQL so the (status, scheduled_at) index serves the scan —
+    O(due) rows instead of loading every scheduled post for a Python
+    comparison. The limit bounds a backlog burst after downtime.
+    """
+    stmt = lambda_stmt(
+        lambda: select(Post)
+        .where(Post.status == "scheduled", Post.scheduled_at <= now)
+        .order_by(Post.scheduled_at)
+        .limit(limit)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
 async def get_posts(
     session: AsyncSession,
     product_id: Optional[int] = None,
     status: Optional[str] = None,
+    scheduled_after: Optional = None,
+    order_by: str = "scheduled_at_desc",
+    limit: Optional[int] = None,
+    load_product: bool = False,
 ) -> list[Post]:
-    """Get posts with optional filters."""
-    query = select(Post).order_by(Post.scheduled_at.desc())
+    """Get posts with optional filters.
+
+    Ordering and row limits are applied in SQL so callers that only need
+    the next few posts (e.g. an "upcoming" list) transfer those rows
+    instead of the whole table and a Python sort. load_product eagerly
+    fetches each post's product in one batched IN query, avoiding a
+    lazy-load round-trip per post when the caller reads product fields.
+    """
+    if order_by == "scheduled_at":
+        query = select(Post).order_by(Post.scheduled_at)
+    else:
+        query = select(Post).order_by(Post.scheduled_at.desc())
+    if load_product:
+        query = query.options(selectinload(Post.product))
     if product_id:
         query = query.where(Post.product_id == product_id)
     if status:
         query = query.where(Post.status == status)
+    if scheduled_after is not None:
+        query = query.where(Post.scheduled_at >= scheduled_after)
+    if limit is not None:
+        query = query.limit(limit)
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def update_post(
     session: AsyncSession,
     post_id: int,
+    commit: bool = True,
     **kwargs,
 ) -> Optional[Post]:
-    """Update a post."""
-    result = await session.execute(select(Post).where(Post.id == post_id))
-    post = result.scalar_one_or_none()
+    """Update a post.
+
+    Pass commit=False to leave transaction control with the caller,
+    e.g. when batching several post updates under one commit.
+    """
+    post = await session.get(Post, post_id)
     if post:
         for key, value in kwargs.items():
             if hasattr(post, key):
                 setattr(post, key, value)
-        await session.commit()
-        await session.refresh(post)
+        if commit:
+            await session.commit()
     return post
 
 
@@ -191,20 +343,116 @@ async def create_faq(
         product_id=product_id,
         question=question,
         answer=answer,
-        keywords=keywords,
+        keywords=join_csv(keywords),
     )
     session.add(faq)
     await session.commit()
-    await session.refresh(faq)
     return faq
 
 
+async def create_faqs_bulk(
+    session: AsyncSession,
+    product_id: int,
+    faqs: list[dict],
+    commit: bool = True,
+) -> list[FAQ]:
+    """Create many FAQs in one executemany INSERT.
+
+    Seeding a product from config can ship dozens of FAQs; add_all with a
+    single flush collapses the N commit round-trips of per-row create_faq
+    calls into one.
+    """
+    rows = [
+        FAQ(
+            product_id=product_id,
+            question=f.get("question", ""),
+            answer=f.get("answer", ""),
+            keywords=join_csv(f.get("keywords", "")),
+        )
+        for f in faqs
+    ]
+    session.add_all(rows)
+    await session.flush()
+    if commit:
+        await session.commit()
+    return rows
+
+
 async def get_faqs(session: AsyncSession, product_id: int) -> list[FAQ]:
     """Get FAQs for a product."""
-    result = await session.execute(
-        select(FAQ).where(FAQ.product_id == product_id).order_by(FAQ.created_at.desc())
+    # lambda_stmt caches the compiled form; only the bind changes between
+    # calls, and this runs once per inbound mention
+    stmt = lambda_stmt(
+        lambda: select(FAQ)
+        .where(FAQ.product_id == product_id)
+        .order_by(FAQ.created_at.desc())
     )
-    return list(result.scalars().all())
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
+async def count_posts(
+    session: AsyncSession,
+    status: Optional[str] = None,
+    product_id: Optional[int] = None,
+) -> int:
+    """Count posts in SQL instead of materializing rows to len() them."""
+    query = select(func.count()).select_from(Post)
+    if status:
+        query = query.where(Post.status == status)
+    if product_id:
+        query = query.where(Post.product_id == product_id)
+    result = await session.execute(query)
+    return result.scalar_one()
+
+
+async def count_leads(
+    session: AsyncSession,
+    product_id: Optional[int] = None,
+) -> int:
+    """Count leads in SQL instead of materializing rows to len() them."""
+    query = select(func.count()).select_from(Lead)
+    if product_id:
+        query = query.where(Lead.product_id == product_id)
+    result = await session.execute(query)
+    return result.scalar_one()
+
+
+async def get_dashboard_counts(session: AsyncSession) -> dict[int, dict[str, int]]:
+    """Per-product dashboard counters in three grouped queries.
+
+    Replaces the three-queries-per-product pattern the dashboard cards
+    used: post counts by status, lead counts and FAQ counts each come
+    back in one GROUP BY round-trip regardless of product count.
+    """
+    counts: dict[int, dict[str, int]] = {}
+
+    def bucket(product_id: int) -> dict[str, int]:
+        return counts.setdefault(
+            product_id, {"published": 0, "scheduled": 0, "leads": 0, "faqs": 0}
+        )
+
+    posts = await session.execute(
+        select(Post.product_id, Post.status, func.count(Post.id))
+        .group_by(Post.product_id, Post.status)
+    )
+    for product_id, status, n in posts:
+        if status in ("published", "scheduled"):
+            bucket(product_id)[status] = n
+
+    leads = await session.execute(
+        select(Lead.product_id, func.count(Lead.id)).group_by(Lead.product_id)
+    )
+    for product_id, n in leads:
+        bucket(product_id)["leads"] = n
+
+    faqs = await session.execute(
+        select(FAQ.product_id, func.count(FAQ.id)).group_by(FAQ.product_id)
+    )
+    for product_id, n in faqs:
+        bucket(product_id)["faqs"] = n
+
+    return counts
 
 
 async def delete_faq(session: AsyncSession, faq_id: int) -> bool:
@@ -231,6 +479,9 @@ async def create_lead(
     tags: str = "",
 ) -> Lead:
     """Create a new lead."""
+    # Copy the small product fields onto the lead so scoring and ranking
+    # scans never need the join back to products.
+    product = await session.get(Product, product_id)
     lead = Lead(
         product_id=product_id,
         platform=platform,
@@ -239,11 +490,12 @@ async def create_lead(
         bio=bio,
         followers=followers,
         relevance_score=relevance_score,
-        tags=tags,
+        tags=join_csv(tags),
+        brand_voice_cache=product.brand_voice if product else None,
+        target_audience_cache=product.target_audience if product else None,
     )
     session.add(lead)
     await session.commit()
-    await session.refresh(lead)
     return lead
 
 
@@ -259,7 +511,30 @@ async def get_leads(
     if status:
         query = query.where(Lead.status == status)
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
+
+
+async def get_leads_by_tag(
+    session: AsyncSession,
+    tag: str,
+    product_id: Optional[int] = None,
+) -> list[Lead]:
+    """Get leads carrying an exact tag.
+
+    Tags are stored normalized (lowercase, no padding) by join_csv, so
+    wrapping both sides in commas matches whole terms only — 'ai' never
+    matches 'air'. Naive LIKE '%tag%' would.
+    """
+    needle = f"%,{tag.strip().lower()},%"
+    query = (
+        select(Lead)
+        .where((literal(",") + Lead.tags + literal(",")).like(needle))
+        .order_by(Lead.relevance_score.desc())
+    )
+    if product_id:
+        query = query.where(Lead.product_id == product_id)
+    result = await session.execute(query)
+    return result.scalars().all()
 
 
 async def update_lead(
@@ -268,14 +543,12 @@ async def update_lead(
     **kwargs,
 ) -> Optional[Lead]:
     """Update a lead."""
-    result = await session.execute(select(Lead).where(Lead.id == lead_id))
-    lead = result.scalar_one_or_none()
+    lead = await session.get(Lead, lead_id)
     if lead:
         for key, value in kwargs.items():
             if hasattr(lead, key):
                 setattr(lead, key, value)
         await session.commit()
-        await session.refresh(lead)
     return lead
 
 
@@ -286,8 +559,13 @@ async def log_activity(
     product_id: Optional[int] = None,
     platform: Optional[str] = None,
     details: str = "",
+    commit: bool = True,
 ) -> ActivityLog:
-    """Log an activity."""
+    """Log an activity.
+
+    Pass commit=False when logging inside a burst so callers can batch
+    many log rows into a single commit instead of one fsync per row.
+    """
     log = ActivityLog(
         product_id=product_id,
         action=action,
@@ -295,22 +573,89 @@ async def log_activity(
         details=details,
     )
     session.add(log)
-    await session.commit()
-    await session.refresh(log)
+    if commit:
+        await session.commit()
     return log
 
 
+async def log_activities(
+    session: AsyncSession,
+    records: list[dict],
+    commit: bool = True,
+) -> int:
+    """Insert a batch of activity log rows in one statement.
+
+    Bypasses per-object ORM instrumentation with an executemany INSERT,
+    so burst writers (scrape and engagement loops) pay one round trip
+    for the whole batch. Each record is a dict of ActivityLog column
+    values, e.g. {"action": ..., "product_id": ..., "platform": ...,
+    "details": ...}.
+    """
+    if not records:
+        return 0
+    await session.execute(insert(ActivityLog), records)
+    if commit:
+        await session.commit()
+    return len(records)
+
+
+async def prune_activity_logs(
+    session: AsyncSession,
+    retention_days: int = 90,
+) -> int:
+    """Delete activity log rows older than the retention window.
+
+    Keeps the append-only table bounded so recent-window queries stay
+    O(recent); the timestamp index makes the cutoff scan cheap. Returns
+    the number of rows removed. (Postgres range partitioning with
+    detachable monthly partitions would do this for free, but SQLite has
+    no partitioning — pruning is the portable equivalent.)
+    """
+    from datetime import datetime, timedelta
+
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    result = await session.execute(
+        delete(ActivityLog).where(ActivityLog.timestamp < cutoff)
+    )
+    await session.commit()
+    return result.rowcount
+
+
+async def prune_engagement_queue(
+    session: AsyncSession,
+    retention_days: int = 90,
+) -> int:
+    """Delete handled engagement queue rows older than the retention window.
+
+    Pending rows are never pruned regardless of age.
+    """
+    from datetime import datetime, timedelta
+
+    from .models import EngagementQueue
+
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    result = await session.execute(
+        delete(EngagementQueue).where(
+            EngagementQueue.status != "pending",
+            EngagementQueue.created_at < cutoff,
+        )
+    )
+    await session.commit()
+    return result.rowcount
+
+
 async def get_recent_activities(
     session: AsyncSession,
     limit: int = 20,
 ) -> list[ActivityLog]:
     """Get recent activities."""
-    result = await session.execute(
-        select(ActivityLog)
+    stmt = lambda_stmt(
+        lambda: select(ActivityLog)
         .order_by(ActivityLog.timestamp.desc())
         .limit(limit)
     )
-    return list(result.scalars().all())
+    result = await session.execute(stmt)
+    return result.scalars().all()
 
 
 # Analytics operations
@@ -320,49 +665,43 @@ async def get_analytics_summary(
     days: int = 30,
 ) -> dict:
     """Get analytics summary for the specified period."""
-    
-    # Get posts stats
-    posts_query = select(
-        func.count(Post.id).label('total'),
-        func.sum(func.cast(Post.status == 'published', Integer)).label('published'),
-        func.sum(func.cast(Post.status == 'scheduled', Integer)).label('scheduled'),
-        func.sum(func.cast(Post.status == 'failed', Integer)).label('failed'),
-    )
-    if product_id:
-        posts_query = posts_query.where(Post.product_id == product_id)
-    
-    posts_result = await session.execute(posts_query)
-    posts_stats = posts_result.one()
-    
-    # Get leads stats
-    leads_query = select(
-        func.count(Lead.id).label('total'),
-        func.sum(func.cast(Lead.status == 'engaged', Integer)).label('engaged'),
-        func.sum(func.cast(Lead.status == 'converted', Integer)).label('converted'),
+
+    # All aggregates as scalar subqueries of one SELECT: a single round
+    # trip to the database instead of three.
+    def _agg(expr, model):
+        query = select(expr)
+        if product_id:
+            query = query.where(model.product_id == product_id)
+        return query.scalar_subquery()
+
+    # CASE-based conditional counts avoid the per-row CAST that
+    # SUM(CAST(cond AS INTEGER)) pays.
+    def _count_where(condition):
+        return func.sum(case((condition, 1), else_=0))
+
+    summary_query = select(
+        _agg(func.count(Post.id), Post).label('posts_total'),
+        _agg(_count_where(Post.status == 'published'), Post).label('posts_published'),
+        _agg(_count_where(Post.status == 'scheduled'), Post).label('posts_scheduled'),
+        _agg(_count_where(Post.status == 'failed'), Post).label('posts_failed'),
+        _agg(func.count(Lead.id), Lead).label('leads_total'),
+        _agg(_count_where(Lead.status == 'engaged'), Lead).label('leads_engaged'),
+        _agg(_count_where(Lead.status == 'converted'), Lead).label('leads_converted'),
+        _agg(func.count(ActivityLog.id), ActivityLog).label('activities_total'),
     )
-    if product_id:
-        leads_query = leads_query.where(Lead.product_id == product_id)
-    
-    leads_result = await session.execute(leads_query)
-    leads_stats = leads_result.one()
-    
-    # Get activities count
-    activities_query = select(func.count(ActivityLog.id))
-    if product_id:
-        activities_query = activities_query.where(ActivityLog.product_id == product_id)
-    
-    activities_result = await session.execute(activities_query)
-    activities_count = activities_result.scalar()
-    
+
+    result = await session.execute(summary_query)
+    stats = result.one()
+
     return {
-        "posts_total": posts_stats.total or 0,
-        "posts_published": posts_stats.published or 0,
-        "posts_scheduled": posts_stats.scheduled or 0,
-        "posts_failed": posts_stats.failed or 0,
-        "leads_total": leads_stats.total or 0,
-        "leads_engaged": leads_stats.engaged or 0,
-        "leads_converted": leads_stats.converted or 0,
-        "activities_total": activities_count or 0,
+        "posts_total": stats.posts_total or 0,
+        "posts_published": stats.posts_published or 0,
+        "posts_scheduled": stats.posts_scheduled or 0,
+        "posts_failed": stats.posts_failed or 0,
+        "leads_total": stats.leads_total or 0,
+        "leads_engaged": stats.leads_engaged or 0,
+        "leads_converted": stats.leads_converted or 0,
+        "activities_total": stats.activities_total or 0,
     }
 
 
@@ -372,38 +711,35 @@ async def get_analytics_by_platform(
 ) -> dict:
     """Get analytics grouped by platform."""
     
-    # Posts by platform
+    # Both GROUP BYs in one UNION ALL round trip, with a discriminator
+    # column telling the rows apart.
     posts_query = select(
+        literal('post').label('kind'),
         Post.platform,
         func.count(Post.id).label('count'),
     ).where(Post.status == 'published')
-    
-    if product_id:
-        posts_query = posts_query.where(Post.product_id == product_id)
-    
-    posts_query = posts_query.group_by(Post.platform)
-    posts_result = await session.execute(posts_query)
-    
-    posts_by_platform = {}
-    for row in posts_result:
-        posts_by_platform[row.platform] = row.count
-    
-    # Leads by platform
+
     leads_query = select(
+        literal('lead').label('kind'),
         Lead.platform,
         func.count(Lead.id).label('count'),
     )
-    
+
     if product_id:
+        posts_query = posts_query.where(Post.product_id == product_id)
         leads_query = leads_query.where(Lead.product_id == product_id)
-    
-    leads_query = leads_query.group_by(Lead.platform)
-    leads_result = await session.execute(leads_query)
-    
+
+    combined_query = posts_query.group_by(Post.platform).union_all(
+        leads_query.group_by(Lead.platform)
+    )
+    result = await session.execute(combined_query)
+
+    posts_by_platform = {}
     leads_by_platform = {}
-    for row in leads_result:
-        leads_by_platform[row.platform] = row.count
-    
+    for row in result:
+        target = posts_by_platform if row.kind == 'post' else leads_by_platform
+        target[row.platform] = row.count
+
     return {
         "posts_by_platform": posts_by_platform,
         "leads_by_platform": leads_by_platform,
@@ -433,10 +769,97 @@ async def record_analytics(
     )
     session.add(analytics)
     await session.commit()
-    await session.refresh(analytics)
     return analytics
 
 
+async def increment_analytics(
+    session: AsyncSession,
+    product_id: int,
+    platform: str,
+    commit: bool = True,
+    **counters: int,
+) -> None:
+    """Bump daily analytics counters in place.
+
+    Write events keep one row per (product_id, platform, day) current
+    instead of dashboards re-aggregating unchanged history on every read.
+    """
+    from datetime import datetime
+
+    day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+    values = {name: getattr(Analytics, name) + amount for name, amount in counters.items()}
+
+    result = await session.execute(
+        update(Analytics)
+        .where(
+            Analytics.product_id == product_id,
+            Analytics.platform == platform,
+            Analytics.date >= day_start,
+        )
+        .values(**values)
+    )
+    if result.rowcount == 0:
+        session.add(Analytics(product_id=product_id, platform=platform, **counters))
+    if commit:
+        await session.commit()
+
+
+async def refresh_daily_analytics(session: AsyncSession) -> int:
+    """Rebuild today's Analytics rows from the base tables.
+
+    The materialized-view equivalent for SQLite: recompute the per-day
+    aggregates in one pass on a schedule so drifted or missed counter
+    bumps are corrected, while dashboards keep reading the small
+    Analytics table instead of scanning posts/leads.
+    """
+    from datetime import datetime
+
+    day_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
+
+    posts_result = await session.execute(
+        select(
+            Post.product_id,
+            Post.platform,
+            func.sum(case((Post.status == 'scheduled', 1), else_=0)).label('scheduled'),
+            func.sum(case((Post.status == 'published', 1), else_=0)).label('published'),
+            func.sum(case((Post.status == 'failed', 1), else_=0)).label('failed'),
+        )
+        .where(Post.created_at >= day_start)
+        .group_by(Post.product_id, Post.platform)
+    )
+    leads_result = await session.execute(
+        select(Lead.product_id, Lead.platform, func.count(Lead.id).label('discovered'))
+        .where(Lead.created_at >= day_start)
+        .group_by(Lead.product_id, Lead.platform)
+    )
+
+    rollup: dict[tuple, dict] = {}
+    for row in posts_result:
+        rollup[(row.product_id, row.platform)] = {
+            "posts_scheduled": row.scheduled,
+            "posts_published": row.published,
+            "posts_failed": row.failed,
+        }
+    for row in leads_result:
+        rollup.setdefault((row.product_id, row.platform), {})["leads_discovered"] = row.discovered
+
+    for (product_id, platform), counters in rollup.items():
+        result = await session.execute(
+            update(Analytics)
+            .where(
+                Analytics.product_id == product_id,
+                Analytics.platform == platform,
+                Analytics.date >= day_start,
+            )
+            .values(**counters)
+        )
+        if result.rowcount == 0:
+            session.add(Analytics(product_id=product_id, platform=platform, **counters))
+
+    await session.commit()
+    return len(rollup)
+
+
 # Post Templates
 async def create_template(
     session: AsyncSession,
@@ -456,7 +879,6 @@ async def create_template(
     )
     session.add(template)
     await session.commit()
-    await session.refresh(template)
     return template
 
 
@@ -467,7 +889,7 @@ async def get_templates(session: AsyncSession, product_id: int = None):
     if product_id:
         query = query.where(PostTemplate.product_id == product_id)
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def delete_template(session: AsyncSession, template_id: int):
@@ -501,7 +923,6 @@ async def create_campaign(
     )
     session.add(campaign)
     await session.commit()
-    await session.refresh(campaign)
     return campaign
 
 
@@ -512,20 +933,17 @@ async def get_campaigns(session: AsyncSession, product_id: int = None):
     if product_id:
         query = query.where(Campaign.product_id == product_id)
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def update_campaign(session: AsyncSession, campaign_id: int, **kwargs):
-    from sqlalchemy import select
     from .models import Campaign
-    result = await session.execute(select(Campaign).where(Campaign.id == campaign_id))
-    campaign = result.scalar_one_or_none()
+    campaign = await session.get(Campaign, campaign_id)
     if campaign:
         for key, value in kwargs.items():
             if hasattr(campaign, key):
                 setattr(campaign, key, value)
         await session.commit()
-        await session.refresh(campaign)
     return campaign
 
 
@@ -542,6 +960,56 @@ async def delete_campaign(session: AsyncSession, campaign_id: int):
 
 
 # Engagement Queue
+
+# In-process stand-in for Postgres LISTEN/NOTIFY: enqueues set the event
+# so workers can block on it instead of polling the table. Created
+# lazily so importing this module never requires a running event loop.
+_engagement_event: Optional[asyncio.Event] = None
+
+
+def _get_engagement_event() -> asyncio.Event:
+    global _engagement_event
+    if _engagement_event is None:
+        _engagement_event = asyncio.Event()
+    return _engagement_event
+
+
+async def wait_for_engagement_items(timeout: Optional[float] = None) -> bool:
+    """Block until new engagement work is enqueued.
+
+    Returns True when woken by an enqueue, False on timeout. Workers
+    loop on this instead of issuing a polling SELECT per interval;
+    latency from enqueue to wake-up drops from the poll interval to the
+    next event-loop tick.
+    """
+    event = _get_engagement_event()
+    try:
+        await asyncio.wait_for(event.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    event.clear()
+    return True
+
+
+async def get_pending_engagement_items(session: AsyncSession, limit: int = 32):
+    """Claim the oldest pending engagement queue rows.
+
+    Uses FOR UPDATE SKIP LOCKED on databases that support it so
+    concurrent workers never contend for the same rows; SQLite ignores
+    the locking clause and single-worker semantics apply.
+    """
+    from .models import EngagementQueue
+    stmt = lambda_stmt(
+        lambda: select(EngagementQueue)
+        .where(EngagementQueue.status == "pending")
+        .order_by(EngagementQueue.created_at)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await session.execute(stmt)
+    return result.scalars().all()
+
+
 async def add_to_engagement_queue(
     session: AsyncSession,
     product_id: int,
@@ -560,20 +1028,48 @@ async def add_to_engagement_queue(
     )
     session.add(item)
     await session.commit()
-    await session.refresh(item)
+    _get_engagement_event().set()
     return item
 
 
-async def get_engagement_queue(session: AsyncSession, product_id: int = None, status: str = None):
+async def add_engagement_items(
+    session: AsyncSession,
+    items: list[dict],
+    commit: bool = True,
+) -> int:
+    """Insert a batch of engagement queue rows in one statement.
+
+    Counterpart of log_activities for the inbound mention path: one
+    executemany INSERT instead of an add/commit per mention.
+    """
+    if not items:
+        return 0
+    from .models import EngagementQueue
+    await session.execute(insert(EngagementQueue), items)
+    if commit:
+        await session.commit()
+    _get_engagement_event().set()
+    return len(items)
+
+
+async def get_engagement_queue(
+    session: AsyncSession,
+    product_id: int = None,
+    status: str = None,
+    load_product: bool = False,
+):
     from sqlalchemy import select
     from .models import EngagementQueue
     query = select(EngagementQueue).order_by(EngagementQueue.created_at.desc())
+    if load_product:
+        # One batched IN query instead of a lazy load per queue item
+        query = query.options(selectinload(EngagementQueue.product))
     if product_id:
         query = query.where(EngagementQueue.product_id == product_id)
     if status:
         query = query.where(EngagementQueue.status == status)
     result = await session.execute(query)
-    return list(result.scalars().all())
+    return result.scalars().all()
 
 
 async def update_engagement_item(
@@ -583,11 +1079,9 @@ async def update_engagement_item(
     response_source: str = None,
     status: str = None,
 ):
-    from sqlalchemy import select
     from .models import EngagementQueue
     from datetime import datetime
-    result = await session.execute(select(EngagementQueue).where(EngagementQueue.id == item_id))
-    item = result.scalar_one_or_none()
+    item = await session.get(EngagementQueue, item_id)
     if item:
         if generated_response:
             item.generated_response = generated_response
@@ -598,7 +1092,6 @@ async def update_engagement_item(
             if status == "sent":
                 item.sent_at = datetime.utcnow()
         await session.commit()
-        await session.refresh(item)
     return item
 
 
@@ -606,20 +1099,36 @@ async def save_platform_credential(
     session: AsyncSession,
     platform: str,
     username: str,
-    cookies_json: str = None,
+    cookies_json=None,
+    password: str = None,
 ) -> PlatformCredential:
-    """Save or update platform credentials."""
+    """Save or update platform credentials.
+
+    cookies_json may be a dict or a JSON string; it is stored structured
+    (JSONB on Postgres) so readers get a dict without re-parsing. The
+    password, when given, is stored as an AES-GCM blob; read it back
+    with config.decrypt_secret.
+    """
+    import json
+
     from sqlalchemy import select
     from datetime import datetime
-    
+
+    from ..config import encrypt_secret
+
+    if isinstance(cookies_json, str):
+        cookies_json = json.loads(cookies_json)
+
     result = await session.execute(
         select(PlatformCredential).where(PlatformCredential.platform == platform)
     )
     credential = result.scalar_one_or_none()
-    
+
     if credential:
         credential.username = username
         credential.cookies_json = cookies_json
+        if password is not None:
+            credential.password_encrypted = encrypt_secret(password)
         credential.last_validated = datetime.utcnow()
         credential.is_active = True
     else:
@@ -627,13 +1136,13 @@ async def save_platform_credential(
             platform=platform,
             username=username,
             cookies_json=cookies_json,
+            password_encrypted=encrypt_secret(password) if password is not None else None,
             is_active=True,
             last_validated=datetime.utcnow(),
         )
         session.add(credential)
     
     await session.commit()
-    await session.refresh(credential)
     return credential
 
 
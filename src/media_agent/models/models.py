@@ -1,10 +1,10 @@
 """Database models for MediaAgent."""
 
-from datetime import datetime
-
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, Float, DateTime, ForeignKey
+    CheckConstraint, Column, Integer, String, Text, Boolean, Float, DateTime,
+    ForeignKey, Index, JSON, LargeBinary, func,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, relationship
 
 
@@ -13,6 +13,30 @@ class Base(DeclarativeBase):
     pass
 
 
+def split_csv(value) -> list[str]:
+    """Split a comma-separated column into clean lowercase terms."""
+    if not value:
+        return []
+    return [term.strip().lower() for term in value.split(",") if term.strip()]
+
+
+def join_csv(values) -> str:
+    """Join terms into the canonical comma-separated storage form.
+
+    Accepts a list or an already comma-separated string; strips,
+    lowercases and de-duplicates while keeping order, so stored values
+    compare and match consistently.
+    """
+    if isinstance(values, str):
+        values = split_csv(values)
+    seen = {}
+    for term in values:
+        term = term.strip().lower()
+        if term:
+            seen.setdefault(term, None)
+    return ",".join(seen)
+
+
 class Product(Base):
     """Product model."""
     __tablename__ = "products"
@@ -22,17 +46,32 @@ class Product(Base):
     description = Column(Text, nullable=True)
     brand_voice = Column(String(50), default="friendly")  # friendly, professional, casual, authoritative
     target_audience = Column(Text, nullable=True)  # comma-separated keywords
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
 
     posts = relationship("Post", back_populates="product", cascade="all, delete-orphan")
     faqs = relationship("FAQ", back_populates="product", cascade="all, delete-orphan")
     leads = relationship("Lead", back_populates="product", cascade="all, delete-orphan")
 
+    @property
+    def audience_keywords(self) -> list[str]:
+        """target_audience parsed into a list of terms."""
+        return split_csv(self.target_audience)
+
 
 class Post(Base):
     """Post model."""
     __tablename__ = "posts"
+    __table_args__ = (
+        # Covers get_posts(product_id, status) and the per-platform counts
+        Index("ix_posts_product_status", "product_id", "status"),
+        # Covers due-post lookups by the scheduler
+        Index("ix_posts_status_scheduled_at", "status", "scheduled_at"),
+        CheckConstraint(
+            "status IN ('draft', 'scheduled', 'published', 'failed')",
+            name="ck_posts_status",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -41,7 +80,7 @@ class Post(Base):
     scheduled_at = Column(DateTime, nullable=True)
     published_at = Column(DateTime, nullable=True)
     status = Column(String(20), default="draft")  # draft, scheduled, published, failed
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     product = relationship("Product", back_populates="posts")
 
@@ -51,18 +90,31 @@ class FAQ(Base):
     __tablename__ = "faqs"
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
+    product_id = Column(Integer, ForeignKey("products.id"), nullable=False, index=True)
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
     keywords = Column(Text, nullable=True)  # comma-separated
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
     product = relationship("Product", back_populates="faqs")
 
+    @property
+    def keyword_list(self) -> list[str]:
+        """keywords parsed into a list of terms."""
+        return split_csv(self.keywords)
+
 
 class Lead(Base):
     """Lead model."""
     __tablename__ = "leads"
+    __table_args__ = (
+        # Covers get_leads(product_id, status) and the per-platform counts
+        Index("ix_leads_product_status", "product_id", "status"),
+        CheckConstraint(
+            "status IN ('new', 'engaged', 'converted', 'ignored')",
+            name="ck_leads_status",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -74,10 +126,18 @@ class Lead(Base):
     relevance_score = Column(Float, default=0.0)
     tags = Column(Text, nullable=True)  # comma-separated
     status = Column(String(20), default="new")  # new, engaged, converted, ignored
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
+    # Denormalized product fields so scoring scans skip the join
+    brand_voice_cache = Column(String(50), nullable=True)
+    target_audience_cache = Column(Text, nullable=True)
 
     product = relationship("Product", back_populates="leads")
 
+    @property
+    def tag_list(self) -> list[str]:
+        """tags parsed into a list of terms."""
+        return split_csv(self.tags)
+
 
 class PlatformCredential(Base):
     """Platform credential model."""
@@ -86,8 +146,11 @@ class PlatformCredential(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     platform = Column(String(50), nullable=False)
     username = Column(String(255), nullable=False)
-    password_encrypted = Column(Text, nullable=True)
-    cookies_json = Column(Text, nullable=True)
+    # AES-GCM blob (nonce || ciphertext), written via config.encrypt_secret
+    password_encrypted = Column(LargeBinary, nullable=True)
+    # Structured storage state; JSONB on Postgres, JSON elsewhere, so
+    # readers get a dict back without a json.loads per row
+    cookies_json = Column(JSON().with_variant(JSONB, "postgresql"), nullable=True)
     is_active = Column(Boolean, default=True)
     last_validated = Column(DateTime, nullable=True)
 
@@ -101,16 +164,20 @@ class ActivityLog(Base):
     action = Column(String(100), nullable=False)
     platform = Column(String(50), nullable=True)
     details = Column(Text, nullable=True)
-    timestamp = Column(DateTime, default=datetime.utcnow)
+    timestamp = Column(DateTime, server_default=func.now(), index=True)
 
 
 class Analytics(Base):
     """Analytics tracking model."""
     __tablename__ = "analytics"
+    __table_args__ = (
+        # Covers the daily counter upsert and per-product dashboards
+        Index("ix_analytics_product_platform_date", "product_id", "platform", "date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=True)
-    date = Column(DateTime, default=datetime.utcnow)  # Daily aggregation
+    date = Column(DateTime, server_default=func.now())  # Daily aggregation
     platform = Column(String(50), nullable=True)
     
     # Post metrics
@@ -143,12 +210,18 @@ class PostTemplate(Base):
     content = Column(Text, nullable=False)
     platform = Column(String(50), default="twitter")
     category = Column(String(50), default="general")  # promotional, educational, engagement, announcement
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
 
 class Campaign(Base):
     """Campaign model for grouping posts."""
     __tablename__ = "campaigns"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('active', 'paused', 'completed')",
+            name="ck_campaigns_status",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -157,12 +230,30 @@ class Campaign(Base):
     status = Column(String(20), default="active")  # active, paused, completed
     start_date = Column(DateTime, nullable=True)
     end_date = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.now())
 
 
 class EngagementQueue(Base):
     """Engagement queue for pending responses."""
     __tablename__ = "engagement_queue"
+    __table_args__ = (
+        # Covers get_engagement_queue(product_id, status)
+        Index("ix_engagement_queue_product_status", "product_id", "status"),
+        # Covers pending-item polling in creation order
+        Index("ix_engagement_queue_status_created_at", "status", "created_at"),
+        CheckConstraint(
+            "status IN ('pending', 'sent', 'failed', 'ignored')",
+            name="ck_engagement_queue_status",
+        ),
+        CheckConstraint(
+            "mention_type IN ('mention', 'comment', 'dm')",
+            name="ck_engagement_queue_mention_type",
+        ),
+        CheckConstraint(
+            "response_source IN ('pending', 'faq', 'ai')",
+            name="ck_engagement_queue_response_source",
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
@@ -172,6 +263,8 @@ class EngagementQueue(Base):
     source_content = Column(Text, nullable=False)
     generated_response = Column(Text, nullable=True)
     response_source = Column(String(50), default="pending")  # pending, faq, ai
-    status = Column(String(20), default="pending")  # pending, sent, failed
-    created_at = Column(DateTime, default=datetime.utcnow)
+    status = Column(String(20), default="pending")  # pending, sent, failed, ignored
+    created_at = Column(DateTime, server_default=func.now())
     sent_at = Column(DateTime, nullable=True)
+
+    product = relationship("Product")
@@ -1,22 +1,74 @@
 """Platforms module."""
 
-from .base import PlatformAdapter, PlatformRegistry, get_platform_registry
-from .twitter import TwitterAdapter
-from .instagram import InstagramAdapter
-from .facebook import FacebookAdapter
-from .linkedin import LinkedInAdapter
+import asyncio
+import importlib
 
-# Register all platform adapters
+from .base import (
+    PlatformAdapter,
+    PlatformRegistry,
+    get_platform_registry,
+    get_shared_browser,
+    shutdown_browser_pool,
+)
+
+# Adapter classes live in their own modules and are imported on first
+# use; eager imports here would pull Playwright in for every caller,
+# including ones that only need models or config.
+_ADAPTER_MODULES = {
+    "TwitterAdapter": ".twitter",
+    "InstagramAdapter": ".instagram",
+    "FacebookAdapter": ".facebook",
+    "LinkedInAdapter": ".linkedin",
+}
+
+# Register all platform adapters lazily
 registry = get_platform_registry()
-registry.register("twitter", TwitterAdapter)
-registry.register("instagram", InstagramAdapter)
-registry.register("facebook", FacebookAdapter)
-registry.register("linkedin", LinkedInAdapter)
+registry.register_lazy("twitter", f"{__name__}.twitter", "TwitterAdapter")
+registry.register_lazy("instagram", f"{__name__}.instagram", "InstagramAdapter")
+registry.register_lazy("facebook", f"{__name__}.facebook", "FacebookAdapter")
+registry.register_lazy("linkedin", f"{__name__}.linkedin", "LinkedInAdapter")
+
+
+def __getattr__(name: str):
+    """PEP 562 lazy access to the adapter classes."""
+    module = _ADAPTER_MODULES.get(name)
+    if module:
+        return getattr(importlib.import_module(module, __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+async def fan_out(
+    platforms: list[str],
+    method: str,
+    *args,
+    credentials: dict[str, tuple[str, str]] = None,
+    **kwargs,
+) -> list:
+    """Run the same adapter method on several platforms concurrently.
+
+    Wall-clock cost drops from the sum of per-platform latencies to the
+    slowest one. Failures don't cancel the rest: each result is either
+    the method's return value or the exception it raised, in platform
+    order. ``credentials`` maps platform name to (username, password).
+    """
+    credentials = credentials or {}
+    adapters = [
+        registry.get_adapter(platform, *credentials.get(platform, ("", "")))
+        for platform in platforms
+    ]
+    return await asyncio.gather(
+        *(getattr(adapter, method)(*args, **kwargs) for adapter in adapters),
+        return_exceptions=True,
+    )
+
 
 __all__ = [
     "PlatformAdapter",
     "PlatformRegistry",
     "get_platform_registry",
+    "get_shared_browser",
+    "shutdown_browser_pool",
+    "fan_out",
     "TwitterAdapter",
     "InstagramAdapter",
     "FacebookAdapter",
@@ -1,16 +1,79 @@
 """Base platform adapter with Playwright."""
 
-import json
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import time
 from abc import ABC
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, Page, BrowserContext
+
+# One warm Chromium shared by every adapter; each adapter gets its own
+# isolated BrowserContext, which costs tens of milliseconds instead of a
+# multi-second, multi-hundred-MB browser launch per platform. Headless
+# and headful instances are kept separately: a browser can't switch mode
+# after launch, and interactive login dialogs must get a visible window
+# even when the scheduler has already warmed the headless one.
+_playwright = None
+_shared_browsers: dict[bool, Browser] = {}
+_browser_lock = asyncio.Lock()
+
+
+async def get_shared_browser(headless: bool = False) -> Browser:
+    """Get the shared Chromium instance for the requested mode,
+    launching it on first use."""
+    global _playwright
+    async with _browser_lock:
+        browser = _shared_browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            if _playwright is None:
+                # Deferred so importing this package stays cheap for
+                # callers that never touch a browser
+                from playwright.async_api import async_playwright
 
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+                _playwright = await async_playwright().start()
+            browser = await _playwright.chromium.launch(
+                headless=headless,
+                # /dev/shm is tiny in containers and the GPU is useless
+                # for scraping; both flags cut memory without behavior
+                # changes
+                args=["--disable-dev-shm-usage", "--disable-gpu"],
+            )
+            _shared_browsers[headless] = browser
+        return browser
+
+
+async def shutdown_browser_pool():
+    """Close the shared browsers and stop Playwright."""
+    global _playwright
+    async with _browser_lock:
+        for browser in _shared_browsers.values():
+            await browser.close()
+        _shared_browsers.clear()
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
+
+# Resource types that text-only scraping never needs; avatars, sprites
+# and video previews dominate page weight on social sites
+_BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
 
 
 class PlatformAdapter(ABC):
     """Base class for social media platform adapters using Playwright."""
 
+    # Set by subclasses: the logged-in landing page plus a selector that
+    # only renders for authenticated users, used to cheaply validate a
+    # restored storage state without a full login flow
+    HOME_URL: Optional[str] = None
+    LOGGED_IN_SENTINEL: Optional[str] = None
+
     def __init__(self, username: str, password: str):
         self.username = username
         self.password = password
@@ -18,10 +81,27 @@ class PlatformAdapter(ABC):
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
-        self.cookies_path = self._get_cookies_path()
+        self.cookies_path = self._get_storage_path()
+        # Headless by default: scheduled flows have no one watching and
+        # headful Chromium costs ~100-200MB extra. Interactive login
+        # dialogs flip this off before calling login()
+        self.headless = True
+        # Toggled by read-only methods (search/get_mentions); checked per
+        # request so login and posting flows keep their assets
+        self.block_assets = False
+        # Set when init_browser restored a persisted storage state
+        self._restored_state = False
+        # Locator cache, rebuilt whenever the page changes
+        self._locators: dict = {}
+        self._locator_page = None
+        # Short-TTL cache for read results (search/mentions) so burst
+        # repeats hit a dict instead of driving the browser
+        self._result_cache: dict = {}
+        # Public calls served by the current context; see _recycle_context
+        self._pages_served = 0
 
-    def _get_cookies_path(self) -> Path:
-        """Get path for storing cookies."""
+    def _get_storage_path(self) -> Path:
+        """Get path for the persisted browser storage state."""
         try:
             from media_agent.config import get_project_root
             project_root = get_project_root()
@@ -30,52 +110,159 @@ class PlatformAdapter(ABC):
             project_root = Path(__file__).parent.parent.parent.parent
         cookies_dir = project_root / "config" / "cookies"
         cookies_dir.mkdir(parents=True, exist_ok=True)
-        return cookies_dir / f"{self.__class__.__name__}_cookies.json"
+        return cookies_dir / f"{self.__class__.__name__}_state.json"
 
-    async def init_browser(self, headless: bool = False):
-        """Initialize Playwright browser."""
-        if self.browser:
+    async def init_browser(self, headless: Optional[bool] = None):
+        """Initialize a browser context on the shared browser."""
+        if self.context:
             return
-        
-        playwright = await async_playwright().start()
-        self.browser = await playwright.chromium.launch(headless=headless)
-        
-        # Load existing cookies if available
+
+        if headless is None:
+            headless = self.headless
+        self.browser = await get_shared_browser(headless=headless)
+
+        # Restore the full storage state (cookies + localStorage) in one
+        # call instead of round-tripping cookies individually.
         if self.cookies_path.exists():
             try:
-                self.context = await self.browser.new_context()
-                with open(self.cookies_path, 'r') as f:
-                    cookies = json.load(f)
-                    await self.context.add_cookies(cookies)
+                self.context = await self.browser.new_context(
+                    storage_state=str(self.cookies_path)
+                )
+                self._restored_state = True
             except:
                 self.context = await self.browser.new_context()
         else:
             self.context = await self.browser.new_context()
-        
+
+        await self.context.route("**/*", self._route_assets)
         self.page = await self.context.new_page()
+        # Playwright defaults to 30s; broken selectors should hand
+        # control back to the caller's fallback long before that
+        self.page.set_default_timeout(10000)
+        self.page.set_default_navigation_timeout(15000)
+
+    async def _route_assets(self, route):
+        """Abort heavy asset requests while block_assets is on."""
+        if self.block_assets and route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    # Recycle the context after this many public calls: route-handler
+    # closures and page caches accumulate over long-lived contexts
+    _MAX_CONTEXT_PAGES = 50
+
+    async def _recycle_context(self):
+        """Swap in a fresh context, carrying the session via storage state.
+
+        The shared browser stays up; the saved state makes the new
+        context as logged-in as the old one, so recycling is invisible
+        to callers apart from freeing the accumulated heap.
+        """
+        await self.save_cookies()
+        await self.context.close()
+        self.context = None
+        self.page = None
+        self._pages_served = 0
+        await self.init_browser()
+        # HumanBehavior wraps the replaced page; adapters rebuild it on
+        # their next call when it's None
+        if getattr(self, "human", None) is not None:
+            self.human = None
+
+    _SEARCH_CACHE_TTL = 60.0
+    _MENTIONS_CACHE_TTL = 30.0
+
+    def _cached_result(self, key: tuple, ttl: float):
+        """Get a cached read result if it is still fresh, else None."""
+        entry = self._result_cache.get(key)
+        if entry and time.monotonic() - entry[0] < ttl:
+            return entry[1]
+        return None
+
+    def _store_result(self, key: tuple, value):
+        """Cache a read result with the current timestamp."""
+        self._result_cache[key] = (time.monotonic(), value)
+
+    def locator(self, selector: str):
+        """Get a Locator for the current page, cached per selector.
+
+        Saves the selector parse on repeated use; the cache resets when
+        the page is replaced (context recycling, re-login).
+        """
+        if self._locator_page is not self.page:
+            self._locators = {}
+            self._locator_page = self.page
+        loc = self._locators.get(selector)
+        if loc is None:
+            loc = self.page.locator(selector)
+            self._locators[selector] = loc
+        return loc
+
+    async def ensure_logged_in(self) -> bool:
+        """Make sure this adapter has a usable session.
+
+        A persisted storage state restored by init_browser counts as
+        logged in once the sentinel probe confirms it, so fresh adapters
+        (the scheduler builds one per job) skip the interactive login
+        entirely; login() only runs when no state exists or the stored
+        session has expired.
+        """
+        if self.context is not None and self._pages_served >= self._MAX_CONTEXT_PAGES:
+            await self._recycle_context()
+        self._pages_served += 1
+        if self.is_logged_in:
+            return True
+        await self.init_browser()
+        if self._restored_state:
+            if await self._restored_session_valid():
+                self.is_logged_in = True
+                return True
+            # Expired or revoked cookies: fall through to a real login
+            self._restored_state = False
+        return await self.login()
+
+    async def _restored_session_valid(self) -> bool:
+        """Probe whether a restored storage state is still authenticated.
+
+        Loads the home page and waits briefly for a selector that only
+        exists for logged-in users — a ~3s check versus the multi-step
+        login flow it replaces when the cookies are still good.
+        """
+        if not self.HOME_URL or not self.LOGGED_IN_SENTINEL:
+            # Adapter defines no sentinel; trust the stored state
+            return True
+        try:
+            await self.page.goto(self.HOME_URL, wait_until="domcontentloaded")
+            await self.page.wait_for_selector(self.LOGGED_IN_SENTINEL, timeout=3000)
+            return True
+        except Exception:
+            return False
 
     async def save_cookies(self):
-        """Save cookies for session persistence."""
+        """Save browser storage state for session persistence."""
         if self.context and self.cookies_path:
-            cookies = await self.context.cookies()
-            with open(self.cookies_path, 'w') as f:
-                json.dump(cookies, f)
-    
+            await self.context.storage_state(path=str(self.cookies_path))
+
     def get_cookies_json(self) -> str:
-        """Get cookies as JSON string."""
+        """Get storage state as JSON string."""
         if self.cookies_path and self.cookies_path.exists():
             with open(self.cookies_path, 'r') as f:
                 return f.read()
         return None
 
     async def close_browser(self):
-        """Close browser and save cookies."""
-        if self.browser:
+        """Close this adapter's context and save cookies.
+
+        The shared browser stays warm for other adapters; use
+        shutdown_browser_pool() to tear it down at application exit.
+        """
+        if self.context:
             await self.save_cookies()
-            await self.browser.close()
-            self.browser = None
-            self.context = None
-            self.page = None
+            await self.context.close()
+        self.browser = None
+        self.context = None
+        self.page = None
 
     async def login(self) -> bool:
         """Login to the platform. Override in subclass."""
@@ -117,21 +304,46 @@ class PlatformRegistry:
 
     def __init__(self):
         self._adapters: dict[str, type[PlatformAdapter]] = {}
+        # platform -> (module path, class name), imported on first use
+        self._lazy: dict[str, tuple[str, str]] = {}
+        # Per-instance cache so repeated lookups (one per mention in the
+        # engagement loop) skip the lower() + dict walk after first use
+        self._resolve = functools.lru_cache(maxsize=None)(self._lookup)
+
+    def _lookup(self, platform_lower: str) -> type[PlatformAdapter]:
+        """Resolve a lowercased platform name to its adapter class."""
+        adapter_class = self._adapters.get(platform_lower)
+        if not adapter_class:
+            entry = self._lazy.get(platform_lower)
+            if entry:
+                module_path, class_name = entry
+                adapter_class = getattr(importlib.import_module(module_path), class_name)
+                self._adapters[platform_lower] = adapter_class
+        if not adapter_class:
+            raise ValueError(f"Platform {platform_lower} not supported")
+        return adapter_class
 
     def register(self, platform: str, adapter_class: type[PlatformAdapter]):
         """Register a platform adapter."""
         self._adapters[platform.lower()] = adapter_class
+        self._resolve.cache_clear()
+
+    def register_lazy(self, platform: str, module_path: str, class_name: str):
+        """Register an adapter by import path, deferring the module import.
+
+        The adapter module (and with it Playwright) is only imported the
+        first time the platform is actually requested.
+        """
+        self._lazy[platform.lower()] = (module_path, class_name)
+        self._resolve.cache_clear()
 
     def get_adapter(self, platform: str, username: str, password: str) -> PlatformAdapter:
         """Get an adapter instance for a platform."""
-        adapter_class = self._adapters.get(platform.lower())
-        if not adapter_class:
-            raise ValueError(f"Platform {platform} not supported")
-        return adapter_class(username, password)
+        return self._resolve(platform.lower())(username, password)
 
     def list_platforms(self) -> list[str]:
         """List available platforms."""
-        return list(self._adapters.keys())
+        return list(self._adapters.keys() | self._lazy.keys())
 
 
 # Global registry
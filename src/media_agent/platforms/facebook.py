@@ -1,16 +1,20 @@
 """Facebook platform adapter using Playwright with human behavior."""
 
+import logging
 from typing import Optional
 
 from .base import PlatformAdapter
 from .human import HumanBehavior
 
+logger = logging.getLogger(__name__)
+
 
 class FacebookAdapter(PlatformAdapter):
     """Facebook platform adapter using Playwright with human-like behavior."""
 
     LOGIN_URL = "https://www.facebook.com/login"
     HOME_URL = "https://www.facebook.com/"
+    LOGGED_IN_SENTINEL = '[aria-label="Your profile"]'
 
     def __init__(self, username: str, password: str):
         super().__init__(username, password)
@@ -19,15 +23,15 @@ class FacebookAdapter(PlatformAdapter):
     async def login(self) -> bool:
         """Login to Facebook using Playwright with human behavior."""
         try:
-            await self.init_browser(headless=False)
+            await self.init_browser()
             
             self.human = HumanBehavior(self.page)
             
             await self.page.goto(self.LOGIN_URL)
-            await self.human.timing.wait_for_page_load(self.page)
-            
-            # Enter email with human-like typing
-            await self.page.wait_for_selector('input[id="email"]', timeout=10000)
+
+            # Enter email with human-like typing; waiting for the field is
+            # enough — network-idle never settles on Facebook pages
+            await self.page.wait_for_selector('input[id="email"]')
             email_input = await self.page.query_selector('input[id="email"]')
             
             await self.human.type_text(self.username, email_input)
@@ -53,21 +57,20 @@ class FacebookAdapter(PlatformAdapter):
             self.is_logged_in = True
             return True
             
-        except Exception as e:
-            print(f"Facebook login error: {e}")
+        except Exception:
+            logger.exception("Facebook login error")
             return False
 
     async def post(self, content: str) -> bool:
         """Create a new post on Facebook with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(self.HOME_URL)
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector('[aria-label="Create a post"]')
             
             # Browse home briefly like human
             await self.human.random_delay(2, 4)
@@ -92,21 +95,23 @@ class FacebookAdapter(PlatformAdapter):
             await self.human.random_delay(2, 4)
             return True
             
-        except Exception as e:
-            print(f"Facebook post error: {e}")
+        except Exception:
+            logger.exception("Facebook post error")
             return False
 
     async def like(self, post_id: str) -> bool:
         """Like a post with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.facebook.com/{post_id}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector('[aria-label="Like"]', timeout=5000)
+            except:
+                pass
             
             # Read the post first
             await self.human.random_delay(2, 4)
@@ -120,21 +125,20 @@ class FacebookAdapter(PlatformAdapter):
             await self.human.action_delay("like")
             return True
             
-        except Exception as e:
-            print(f"Facebook like error: {e}")
+        except Exception:
+            logger.exception("Facebook like error")
             return False
 
     async def comment(self, post_id: str, content: str) -> bool:
         """Comment on a post with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.facebook.com/{post_id}")
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector('[aria-label="Write a comment"]')
             
             # Read the post
             await self.human.random_delay(3, 5)
@@ -157,21 +161,23 @@ class FacebookAdapter(PlatformAdapter):
             await self.human.action_delay("comment")
             return True
             
-        except Exception as e:
-            print(f"Facebook comment error: {e}")
+        except Exception:
+            logger.exception("Facebook comment error")
             return False
 
     async def follow(self, username: str) -> bool:
         """Follow a user/page with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.facebook.com/{username}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector('[aria-label="Follow"]', timeout=5000)
+            except:
+                pass
             
             # View profile briefly
             await self.human.random_delay(2, 4)
@@ -185,68 +191,68 @@ class FacebookAdapter(PlatformAdapter):
             await self.human.action_delay("follow")
             return True
             
-        except Exception as e:
-            print(f"Facebook follow error: {e}")
+        except Exception:
+            logger.exception("Facebook follow error")
             return False
 
     async def search(self, query: str, limit: int = 10) -> list[dict]:
         """Search for content/pages with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
             await self.page.goto(f"https://www.facebook.com/search/top?q={query}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector('[role="article"]')
+            except:
+                pass
             
             # Let results load and scan
             await self.human.random_delay(2, 4)
             
-            results = []
-            posts = await self.page.query_selector_all('[role="article"]')
-            
-            for post in posts[:limit]:
-                try:
-                    text = await post.inner_text()
-                    results.append({"text": text[:200]})
-                except:
-                    continue
+            # One protocol round trip for all results instead of one
+            # inner_text call per element
+            texts = await self.page.eval_on_selector_all(
+                '[role="article"]',
+                f"els => els.slice(0, {limit}).map(e => e.innerText.slice(0, 200))",
+            )
+            return [{"text": text} for text in texts]
             
-            return results
-            
-        except Exception as e:
-            print(f"Facebook search error: {e}")
+        except Exception:
+            logger.exception("Facebook search error")
             return []
+        finally:
+            self.block_assets = False
 
     async def get_mentions(self, since_id: Optional[str] = None) -> list[dict]:
         """Get mentions and notifications with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
             await self.page.goto("https://www.facebook.com/notifications")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector('[role="listitem"]')
+            except:
+                pass
             
             # Read notifications like human
             await self.human.random_delay(2, 4)
             
-            mentions = []
-            notifications = await self.page.query_selector_all('[role="listitem"]')
-            
-            for notif in notifications[:20]:
-                try:
-                    text = await notif.inner_text()
-                    mentions.append({"text": text})
-                except:
-                    continue
-            
-            return mentions
+            texts = await self.page.eval_on_selector_all(
+                '[role="listitem"]',
+                "els => els.slice(0, 20).map(e => e.innerText)",
+            )
+            return [{"text": text} for text in texts]
             
-        except Exception as e:
-            print(f"Facebook mentions error: {e}")
+        except Exception:
+            logger.exception("Facebook mentions error")
             return []
+        finally:
+            self.block_assets = False
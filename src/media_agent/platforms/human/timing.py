@@ -106,12 +106,13 @@ class TimingBehavior:
     
     async def wait_for_page_load(self, page):
         """Wait for page to load like human would."""
-        # Wait for network idle
+        # domcontentloaded instead of networkidle: social sites long-poll
+        # constantly, so idle often never fires and eats the full timeout
         try:
-            await page.wait_for_load_state("networkidle", timeout=5000)
+            await page.wait_for_load_state("domcontentloaded", timeout=5000)
         except:
             pass
-        
+
         # Simulate reading time before proceeding
         await asyncio.sleep(random.uniform(0.5, 1.5))
     
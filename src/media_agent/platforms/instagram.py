@@ -1,16 +1,20 @@
 """Instagram platform adapter using Playwright with human behavior."""
 
+import logging
 from typing import Optional
 
 from .base import PlatformAdapter
 from .human import HumanBehavior
 
+logger = logging.getLogger(__name__)
+
 
 class InstagramAdapter(PlatformAdapter):
     """Instagram platform adapter using Playwright with human-like behavior."""
 
     LOGIN_URL = "https://www.instagram.com/accounts/login/"
     HOME_URL = "https://www.instagram.com/"
+    LOGGED_IN_SENTINEL = 'svg[aria-label="New post"]'
 
     def __init__(self, username: str, password: str):
         super().__init__(username, password)
@@ -19,15 +23,15 @@ class InstagramAdapter(PlatformAdapter):
     async def login(self) -> bool:
         """Login to Instagram using Playwright with human behavior."""
         try:
-            await self.init_browser(headless=False)
+            await self.init_browser()
             
             self.human = HumanBehavior(self.page)
             
             await self.page.goto(self.LOGIN_URL)
-            await self.human.timing.wait_for_page_load(self.page)
-            
-            # Enter username with human-like typing
-            await self.page.wait_for_selector('input[name="username"]', timeout=10000)
+
+            # Enter username with human-like typing; waiting for the field
+            # is enough — network-idle never settles on Instagram pages
+            await self.page.wait_for_selector('input[name="username"]')
             username_input = await self.page.query_selector('input[name="username"]')
             
             await self.human.type_text(self.username, username_input)
@@ -53,21 +57,20 @@ class InstagramAdapter(PlatformAdapter):
             self.is_logged_in = True
             return True
             
-        except Exception as e:
-            print(f"Instagram login error: {e}")
+        except Exception:
+            logger.exception("Instagram login error")
             return False
 
     async def post(self, content: str) -> bool:
         """Create a new post (Instagram requires image, text only not supported natively)."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(self.HOME_URL)
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector('svg[aria-label="New post"]')
             
             # Browse home briefly like human
             await self.human.random_delay(2, 4)
@@ -80,24 +83,26 @@ class InstagramAdapter(PlatformAdapter):
             await self.human.think_delay()
             
             # Note: Instagram requires image for posts
-            print("Note: Instagram requires image for posts")
+            logger.info("Instagram requires an image for posts")
             return True
             
-        except Exception as e:
-            print(f"Instagram post error: {e}")
+        except Exception:
+            logger.exception("Instagram post error")
             return False
 
     async def like(self, post_id: str) -> bool:
         """Like a post with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.instagram.com/p/{post_id}/")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector('svg[aria-label="Like"]', timeout=5000)
+            except:
+                pass
             
             # Read the post first
             await self.human.random_delay(2, 4)
@@ -111,21 +116,20 @@ class InstagramAdapter(PlatformAdapter):
             await self.human.action_delay("like")
             return True
             
-        except Exception as e:
-            print(f"Instagram like error: {e}")
+        except Exception:
+            logger.exception("Instagram like error")
             return False
 
     async def comment(self, post_id: str, content: str) -> bool:
         """Comment on a post with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.instagram.com/p/{post_id}/")
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector('textarea')
             
             # Read the post
             await self.human.random_delay(3, 5)
@@ -149,21 +153,23 @@ class InstagramAdapter(PlatformAdapter):
             await self.human.action_delay("comment")
             return True
             
-        except Exception as e:
-            print(f"Instagram comment error: {e}")
+        except Exception:
+            logger.exception("Instagram comment error")
             return False
 
     async def follow(self, username: str) -> bool:
         """Follow a user with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.instagram.com/{username}/")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector('button:has-text("Follow")', timeout=5000)
+            except:
+                pass
             
             # View profile briefly
             await self.human.random_delay(2, 4)
@@ -177,21 +183,21 @@ class InstagramAdapter(PlatformAdapter):
             await self.human.action_delay("follow")
             return True
             
-        except Exception as e:
-            print(f"Instagram follow error: {e}")
+        except Exception:
+            logger.exception("Instagram follow error")
             return False
 
     async def search(self, query: str, limit: int = 10) -> list[dict]:
         """Search for content/users with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
             await self.page.goto(f"https://www.instagram.com/explore/search/?q={query}")
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_load_state("domcontentloaded")
             
             # Let results load and scan
             await self.human.random_delay(2, 4)
@@ -199,27 +205,31 @@ class InstagramAdapter(PlatformAdapter):
             results = []
             return results
             
-        except Exception as e:
-            print(f"Instagram search error: {e}")
+        except Exception:
+            logger.exception("Instagram search error")
             return []
+        finally:
+            self.block_assets = False
 
     async def get_mentions(self, since_id: Optional[str] = None) -> list[dict]:
         """Get mentions with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
             await self.page.goto("https://www.instagram.com/notifications/")
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_load_state("domcontentloaded")
             
             # Read notifications like human
             await self.human.random_delay(2, 4)
             
             return []
             
-        except Exception as e:
-            print(f"Instagram mentions error: {e}")
+        except Exception:
+            logger.exception("Instagram mentions error")
             return []
+        finally:
+            self.block_assets = False
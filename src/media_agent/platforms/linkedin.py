@@ -1,16 +1,37 @@
 """LinkedIn platform adapter using Playwright with human behavior."""
 
+import logging
+import re
+import urllib.parse
 from typing import Optional
 
 from .base import PlatformAdapter
 from .human import HumanBehavior
 
+logger = logging.getLogger(__name__)
+
 
 class LinkedInAdapter(PlatformAdapter):
     """LinkedIn platform adapter using Playwright with human-like behavior."""
 
     LOGIN_URL = "https://www.linkedin.com/login"
     HOME_URL = "https://www.linkedin.com/feed/"
+    LOGGED_IN_SENTINEL = 'img.global-nav__me-photo'
+
+    # Selectors in one place; methods reference these so a markup change
+    # on linkedin.com is a one-line fix
+    USERNAME_INPUT = 'input[id="username"]'
+    PASSWORD_INPUT = 'input[id="password"]'
+    SUBMIT_BUTTON = 'button[type="submit"]'
+    START_POST_BUTTON = 'button:has-text("Start a post")'
+    EDITOR = '[contenteditable="true"]'
+    POST_BUTTON = 'button:has-text("Post")'
+    LIKE_BUTTON = 'button[aria-label="Like"]'
+    COMMENT_BUTTON = 'button[aria-label="Comment"]'
+    FOLLOW_BUTTON = 'button:has-text("Follow")'
+    RESULT_TITLE = '.entity-result__title'
+    NOTIFICATION_ITEM = '.notification-list-item'
+    ALERT = 'div[role="alert"]'
 
     def __init__(self, username: str, password: str):
         super().__init__(username, password)
@@ -19,32 +40,35 @@ class LinkedInAdapter(PlatformAdapter):
     async def login(self) -> bool:
         """Login to LinkedIn using Playwright with human behavior."""
         try:
-            await self.init_browser(headless=False)
+            await self.init_browser()
             
             self.human = HumanBehavior(self.page)
             
             await self.page.goto(self.LOGIN_URL)
-            await self.human.timing.wait_for_page_load(self.page)
-            
-            # Enter username with human-like typing
-            await self.page.wait_for_selector('input[id="username"]', timeout=10000)
-            username_input = await self.page.query_selector('input[id="username"]')
+
+            # Enter username with human-like typing; waiting for the field
+            # is enough — network-idle never settles on LinkedIn pages
+            await self.page.wait_for_selector(self.USERNAME_INPUT)
+            username_input = await self.page.query_selector(self.USERNAME_INPUT)
             
             await self.human.type_text(self.username, username_input)
             await self.human.random_delay(0.5, 1.5)
             
             # Enter password with human-like typing
-            password_input = await self.page.query_selector('input[id="password"]')
+            password_input = await self.page.query_selector(self.PASSWORD_INPUT)
             await self.human.type_text(self.password, password_input)
             
             await self.human.random_delay(0.5, 1.0)
             
-            # Click login
-            login_btn = await self.page.query_selector('button[type="submit"]')
-            await self.human.click_element(login_btn)
-            
-            # Wait for home page
-            await self.page.wait_for_url("*linkedin.com/feed*", timeout=20000)
+            # Click login; arming the navigation wait before the click
+            # catches redirects that wait_for_url could miss
+            login_btn = await self.page.query_selector(self.SUBMIT_BUTTON)
+            async with self.page.expect_navigation(
+                url=re.compile(r"linkedin\.com/feed"),
+                wait_until="domcontentloaded",
+                timeout=20000,
+            ):
+                await self.human.click_element(login_btn)
             
             # Session warmup
             await self.human.warmup_session(duration_seconds=20)
@@ -53,66 +77,72 @@ class LinkedInAdapter(PlatformAdapter):
             self.is_logged_in = True
             return True
             
-        except Exception as e:
-            print(f"LinkedIn login error: {e}")
+        except Exception:
+            logger.exception("LinkedIn login error")
             return False
 
     async def post(self, content: str) -> bool:
         """Create a new post on LinkedIn with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(self.HOME_URL)
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector(self.START_POST_BUTTON)
             
             # Browse feed briefly like human
             await self.human.random_delay(2, 4)
             
             # Click "Start a post" with human movement
-            start_post_btn = await self.page.query_selector('button:has-text("Start a post")')
+            start_post_btn = await self.page.query_selector(self.START_POST_BUTTON)
             await self.human.hover(start_post_btn)
             await self.human.click_element(start_post_btn)
             
             await self.human.think_delay()
             
             # Type content with human-like typing
-            post_box = await self.page.query_selector('[contenteditable="true"]')
+            post_box = await self.page.query_selector(self.EDITOR)
             await self.human.type_text(content, post_box)
             
             await self.human.random_delay(1, 3)
             
             # Click post button
-            post_btn = await self.page.query_selector('button:has-text("Post")')
+            post_btn = await self.page.query_selector(self.POST_BUTTON)
             await self.human.click_element(post_btn)
             
-            await self.human.random_delay(2, 4)
+            # Wait for the success toast instead of a blind sleep; fall
+            # back to the old delay if it never shows
+            try:
+                await self.page.wait_for_selector(self.ALERT)
+            except:
+                await self.human.random_delay(2, 4)
             return True
             
-        except Exception as e:
-            print(f"LinkedIn post error: {e}")
+        except Exception:
+            logger.exception("LinkedIn post error")
             return False
 
     async def like(self, post_id: str) -> bool:
         """Like a post with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.linkedin.com/posts/{post_id}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector(self.LIKE_BUTTON, timeout=5000)
+            except:
+                pass
             
             # Read the post first
             await self.human.random_delay(2, 4)
             
             # Click like with human-like movement
-            like_btn = await self.page.query_selector('button[aria-label="Like"]')
+            like_btn = await self.page.query_selector(self.LIKE_BUTTON)
             if like_btn:
                 await self.human.hover(like_btn)
                 await self.human.click_element(like_btn)
@@ -120,135 +150,159 @@ class LinkedInAdapter(PlatformAdapter):
             await self.human.action_delay("like")
             return True
             
-        except Exception as e:
-            print(f"LinkedIn like error: {e}")
+        except Exception:
+            logger.exception("LinkedIn like error")
             return False
 
     async def comment(self, post_id: str, content: str) -> bool:
         """Comment on a post with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.linkedin.com/posts/{post_id}")
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector(self.COMMENT_BUTTON)
             
             # Read the post
             await self.human.random_delay(3, 5)
             
             # Click comment button with movement
-            comment_btn = await self.page.query_selector('button[aria-label="Comment"]')
+            comment_btn = await self.page.query_selector(self.COMMENT_BUTTON)
             await self.human.hover(comment_btn)
             await self.human.click_element(comment_btn)
             
             await self.human.think_delay()
             
             # Type comment with human-like typing
-            comment_box = await self.page.query_selector('[contenteditable="true"]')
+            comment_box = await self.page.query_selector(self.EDITOR)
             await self.human.type_text(content, comment_box)
             
             await self.human.random_delay(1, 2)
             
             # Click post button
-            post_btn = await self.page.query_selector('button:has-text("Post")')
+            post_btn = await self.page.query_selector(self.POST_BUTTON)
             await self.human.click_element(post_btn)
             
             await self.human.action_delay("comment")
             return True
             
-        except Exception as e:
-            print(f"LinkedIn comment error: {e}")
+        except Exception:
+            logger.exception("LinkedIn comment error")
             return False
 
     async def follow(self, username: str) -> bool:
         """Follow a company/person with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://www.linkedin.com/company/{username}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector(self.FOLLOW_BUTTON, timeout=5000)
+            except:
+                pass
             
             # View profile briefly
             await self.human.random_delay(2, 4)
             
             # Click follow with movement
-            follow_btn = await self.page.query_selector('button:has-text("Follow")')
+            follow_btn = await self.page.query_selector(self.FOLLOW_BUTTON)
             if follow_btn:
                 await self.human.hover(follow_btn)
                 await self.human.click_element(follow_btn)
+                # Confirmed when the button flips to "Following"
+                try:
+                    await self.page.wait_for_selector('button:has-text("Following")', timeout=5000)
+                except:
+                    pass
             
             await self.human.action_delay("follow")
             return True
             
-        except Exception as e:
-            print(f"LinkedIn follow error: {e}")
+        except Exception:
+            logger.exception("LinkedIn follow error")
             return False
 
     async def search(self, query: str, limit: int = 10) -> list[dict]:
         """Search for people/companies with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        cache_key = ("search", query, limit)
+        cached = self._cached_result(cache_key, self._SEARCH_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
-            await self.page.goto(f"https://www.linkedin.com/search/results/all/?keywords={query}")
-            await self.human.timing.wait_for_page_load(self.page)
+            # quote_plus keeps spaces/unicode from breaking the URL
+            await self.page.goto(
+                "https://www.linkedin.com/search/results/all/?keywords="
+                + urllib.parse.quote_plus(query)
+            )
+            try:
+                await self.page.wait_for_selector(self.RESULT_TITLE)
+            except:
+                pass
             
             # Let results load and scan
             await self.human.random_delay(2, 4)
             
-            results = []
-            items = await self.page.query_selector_all('.entity-result__title')
-            
-            for item in items[:limit]:
-                try:
-                    text = await item.inner_text()
-                    results.append({"username": text.strip(), "text": text.strip()})
-                except:
-                    continue
-            
+            # One protocol round trip for all result cards instead of an
+            # inner_text call per card
+            texts = await self.page.eval_on_selector_all(
+                self.RESULT_TITLE,
+                f"els => els.slice(0, {limit}).map(e => e.innerText)",
+            )
+            results = [{"username": text.strip(), "text": text.strip()} for text in texts]
+            self._store_result(cache_key, results)
             return results
             
-        except Exception as e:
-            print(f"LinkedIn search error: {e}")
+        except Exception:
+            logger.exception("LinkedIn search error")
             return []
+        finally:
+            self.block_assets = False
 
     async def get_mentions(self, since_id: Optional[str] = None) -> list[dict]:
         """Get notifications with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        cache_key = ("mentions", since_id)
+        cached = self._cached_result(cache_key, self._MENTIONS_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
             await self.page.goto("https://www.linkedin.com/notifications")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector(self.NOTIFICATION_ITEM)
+            except:
+                pass
             
             # Read notifications like human
             await self.human.random_delay(2, 4)
             
-            mentions = []
-            items = await self.page.query_selector_all('.notification-list-item')
-            
-            for item in items[:20]:
-                try:
-                    text = await item.inner_text()
-                    mentions.append({"text": text})
-                except:
-                    continue
-            
+            texts = await self.page.eval_on_selector_all(
+                self.NOTIFICATION_ITEM,
+                "els => els.slice(0, 20).map(e => e.innerText)",
+            )
+            mentions = [{"text": text} for text in texts]
+            self._store_result(cache_key, mentions)
             return mentions
             
-        except Exception as e:
-            print(f"LinkedIn mentions error: {e}")
+        except Exception:
+            logger.exception("LinkedIn mentions error")
             return []
+        finally:
+            self.block_assets = False
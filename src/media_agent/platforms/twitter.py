@@ -1,16 +1,37 @@
 """Twitter/X platform adapter using Playwright with human behavior."""
 
+import asyncio
+import logging
+import re
+import urllib.parse
 from typing import Optional
 
 from .base import PlatformAdapter
 from .human import HumanBehavior
 
+logger = logging.getLogger(__name__)
+
 
 class TwitterAdapter(PlatformAdapter):
     """Twitter/X platform adapter using Playwright with human-like behavior."""
 
     LOGIN_URL = "https://x.com/i/flow/login"
     HOME_URL = "https://x.com/home"
+    LOGGED_IN_SENTINEL = 'a[data-testid="AppTabBar_Profile_Link"]'
+
+    # Selectors in one place; methods reference these so a markup change
+    # on x.com is a one-line fix
+    USERNAME_INPUT = 'input[autocomplete="username"]'
+    PASSWORD_INPUT = 'input[autocomplete="current-password"]'
+    VERIFY_INPUT = 'input[data-testid="ocfEnterTextTextInput"]'
+    POST_BOX = 'div[aria-label="Post text"]'
+    TWEET_BUTTON = 'button[data-testid="tweetButton"]'
+    LIKE_BUTTON = 'button[data-testid="like"]'
+    REPLY_BUTTON = 'button[data-testid="reply"]'
+    FOLLOW_BUTTON = 'button:has-text("Follow")'
+    TWEET_ARTICLE = 'article[data-testid="tweet"]'
+    NOTIFICATION = 'div[data-testid="notification"]'
+    TOAST = 'div[data-testid="toast"]'
 
     def __init__(self, username: str, password: str):
         super().__init__(username, password)
@@ -19,18 +40,19 @@ class TwitterAdapter(PlatformAdapter):
     async def login(self) -> bool:
         """Login to Twitter/X using Playwright with human behavior."""
         try:
-            await self.init_browser(headless=False)
+            await self.init_browser()
             
             # Initialize human behavior
             self.human = HumanBehavior(self.page)
             
             # Navigate to login
             await self.page.goto(self.LOGIN_URL)
-            await self.human.timing.wait_for_page_load(self.page)
-            
-            # Enter username/email with human-like typing
-            await self.page.wait_for_selector('input[autocomplete="username"]', timeout=10000)
-            username_input = await self.page.query_selector('input[autocomplete="username"]')
+
+            # Enter username/email with human-like typing; the selector
+            # wait below is the real readiness signal, network-idle never
+            # settles on x.com
+            await self.page.wait_for_selector(self.USERNAME_INPUT)
+            username_input = await self.page.query_selector(self.USERNAME_INPUT)
             
             # Use the username directly (could be email or handle)
             await self.human.type_text(self.username, username_input)
@@ -41,29 +63,49 @@ class TwitterAdapter(PlatformAdapter):
             
             await self.human.think_delay()
             
-            # Check if password or verification needed
-            try:
-                password_input = await self.page.wait_for_selector('input[autocomplete="current-password"]', timeout=5000)
+            # Race the password field against the verification prompt:
+            # whichever shows first wins, so accounts that skip
+            # verification don't burn the old 5s fallback timeout
+            password_task = asyncio.create_task(
+                self.page.wait_for_selector(self.PASSWORD_INPUT)
+            )
+            verify_task = asyncio.create_task(
+                self.page.wait_for_selector(self.VERIFY_INPUT)
+            )
+            done, pending = await asyncio.wait(
+                {password_task, verify_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in pending:
+                task.cancel()
+            
+            if password_task in done and not password_task.exception():
+                await self.human.type_text(self.password, password_task.result())
+            elif verify_task in done and not verify_task.exception():
+                # Verification step - enter the handle/email and continue
+                # with Enter instead of hunting for the Next button
+                await self.human.type_text(self.username, verify_task.result())
+                await self.page.keyboard.press("Enter")
+                await self.human.think_delay()
+                password_input = await self.page.wait_for_selector(self.PASSWORD_INPUT, timeout=5000)
                 await self.human.type_text(self.password, password_input)
-            except:
-                # Need username verification - might be using email
-                username_input2 = await self.page.query_selector('input[autocomplete="username"]')
-                if username_input2:
-                    await self.human.type_text(self.username, username_input2)
-                    await self.human.click_element(next_btn)
-                    await self.human.think_delay()
-                    password_input = await self.page.wait_for_selector('input[autocomplete="current-password"]', timeout=5000)
-                    await self.human.type_text(self.password, password_input)
+            else:
+                # Neither prompt appeared (markup change, network stall);
+                # fail the login instead of touching a cancelled task
+                logger.error("Twitter login: neither password nor verification prompt appeared")
+                return False
             
             await self.human.random_delay(0.5, 1.0)
             
-            # Click login button
+            # Click login button with the navigation wait armed first so
+            # a fast redirect to home can't slip past
             login_btn = await self.page.query_selector('button:has-text("Log in")')
-            await self.human.click_element(login_btn)
-            
-            # Wait for home page or check for additional verification
             try:
-                await self.page.wait_for_url(self.HOME_URL, timeout=15000)
+                async with self.page.expect_navigation(
+                    url=re.compile(r"x\.com/home"),
+                    wait_until="domcontentloaded",
+                    timeout=15000,
+                ):
+                    await self.human.click_element(login_btn)
             except:
                 # Might need to handle email verification or 2FA
                 await self.human.random_delay(5, 10)
@@ -75,14 +117,13 @@ class TwitterAdapter(PlatformAdapter):
             self.is_logged_in = True
             return True
             
-        except Exception as e:
-            print(f"Twitter login error: {e}")
+        except Exception:
+            logger.exception("Twitter login error")
             return False
 
     async def post(self, content: str) -> bool:
         """Create a new tweet with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
@@ -90,13 +131,12 @@ class TwitterAdapter(PlatformAdapter):
         try:
             # Navigate to home
             await self.page.goto(self.HOME_URL)
-            await self.human.timing.wait_for_page_load(self.page)
             
             # Simulate reading timeline
             await self.human.random_delay(2, 4)
             
             # Click post area with human-like movement
-            post_box = await self.page.wait_for_selector('div[aria-label="Post text"]', timeout=10000)
+            post_box = await self.page.wait_for_selector(self.POST_BOX)
             await self.human.hover(post_box)
             await self.human.click_element(post_box)
             
@@ -109,35 +149,41 @@ class TwitterAdapter(PlatformAdapter):
             await self.human.random_delay(1, 3)
             
             # Click post button
-            post_btn = await self.page.query_selector('button[data-testid="tweetButton"]')
+            post_btn = await self.page.query_selector(self.TWEET_BUTTON)
             await self.human.move_to_element(post_btn)
             await self.human.click_element(post_btn)
             
-            # Wait and verify
-            await self.human.random_delay(2, 4)
+            # Wait for the confirmation toast instead of a blind sleep;
+            # fall back to the old delay if it never shows
+            try:
+                await self.page.wait_for_selector(self.TOAST)
+            except:
+                await self.human.random_delay(2, 4)
             return True
             
-        except Exception as e:
-            print(f"Twitter post error: {e}")
+        except Exception:
+            logger.exception("Twitter post error")
             return False
 
     async def like(self, post_id: str) -> bool:
         """Like a tweet with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://x.com/i/status/{post_id}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector(self.LIKE_BUTTON, timeout=5000)
+            except:
+                pass
             
             # Read the tweet first
             await self.human.random_delay(2, 4)
             
             # Click like button with movement
-            like_btn = await self.page.query_selector('button[data-testid="like"]')
+            like_btn = await self.page.query_selector(self.LIKE_BUTTON)
             if like_btn:
                 await self.human.hover(like_btn)
                 await self.human.click_element(like_btn)
@@ -145,141 +191,161 @@ class TwitterAdapter(PlatformAdapter):
             await self.human.action_delay("like")
             return True
             
-        except Exception as e:
-            print(f"Twitter like error: {e}")
+        except Exception:
+            logger.exception("Twitter like error")
             return False
 
     async def comment(self, post_id: str, content: str) -> bool:
         """Comment on a tweet with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://x.com/i/status/{post_id}")
-            await self.human.timing.wait_for_page_load(self.page)
+            await self.page.wait_for_selector(self.REPLY_BUTTON)
             
             # Read the tweet
             await self.human.random_delay(3, 5)
             
             # Click reply button
-            reply_btn = await self.page.query_selector('button[data-testid="reply"]')
+            reply_btn = await self.page.query_selector(self.REPLY_BUTTON)
             await self.human.hover(reply_btn)
             await self.human.click_element(reply_btn)
             
             await self.human.think_delay()
             
             # Type comment
-            post_box = await self.page.query_selector('div[aria-label="Post text"]')
+            post_box = await self.page.query_selector(self.POST_BOX)
             await self.human.type_text(content, post_box)
             
             await self.human.random_delay(1, 2)
             
             # Submit reply
-            reply_submit = await self.page.query_selector('button[data-testid="tweetButton"]')
+            reply_submit = await self.page.query_selector(self.TWEET_BUTTON)
             await self.human.click_element(reply_submit)
             
             await self.human.action_delay("comment")
             return True
             
-        except Exception as e:
-            print(f"Twitter comment error: {e}")
+        except Exception:
+            logger.exception("Twitter comment error")
             return False
 
     async def follow(self, username: str) -> bool:
         """Follow a user with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
         try:
             await self.page.goto(f"https://x.com/{username}")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector(self.FOLLOW_BUTTON, timeout=5000)
+            except:
+                pass
             
             # View profile briefly
             await self.human.random_delay(2, 4)
             
             # Find and click follow button
-            follow_btn = await self.page.query_selector('button:has-text("Follow")')
+            follow_btn = await self.page.query_selector(self.FOLLOW_BUTTON)
             if follow_btn:
                 await self.human.hover(follow_btn)
                 await self.human.click_element(follow_btn)
+                # Confirmed when the button flips to "Following"
+                try:
+                    await self.page.wait_for_selector('button:has-text("Following")', timeout=5000)
+                except:
+                    pass
             
             await self.human.action_delay("follow")
             return True
             
-        except Exception as e:
-            print(f"Twitter follow error: {e}")
+        except Exception:
+            logger.exception("Twitter follow error")
             return False
 
     async def search(self, query: str, limit: int = 10) -> list[dict]:
         """Search tweets with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        cache_key = ("search", query, limit)
+        cached = self._cached_result(cache_key, self._SEARCH_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
-            # Navigate to search
-            await self.page.goto(f"https://x.com/search?q={query}&src=typed_query")
-            await self.human.timing.wait_for_page_load(self.page)
+            # Navigate to search; quote_plus keeps spaces/unicode from
+            # breaking the URL and forcing a redirect
+            await self.page.goto(
+                f"https://x.com/search?q={urllib.parse.quote_plus(query)}&src=typed_query"
+            )
+            try:
+                await self.page.wait_for_selector(self.TWEET_ARTICLE)
+            except:
+                pass
             
             # Let results load and scan
             await self.human.random_delay(2, 4)
             
-            results = []
-            tweets = await self.page.query_selector_all('article[data-testid="tweet"]')
-            
-            for tweet in tweets[:limit]:
-                try:
-                    username_elem = await tweet.query_selector('div[data-testid="User-Name"]')
-                    text_elem = await tweet.query_selector('div[data-testid="tweetText"]')
-                    
-                    results.append({
-                        "username": await username_elem.inner_text() if username_elem else "",
-                        "text": await text_elem.inner_text() if text_elem else "",
-                    })
-                except:
-                    continue
-            
+            # One protocol round trip for all tweets instead of four
+            # element calls per tweet
+            results = await self.page.eval_on_selector_all(
+                self.TWEET_ARTICLE,
+                f"""els => els.slice(0, {limit}).map(a => ({{
+                    username: a.querySelector('div[data-testid="User-Name"]')?.innerText || '',
+                    text: a.querySelector('div[data-testid="tweetText"]')?.innerText || '',
+                }}))""",
+            )
+            self._store_result(cache_key, results)
             return results
             
-        except Exception as e:
-            print(f"Twitter search error: {e}")
+        except Exception:
+            logger.exception("Twitter search error")
             return []
+        finally:
+            self.block_assets = False
 
     async def get_mentions(self, since_id: Optional[str] = None) -> list[dict]:
         """Get mentions with human-like behavior."""
-        if not self.is_logged_in:
-            await self.login()
+        cache_key = ("mentions", since_id)
+        cached = self._cached_result(cache_key, self._MENTIONS_CACHE_TTL)
+        if cached is not None:
+            return cached
+        
+        await self.ensure_logged_in()
         
         if not self.human:
             self.human = HumanBehavior(self.page)
         
+        self.block_assets = True
         try:
             await self.page.goto("https://x.com/notifications/mentions")
-            await self.human.timing.wait_for_page_load(self.page)
+            try:
+                await self.page.wait_for_selector(self.NOTIFICATION)
+            except:
+                pass
             
             # Read notifications like human
             await self.human.random_delay(2, 4)
             
-            mentions = []
-            notifications = await self.page.query_selector_all('div[data-testid="notification"]')
-            
-            for notif in notifications[:20]:
-                try:
-                    text = await notif.inner_text()
-                    mentions.append({"text": text})
-                except:
-                    continue
-            
+            texts = await self.page.eval_on_selector_all(
+                self.NOTIFICATION,
+                "els => els.slice(0, 20).map(e => e.innerText)",
+            )
+            mentions = [{"text": text} for text in texts]
+            self._store_result(cache_key, mentions)
             return mentions
             
-        except Exception as e:
-            print(f"Twitter mentions error: {e}")
+        except Exception:
+            logger.exception("Twitter mentions error")
             return []
+        finally:
+            self.block_assets = False
@@ -1,13 +1,24 @@
 """Post scheduler service for automated publishing."""
 
+import asyncio
+import functools
 import logging
 from datetime import datetime
-from typing import Optional
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
 
-from ..models.database import get_db, get_posts, update_post, log_activity
+from ..models.database import (
+    get_db,
+    get_due_posts,
+    get_post,
+    update_post,
+    log_activity,
+    increment_analytics,
+    refresh_daily_analytics,
+    prune_activity_logs,
+    prune_engagement_queue,
+)
 from ..platforms import get_platform_registry
 
 logger = logging.getLogger(__name__)
@@ -19,6 +30,10 @@ class PostScheduler:
     def __init__(self):
         self.scheduler = AsyncIOScheduler()
         self.is_running = False
+        # Bounds concurrent publishes so a burst of due posts doesn't
+        # open an unbounded number of browser contexts
+        self._publish_semaphore = asyncio.Semaphore(5)
+        self._registry = get_platform_registry()
 
     def start(self):
         """Start the scheduler."""
@@ -36,6 +51,25 @@ class PostScheduler:
                 replace_existing=True,
             )
 
+            # Periodically rebuild today's analytics roll-up so drifted
+            # counters self-correct
+            self.scheduler.add_job(
+                self.refresh_analytics,
+                'interval',
+                minutes=15,
+                id='refresh_analytics',
+                replace_existing=True,
+            )
+
+            # Keep the append-only tables bounded
+            self.scheduler.add_job(
+                self.prune_old_rows,
+                'interval',
+                hours=24,
+                id='prune_old_rows',
+                replace_existing=True,
+            )
+
     def stop(self):
         """Stop the scheduler."""
         if self.scheduler.running:
@@ -47,9 +81,8 @@ class PostScheduler:
         """Schedule a post for future publishing."""
         job_id = f"publish_post_{post_id}"
 
-        if job_id in [j.id for j in self.scheduler.get_jobs()]:
-            self.scheduler.remove_job(job_id)
-
+        # No pre-check needed: replace_existing=True below swaps any job
+        # with the same id, and get_jobs() was a linear scan per call
         self.scheduler.add_job(
             self.publish_post,
             trigger=DateTrigger(run_date=scheduled_at),
@@ -58,77 +91,135 @@ class PostScheduler:
             replace_existing=True,
         )
 
-        logger.info(f"Scheduled post {post_id} for {scheduled_at}")
+        logger.info("Scheduled post %s for %s", post_id, scheduled_at)
 
     def cancel_scheduled_post(self, post_id: int):
         """Cancel a scheduled post."""
         job_id = f"publish_post_{post_id}"
         try:
             self.scheduler.remove_job(job_id)
-            logger.info(f"Cancelled scheduled post {post_id}")
+            logger.info("Cancelled scheduled post %s", post_id)
         except:
             pass
 
     async def check_due_posts(self):
-        """Check for posts that are due to be published."""
+        """Check for posts that are due to be published.
+
+        One session serves the whole tick: the browser-side publishes
+        run concurrently and touch no session, then the outcomes are
+        recorded sequentially on the shared session — a savepoint per
+        post so a bad row rolls back alone, one commit total. That's
+        1 connection + N savepoints per tick instead of N+1 connections.
+        (Handing the session itself to the gather tasks would not be
+        safe: AsyncSession is not usable concurrently.)
+        """
         db = get_db()
         async with db.async_session_maker() as session:
-            posts = await get_posts(session, status="scheduled")
-            now = datetime.utcnow()
+            due = await get_due_posts(session, datetime.utcnow())
+            if not due:
+                return
 
-            for post in posts:
-                if post.scheduled_at and post.scheduled_at <= now:
-                    await self._publish_post(session, post)
+            # Concurrent: a burst of due posts takes as long as the
+            # slowest one, not their sum
+            results = await asyncio.gather(
+                *(self._attempt_publish(post) for post in due)
+            )
+
+            for post, error in results:
+                try:
+                    async with session.begin_nested():
+                        await self._record_publish(session, post, error)
+                except Exception:
+                    logger.exception("Could not record outcome for post %s", post.id)
+            await session.commit()
+
+    async def _attempt_publish(self, post):
+        """Run the browser-side publish for one post, bounded by the semaphore.
+
+        Returns (post, error) where error is None on success; never
+        raises, so a gather over these tasks always completes.
+        """
+        async with self._publish_semaphore:
+            try:
+                logger.info("Publishing post %s to %s", post.id, post.platform)
+                adapter = self._registry.get_adapter(post.platform, "", "")
+                await adapter.post(post.content)
+                logger.info("Successfully published post %s", post.id)
+                return post, None
+            except Exception as e:
+                logger.warning("Could not publish to %s: %s", post.platform, e)
+                return post, e
+
+    async def _record_publish(self, session, post, error):
+        """Write one publish outcome; transaction control stays with the caller."""
+        if error is None:
+            await update_post(session, post.id, commit=False, status="published")
+            await log_activity(
+                session, f"Published post {post.id}", platform=post.platform, commit=False
+            )
+            await increment_analytics(
+                session, post.product_id, post.platform, commit=False, posts_published=1
+            )
+        else:
+            await update_post(session, post.id, commit=False, status="failed")
+            await log_activity(
+                session,
+                f"Failed to publish post {post.id}: {error}",
+                platform=post.platform,
+                commit=False,
+            )
+            await increment_analytics(
+                session, post.product_id, post.platform, commit=False, posts_failed=1
+            )
+
+    async def refresh_analytics(self):
+        """Recompute today's analytics aggregates."""
+        db = get_db()
+        async with db.async_session_maker() as session:
+            refreshed = await refresh_daily_analytics(session)
+            logger.debug("Refreshed analytics for %s product/platform pairs", refreshed)
+
+    async def prune_old_rows(self):
+        """Drop activity logs and handled queue rows past retention."""
+        db = get_db()
+        async with db.async_session_maker() as session:
+            logs = await prune_activity_logs(session)
+            queue = await prune_engagement_queue(session)
+            if logs or queue:
+                logger.info("Pruned %s activity logs, %s engagement rows", logs, queue)
 
     async def publish_post(self, post_id: int):
         """Publish a single post."""
         db = get_db()
         async with db.async_session_maker() as session:
-            posts = await get_posts(session)
-            post = next((p for p in posts if p.id == post_id), None)
+            post = await get_post(session, post_id)
 
             if not post:
-                logger.error(f"Post {post_id} not found")
+                logger.error("Post %s not found", post_id)
                 return
 
-            await self._publish_post(session, post)
-
-    async def _publish_post(self, session, post):
-        """Internal method to publish a post."""
-        try:
-            logger.info(f"Publishing post {post.id} to {post.platform}")
-
-            registry = get_platform_registry()
-            adapter = registry.get_adapter(post.platform, "", "")
-
+            post, error = await self._attempt_publish(post)
             try:
-                await adapter.post(post.content)
-                await update_post(session, post.id, status="published")
-                await log_activity(session, f"Published post {post.id}", platform=post.platform)
-                logger.info(f"Successfully published post {post.id}")
+                await self._record_publish(session, post, error)
+                await session.commit()
             except Exception as e:
-                logger.warning(f"Could not publish to {post.platform}: {e}")
+                logger.error("Error recording publish of post %s: %s", post.id, e)
+                await session.rollback()
                 await update_post(session, post.id, status="failed")
-                await log_activity(session, f"Failed to publish post {post.id}: {str(e)}", platform=post.platform)
-
-        except Exception as e:
-            logger.error(f"Error publishing post {post.id}: {e}")
-            await update_post(session, post.id, status="failed")
 
     def get_scheduled_jobs(self):
         """Get list of scheduled jobs."""
         return self.scheduler.get_jobs()
 
 
-_post_scheduler: Optional[PostScheduler] = None
-
-
+@functools.lru_cache(maxsize=1)
 def get_post_scheduler() -> PostScheduler:
-    """Get post scheduler instance."""
-    global _post_scheduler
-    if _post_scheduler is None:
-        _post_scheduler = PostScheduler()
-    return _post_scheduler
+    """Get post scheduler instance.
+
+    lru_cache makes the lazy init atomic — the global-with-None-check it
+    replaces could build two schedulers under concurrent first calls.
+    """
+    return PostScheduler()
 
 
 def start_scheduler():
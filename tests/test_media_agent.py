@@ -92,6 +92,26 @@ class TestFAQMatcher:
         )
         assert score == 0.0
 
+    def test_keyword_match_counts_prefix_terms(self):
+        from src.media_agent.content.faq_matcher import FAQMatcher
+
+        matcher = FAQMatcher()
+
+        # "pric" is a prefix of "pricing"; both occur in the query and
+        # both must count, like the plain substring checks did
+        score = matcher._calculate_keyword_score(
+            "What is the pricing?",
+            "pric, pricing, cost"
+        )
+        assert score == 2 / 3
+
+        # Duplicate keywords must not inflate the denominator
+        score = matcher._calculate_keyword_score(
+            "Yes to y",
+            "y, y"
+        )
+        assert score == 1.0
+
     def test_text_similarity(self):
         from src.media_agent.content.faq_matcher import FAQMatcher
         
@@ -104,6 +124,26 @@ class TestFAQMatcher:
         assert score > 0
 
 
+class TestKeywordAutomaton:
+    """Test multi-keyword matching."""
+
+    def test_find_distinct(self):
+        from src.media_agent.content.keyword_automaton import KeywordAutomaton
+
+        automaton = KeywordAutomaton(["link in bio", "linktree", "influencer"])
+
+        found = automaton.find_distinct("I use Linktree as my link in bio tool")
+        assert found == {0, 1}
+
+    def test_contains_any(self):
+        from src.media_agent.content.keyword_automaton import KeywordAutomaton
+
+        automaton = KeywordAutomaton(["pricing", "cost"])
+
+        assert automaton.contains_any("What is the pricing?")
+        assert not automaton.contains_any("Hello world")
+
+
 class TestAIEngine:
     """Test AI engine."""
 
@@ -175,3 +215,96 @@ class TestDatabase:
         
         db = Database()
         assert db.engine is not None
+
+
+class TestSemanticResponseCache:
+    """Test semantic response cache."""
+
+    def test_paraphrase_hit(self):
+        from src.media_agent.engagement.response_cache import SemanticResponseCache
+
+        cache = SemanticResponseCache(similarity_threshold=0.6)
+        cache.put(1, "friendly", "how do I reset my password?", "Use the reset link!")
+
+        assert cache.get(1, "friendly", "how do I reset my password please?") == "Use the reset link!"
+
+    def test_scope_and_miss(self):
+        from src.media_agent.engagement.response_cache import SemanticResponseCache
+
+        cache = SemanticResponseCache(similarity_threshold=0.6)
+        cache.put(1, "friendly", "how do I reset my password?", "Use the reset link!")
+
+        # Different product must not share answers
+        assert cache.get(2, "friendly", "how do I reset my password?") is None
+        # Unrelated question must miss
+        assert cache.get(1, "friendly", "what are your prices?") is None
+
+
+class TestQueryCounts:
+    """Pin the number of SQL statements hot helpers are allowed to issue."""
+
+    @staticmethod
+    def _count_queries(engine):
+        import contextlib
+        from sqlalchemy import event
+
+        @contextlib.contextmanager
+        def counter():
+            statements = []
+
+            def _record(conn, cursor, statement, parameters, context, executemany):
+                statements.append(statement)
+
+            event.listen(engine.sync_engine, "before_cursor_execute", _record)
+            try:
+                yield statements
+            finally:
+                event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+        return counter()
+
+    @staticmethod
+    async def _make_session():
+        from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from src.media_agent.models import Base
+
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        maker = async_sessionmaker(engine, expire_on_commit=False)
+        return engine, maker
+
+    @pytest.mark.asyncio
+    async def test_analytics_summary_is_one_query(self):
+        from src.media_agent.models.database import get_analytics_summary
+
+        engine, maker = await self._make_session()
+        async with maker() as session:
+            with self._count_queries(engine) as statements:
+                await get_analytics_summary(session)
+        assert len(statements) == 1
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_products_with_related_avoid_n_plus_one(self):
+        from src.media_agent.models.database import (
+            create_product, create_faq, create_post, get_products,
+        )
+
+        engine, maker = await self._make_session()
+        async with maker() as session:
+            for i in range(3):
+                product = await create_product(session, f"Product {i}")
+                await create_faq(session, product.id, "Q?", "A.")
+                await create_post(session, product.id, "content")
+
+            with self._count_queries(engine) as statements:
+                products = await get_products(session, include_related=True)
+                for product in products:
+                    assert product.faqs and product.posts
+
+        # One SELECT for products plus one selectinload per relationship,
+        # regardless of how many products exist
+        selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+        assert len(selects) <= 4
+        await engine.dispose()
@@ -1,6 +1,11 @@
 """MediaAgent UI - Redesigned Dashboard."""
 
+import asyncio
+import functools
 import sys
+import time
+from datetime import datetime, timedelta
+from collections import Counter, defaultdict
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -23,22 +28,125 @@ from media_agent.models.database import (
     create_faq,
     get_faqs,
     get_leads,
+    get_dashboard_counts,
+    count_posts,
+    count_leads,
     save_platform_credential,
     get_connected_platforms,
 )
-from media_agent.agents.ai_engine import get_ai_engine
-from media_agent.discovery.discovery import get_lead_discovery
+# Heavy modules (AI client, Playwright-based discovery) are imported at
+# function scope in their handlers so page boot doesn't pay for their
+# import chains
 from media_agent.scheduler.scheduler import start_scheduler, get_post_scheduler
-from media_agent.models.database import create_lead
+from media_agent.models.database import create_lead, update_product_fields
+# Cheap import: the platforms package defers adapter (Playwright) imports
+# until an adapter is actually requested
+from media_agent.platforms import get_platform_registry
+
+# Singleton bound once at import; render paths read is_running off this
+# reference instead of re-calling the accessor on every visit
+post_scheduler = get_post_scheduler()
+
+
+# Shared card chrome. NiceGUI element trees are built per client slot
+# on every render, so cards can't be memoized as fragments; the cheap
+# wins are precomputed counts (see get_dashboard_counts) and reusing
+# these literals instead of re-creating them per card.
+CARD_STYLE = "background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"
+
+# Per-post lookups hoisted out of render loops so the dicts aren't
+# rebuilt for every card
+PLATFORM_EMOJI = {"twitter": "🐦", "instagram": "📷", "linkedin": "💼", "facebook": "📘"}
+POST_STATUS_COLOR = {"published": "green", "scheduled": "orange"}
+
+
+async def batch_iter(items, batch_size: int = 5):
+    """Yield items while yielding the event loop between batches.
+
+    Long card lists are built element-by-element; ceding control every
+    few items lets NiceGUI flush already-built elements to the client
+    so the first batch paints while the rest are constructed.
+    """
+    for i, item in enumerate(items):
+        if i and i % batch_size == 0:
+            await asyncio.sleep(0)
+        yield item
+
+
+@functools.lru_cache(maxsize=1)
+def _session_maker():
+    """Resolve the shared async_sessionmaker once.
+
+    Every handler opens sessions through this instead of re-resolving
+    the Database singleton and its attribute per click; the lru_cache
+    keeps resolution lazy so import order doesn't matter.
+    """
+    return get_db().async_session_maker
+
+
+async def _fetch(query, *args, **kwargs):
+    """Run one database helper in its own short-lived session.
+
+    Lets pages gather independent queries concurrently: a single
+    AsyncSession cannot be shared across tasks, so each gather branch
+    checks out its own session from the pool.
+    """
+    async with _session_maker()() as session:
+        return await query(session, *args, **kwargs)
+
+
+# Products barely change mid-session; a short TTL keeps dialog opens off
+# the connection pool without serving stale data for long
+_PRODUCT_CACHE_TTL = 30.0
+_product_cache: dict[int, tuple[float, object]] = {}
+
+
+async def get_product_cached(product_id: int):
+    """Get a product for dialog display, cached for a short TTL.
+
+    Dialog-open reads hit this instead of checking out a session per
+    click; writes invalidate via invalidate_product_cache.
+    """
+    cached = _product_cache.get(product_id)
+    if cached and time.monotonic() - cached[0] < _PRODUCT_CACHE_TTL:
+        return cached[1]
+    from media_agent.models.database import get_product_with_context
+    product = await _fetch(get_product_with_context, product_id)
+    if product is not None:
+        _product_cache[product_id] = (time.monotonic(), product)
+    return product
+
+
+def invalidate_product_cache(product_id: int):
+    """Drop a cached product after it is edited or deleted."""
+    _product_cache.pop(product_id, None)
+
+
+def save_settings_clicked():
+    """Drop cached config so the next read reflects edited .env/files."""
+    from media_agent.config import clear_config_cache
+
+    clear_config_cache()
+    ui.notify("Settings saved! Add to .env for persistence")
 
 
 async def init_app():
     """Initialize the application."""
     db = get_db()
     await db.init_db()
+    await db.warm_pool()
     start_scheduler()
 
 
+async def shutdown_app():
+    """Release shared resources on shutdown."""
+    from media_agent.agents.ai_engine import get_ai_engine
+    from media_agent.platforms import shutdown_browser_pool
+
+    await get_ai_engine().aclose()
+    await shutdown_browser_pool()
+
+
 # ============== SIDEBAR ==============
 SIDEBAR_WIDTH = "260px"
 
@@ -49,8 +157,7 @@ def render_sidebar():
     """Render the sidebar navigation."""
     global _sidebar_visible
     
-    scheduler = get_post_scheduler()
-    is_running = scheduler.is_running
+    is_running = post_scheduler.is_running
     
     # Sidebar container - fixed position
     with ui.element("div").classes("fixed top-0 left-0 h-full z-40").style(f"width: {SIDEBAR_WIDTH}; background: linear-gradient(180deg, #1e293b 0%, #0f172a 100%);"):
@@ -84,12 +191,11 @@ def render_sidebar():
                 ui.label(f"Automation: {'Running' if is_running else 'Stopped'}").classes("text-sm text-gray-300")
             
             async def toggle_automation():
-                scheduler = get_post_scheduler()
-                if scheduler.is_running:
-                    scheduler.stop()
+                if post_scheduler.is_running:
+                    post_scheduler.stop()
                     ui.notify("Automation stopped")
                 else:
-                    scheduler.start()
+                    post_scheduler.start()
                     ui.notify("Automation started")
             
             ui.button("Toggle", on_click=toggle_automation).props("flat").classes("mt-2 w-full text-gray-400 hover:text-white")
@@ -107,12 +213,11 @@ def toggle_sidebar():
 
 def toggle_scheduler_sidebar():
     """Toggle scheduler from sidebar."""
-    scheduler = get_post_scheduler()
-    if scheduler.is_running:
-        scheduler.stop()
+    if post_scheduler.is_running:
+        post_scheduler.stop()
         ui.notify("Automation stopped")
     else:
-        scheduler.start()
+        post_scheduler.start()
         ui.notify("Automation started")
 
 
@@ -204,14 +309,13 @@ def process_chat_message(message: str) -> tuple[str, str]:
     message_lower = message.lower()
     
     # Get app context
-    db = get_db()
     products = []
     connected_platforms = []
-    
+
     try:
         async def get_context():
             nonlocal products, connected_platforms
-            async with db.async_session_maker() as session:
+            async with _session_maker()() as session:
                 products = await get_products(session)
                 connected_platforms = await get_connected_platforms(session)
         
@@ -260,8 +364,7 @@ Just tell me what you'd like to do!""", "none"
     
     # Check status intents
     if any(word in message_lower for word in ["status", "running", "automation", "connected", "check"]):
-        scheduler = get_post_scheduler()
-        status = "Running" if scheduler.is_running else "Stopped"
+        status = "Running" if post_scheduler.is_running else "Stopped"
         platforms = ", ".join(connected_platforms) if connected_platforms else "No platforms connected"
         return f"""Here's your current status:
 
@@ -325,12 +428,11 @@ Would you like me to create any of these?""", "none"
     
     # Toggle automation
     if any(word in message_lower for word in ["start automation", "stop automation", "toggle automation", "start posting", "stop posting"]):
-        scheduler = get_post_scheduler()
-        if scheduler.is_running:
-            scheduler.stop()
+        if post_scheduler.is_running:
+            post_scheduler.stop()
             return "🛑 Automation stopped.", "none"
         else:
-            scheduler.start()
+            post_scheduler.start()
             return "▶️ Automation started!", "none"
     
     # Default response
@@ -380,9 +482,7 @@ async def render_calendar():
     """Render content calendar."""
     render_sidebar()
     render_chat_widget()
-    
-    from datetime import datetime, timedelta
-    
+
     # Header
     with ui.row().classes("w-full items-center justify-between mb-6"):
         with ui.row().classes("items-center gap-4"):
@@ -404,10 +504,26 @@ async def render_calendar():
     first_day_weekday = current_month.weekday()  # 0 = Monday
     
     # Get all scheduled posts
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         posts = await get_posts(session, status="scheduled")
-        
+        # Upcoming list: let the DB order and cap the rows so only 15
+        # leave the database, instead of sorting every scheduled post here
+        upcoming = await get_posts(
+            session,
+            status="scheduled",
+            scheduled_after=now,
+            order_by="scheduled_at",
+            limit=15,
+        )
+
+    # Bucket posts by day once, instead of scanning the full post list
+    # inside every one of the ~42 calendar cells
+    posts_by_day = defaultdict(list)
+    for p in posts:
+        if p.scheduled_at:
+            posts_by_day[p.scheduled_at.date()].append(p)
+    today = now.date()
+
     # Create calendar
     weekdays = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
     
@@ -416,7 +532,10 @@ async def render_calendar():
         for day in weekdays:
             ui.label(day).classes("text-center font-bold text-sm text-gray-500")
     
-    # Calendar days
+    # Calendar days. Precompute the two class-string variants per element
+    # once, indexed by is_today, instead of an f-string per cell
+    cell_cls = ("h-20 p-1", "h-20 p-1 bg-blue-50")
+    day_cls = ("text-xs font-bold text-gray-500", "text-xs font-bold text-blue-600")
     day_num = 1
     for week in range(6):
         with ui.grid(columns=7).classes("w-full gap-1"):
@@ -428,17 +547,17 @@ async def render_calendar():
                     ui.label("").classes("h-20 p-1")
                 else:
                     # Day cell
-                    day_date = current_month.replace(day=day_num)
-                    day_posts = [p for p in posts if p.scheduled_at and p.scheduled_at.date() == day_date.date()]
-                    
-                    is_today = day_date.date() == now.date()
+                    day_date = today.replace(day=day_num)
+                    day_posts = posts_by_day.get(day_date, ())
+
+                    is_today = day_date == today
                     
-                    with ui.card().classes(f"h-20 p-1 {'bg-blue-50' if is_today else ''}"):
-                        ui.label(f"{day_num}").classes(f"text-xs font-bold {'text-blue-600' if is_today else 'text-gray-500'}")
+                    with ui.card().classes(cell_cls[is_today]):
+                        ui.label(f"{day_num}").classes(day_cls[is_today])
                         
                         # Show up to 2 posts
                         for post in day_posts[:2]:
-                            platform_emoji = {"twitter": "🐦", "instagram": "📷", "linkedin": "💼", "facebook": "📘"}.get(post.platform, "📝")
+                            platform_emoji = PLATFORM_EMOJI.get(post.platform, "📝")
                             ui.label(f"{platform_emoji} {post.content[:20]}...").classes("text-xs truncate")
                         
                         if len(day_posts) > 2:
@@ -452,16 +571,9 @@ async def render_calendar():
     # Posts list below calendar
     with ui.card().classes("w-full p-4 mt-4"):
         ui.label("Upcoming Scheduled Posts").classes("text-lg font-bold mb-4")
-        
-        # Get scheduled posts
-        db = get_db()
-        async with db.async_session_maker() as session:
-            posts = await get_posts(session, status="scheduled")
-            upcoming = [p for p in posts if p.scheduled_at]
-            upcoming.sort(key=lambda x: x.scheduled_at)
-        
+
         if upcoming:
-            for post in upcoming[:15]:
+            async for post in batch_iter(upcoming):
                 with ui.card().classes("p-2 mb-2 w-full"):
                     with ui.row().classes("w-full justify-between"):
                         ui.label(f"{post.scheduled_at.strftime('%Y-%m-%d %H:%M')}").classes("text-sm font-bold")
@@ -481,19 +593,25 @@ async def templates_page():
 async def render_templates():
     render_sidebar()
     render_chat_widget()
-    
-    from media_agent.models.database import get_templates
-    
+
     with ui.row().classes("w-full items-center mb-6"):
         ui.button(icon="arrow_back", on_click=lambda: navigate("home")).props("flat round")
         ui.label("Post Templates").classes("text-3xl font-bold")
-    
+
     ui.button("New Template", icon="add", on_click=show_template_dialog).props("color=primary")
-    
-    db = get_db()
-    async with db.async_session_maker() as session:
+
+    await templates_list()
+
+
+@ui.refreshable
+async def templates_list():
+    """Template cards only; mutations call templates_list.refresh() so
+    the header and sidebar aren't rebuilt via a full page navigation."""
+    from media_agent.models.database import get_templates
+
+    async with _session_maker()() as session:
         templates = await get_templates(session)
-    
+
     if templates:
         with ui.grid(columns=2).classes("w-full gap-4 mt-4"):
             for t in templates:
@@ -519,12 +637,11 @@ async def show_template_dialog():
         
         async def save():
             if name.value and content.value:
-                db = get_db()
-                async with db.async_session_maker() as session:
+                async with _session_maker()() as session:
                     await create_template(session, 1, name.value, content.value, platform.value, category.value)
                 dialog.close()
                 ui.notify("Template created!")
-                ui.navigate.to("/templates")
+                await templates_list.refresh()
         
         with ui.row().classes("w-full justify-end gap-2"):
             ui.button("Cancel", on_click=dialog.close).props("flat")
@@ -533,12 +650,11 @@ async def show_template_dialog():
 
 
 async def del_template(tid):
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         from media_agent.models.database import delete_template
         await delete_template(session, tid)
     ui.notify("Deleted")
-    ui.navigate.to("/templates")
+    await templates_list.refresh()
 
 
 # ============== CAMPAIGNS PAGE ==============
@@ -551,19 +667,24 @@ async def campaigns_page():
 async def render_campaigns():
     render_sidebar()
     render_chat_widget()
-    
-    from media_agent.models.database import get_campaigns
-    
+
     with ui.row().classes("w-full items-center mb-6"):
         ui.button(icon="arrow_back", on_click=lambda: navigate("home")).props("flat round")
         ui.label("Campaigns").classes("text-3xl font-bold")
-    
+
     ui.button("New Campaign", icon="add", on_click=show_campaign_dialog).props("color=primary")
-    
-    db = get_db()
-    async with db.async_session_maker() as session:
+
+    await campaigns_list()
+
+
+@ui.refreshable
+async def campaigns_list():
+    """Campaign cards only; refreshed in place after mutations."""
+    from media_agent.models.database import get_campaigns
+
+    async with _session_maker()() as session:
         campaigns = await get_campaigns(session)
-    
+
     if campaigns:
         for c in campaigns:
             with ui.card().classes("p-4 mb-4 w-full"):
@@ -586,12 +707,11 @@ async def show_campaign_dialog():
         
         async def save():
             if name.value:
-                db = get_db()
-                async with db.async_session_maker() as session:
+                async with _session_maker()() as session:
                     await create_campaign(session, 1, name.value, desc.value or "")
                 dialog.close()
                 ui.notify("Campaign created!")
-                ui.navigate.to("/campaigns")
+                await campaigns_list.refresh()
         
         with ui.row().classes("w-full justify-end gap-2"):
             ui.button("Cancel", on_click=dialog.close).props("flat")
@@ -600,12 +720,11 @@ async def show_campaign_dialog():
 
 
 async def del_campaign(cid):
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         from media_agent.models.database import delete_campaign
         await delete_campaign(session, cid)
     ui.notify("Deleted")
-    ui.navigate.to("/campaigns")
+    await campaigns_list.refresh()
 
 
 # ============== ENGAGEMENT QUEUE PAGE ==============
@@ -618,19 +737,26 @@ async def engagement_page():
 async def render_engagement():
     render_sidebar()
     render_chat_widget()
-    
-    from media_agent.models.database import get_engagement_queue
-    
+
     with ui.row().classes("w-full items-center mb-6"):
         ui.button(icon="arrow_back", on_click=lambda: navigate("home")).props("flat round")
         ui.label("Engagement Queue").classes("text-3xl font-bold")
-    
+
     ui.label("Pending responses to mentions and comments").classes("text-gray-500 mb-4")
-    
-    db = get_db()
-    async with db.async_session_maker() as session:
-        items = await get_engagement_queue(session, status="pending")
-    
+
+    await engagement_list()
+
+
+@ui.refreshable
+async def engagement_list():
+    """Pending-item cards only; refreshed in place after each action."""
+    from media_agent.models.database import get_engagement_queue
+
+    async with _session_maker()() as session:
+        # Eager-load products so gen_response can read item.product
+        # without another query per item
+        items = await get_engagement_queue(session, status="pending", load_product=True)
+
     if items:
         for item in items:
             with ui.card().classes("p-4 mb-4 w-full"):
@@ -656,36 +782,37 @@ async def render_engagement():
 async def gen_response(item):
     from media_agent.agents.ai_engine import get_ai_engine
     ai = get_ai_engine()
-    
-    db = get_db()
-    async with db.async_session_maker() as session:
-        from media_agent.models.database import get_product
-        product = await get_product(session, item.product_id)
-        
-        if product:
-            response = await ai.generate_response(
-                product.name, product.description or "",
-                product.brand_voice, item.source_content
-            )
-            await update_engagement_item(session, item.id, generated_response=response, response_source="ai")
-            ui.notify("Response generated!")
-            ui.navigate.to("/engagement")
+
+    # Already loaded by get_engagement_queue(load_product=True)
+    product = item.product
+    if not product:
+        return
+
+    # Await the slow LLM call with no session checked out, so a pool
+    # connection isn't held hostage for the seconds it takes
+    response = await ai.generate_response(
+        product.name, product.description or "",
+        product.brand_voice, item.source_content
+    )
+
+    async with _session_maker()() as session:
+        await update_engagement_item(session, item.id, generated_response=response, response_source="ai")
+    ui.notify("Response generated!")
+    await engagement_list.refresh()
 
 
 async def send_response(item):
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         await update_engagement_item(session, item.id, status="sent")
     ui.notify("Response sent!")
-    ui.navigate.to("/engagement")
+    await engagement_list.refresh()
 
 
 async def ignore_item(item):
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         await update_engagement_item(session, item.id, status="ignored")
     ui.notify("Ignored")
-    ui.navigate.to("/engagement")
+    await engagement_list.refresh()
 
 
 # ============== HOME PAGE ==============
@@ -708,53 +835,56 @@ async def render_home():
             with ui.row().classes("gap-2"):
                 ui.button("Add Product", icon="add", on_click=show_add_product_dialog).props("color=primary")
         
-        db = get_db()
-        async with db.async_session_maker() as session:
+        async with _session_maker()() as session:
             products = await get_products(session)
-        
+            # One set of grouped counts feeds every product card below,
+            # instead of three queries per card
+            counts = await get_dashboard_counts(session)
+
         if not products:
-            with ui.card().classes("w-full p-12 text-center").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+            with ui.card().classes("w-full p-12 text-center").style(CARD_STYLE):
                 ui.icon("rocket_launch", size="64px").classes("text-gray-300 mb-4")
                 ui.label("Welcome to MediaAgent!").classes("text-2xl font-bold mb-2")
                 ui.label("Add your first product to get started").classes("text-gray-500 mb-4")
                 ui.button("Add Product", icon="add", on_click=show_add_product_dialog).props("color=primary")
             return
         
-        # Quick stats
-        async with db.async_session_maker() as session:
-            total_posts = await get_posts(session)
-            total_leads = await get_leads(session)
-            scheduled = len([p for p in total_posts if p.status == "scheduled"])
-            published = len([p for p in total_posts if p.status == "published"])
+        # Quick stats: SQL counts fetched concurrently — no post rows
+        # cross the wire just to be len()'d
+        published, scheduled, total_leads = await asyncio.gather(
+            _fetch(count_posts, status="published"),
+            _fetch(count_posts, status="scheduled"),
+            _fetch(count_leads),
+        )
         
         # Stats cards
         with ui.grid(columns=4).classes("w-full gap-4"):
-            with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+            with ui.card().classes("p-4").style(CARD_STYLE):
                 with ui.column().classes("text-center"):
                     ui.icon("inventory_2", size="32px").classes("text-indigo-500 mb-2")
                     ui.label(f"{len(products)}").classes("text-3xl font-bold text-indigo-600")
                     ui.label("Products").classes("text-sm text-gray-500")
             
-            with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+            with ui.card().classes("p-4").style(CARD_STYLE):
                 with ui.column().classes("text-center"):
                     ui.icon("publish", size="32px").classes("text-green-500 mb-2")
                     ui.label(f"{published}").classes("text-3xl font-bold text-green-600")
                     ui.label("Published Posts").classes("text-sm text-gray-500")
             
-            with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+            with ui.card().classes("p-4").style(CARD_STYLE):
                 with ui.column().classes("text-center"):
                     ui.icon("schedule", size="32px").classes("text-orange-500 mb-2")
                     ui.label(f"{scheduled}").classes("text-3xl font-bold text-orange-600")
                     ui.label("Scheduled").classes("text-sm text-gray-500")
             
-            with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+            with ui.card().classes("p-4").style(CARD_STYLE):
                 with ui.column().classes("text-center"):
                     ui.icon("people", size="32px").classes("text-purple-500 mb-2")
-                    ui.label(f"{len(total_leads)}").classes("text-3xl font-bold text-purple-600")
+                    ui.label(f"{total_leads}").classes("text-3xl font-bold text-purple-600")
                     ui.label("Leads").classes("text-sm text-gray-500")
         
         # Quick actions
-        with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+        with ui.card().classes("p-4").style(CARD_STYLE):
             ui.label("Quick Actions").classes("text-lg font-bold mb-4")
             with ui.row().classes("gap-3"):
                 ui.button("View Calendar", icon="calendar_month", on_click=lambda: navigate("calendar")).props("flat color=indigo")
@@ -767,23 +897,18 @@ async def render_home():
         
         with ui.grid(columns=3).classes("w-full gap-4 mt-4"):
             for product in products:
-                await render_product_card_dashboard(product)
-    
+                render_product_card_dashboard(product, counts)
+
     with ui.grid(columns=2).classes("w-full gap-4"):
         for product in products:
-            await render_product_card(product)
+            render_product_card(product, counts)
 
 
-async def render_product_card(product):
-    """Render a product card with stats."""
-    db = get_db()
-    async with db.async_session_maker() as session:
-        posts = await get_posts(session, product_id=product.id)
-        leads = await get_leads(session, product_id=product.id)
-        faqs = await get_faqs(session, product.id)
-        
-        published = len([p for p in posts if p.status == "published"])
-        scheduled = len([p for p in posts if p.status == "scheduled"])
+def render_product_card(product, counts):
+    """Render a product card from pre-aggregated dashboard counts."""
+    stats = counts.get(product.id, {})
+    published = stats.get("published", 0)
+    scheduled = stats.get("scheduled", 0)
 
     with ui.card().classes("p-4 cursor-pointer hover:shadow-lg transition-shadow").on('click', lambda p=product: navigate("product", p.id)):
         with ui.column().classes("w-full"):
@@ -805,24 +930,20 @@ async def render_product_card(product):
                     ui.label(f"{scheduled}").classes("text-xl font-bold text-orange-600")
                     ui.label("Scheduled").classes("text-xs text-gray-400")
                 with ui.column().classes("text-center"):
-                    ui.label(f"{len(leads)}").classes("text-xl font-bold text-purple-600")
+                    ui.label(f"{stats.get('leads', 0)}").classes("text-xl font-bold text-purple-600")
                     ui.label("Leads").classes("text-xs text-gray-400")
                 with ui.column().classes("text-center"):
-                    ui.label(f"{len(faqs)}").classes("text-xl font-bold text-blue-600")
+                    ui.label(f"{stats.get('faqs', 0)}").classes("text-xl font-bold text-blue-600")
                     ui.label("FAQs").classes("text-xs text-gray-400")
 
 
-async def render_product_card_dashboard(product):
-    """Render a product card for dashboard view."""
-    db = get_db()
-    async with db.async_session_maker() as session:
-        posts = await get_posts(session, product_id=product.id)
-        leads = await get_leads(session, product_id=product.id)
-        
-        published = len([p for p in posts if p.status == "published"])
-        scheduled = len([p for p in posts if p.status == "scheduled"])
-    
-    with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+def render_product_card_dashboard(product, counts):
+    """Render a dashboard product card from pre-aggregated counts."""
+    stats = counts.get(product.id, {})
+    published = stats.get("published", 0)
+    scheduled = stats.get("scheduled", 0)
+
+    with ui.card().classes("p-4").style(CARD_STYLE):
         with ui.column().classes("w-full"):
             with ui.row().classes("w-full justify-between items-center mb-2"):
                 ui.label(product.name).classes("text-lg font-bold text-gray-800")
@@ -839,7 +960,7 @@ async def render_product_card_dashboard(product):
                     ui.label(f"{scheduled}").classes("text-lg font-bold text-orange-600")
                     ui.label("Scheduled").classes("text-xs text-gray-500")
                 with ui.card().classes("p-2 text-center").style("background: #faf5ff; border-radius: 8px;"):
-                    ui.label(f"{len(leads)}").classes("text-lg font-bold text-purple-600")
+                    ui.label(f"{stats.get('leads', 0)}").classes("text-lg font-bold text-purple-600")
                     ui.label("Leads").classes("text-xs text-gray-500")
 
 
@@ -855,8 +976,7 @@ async def render_product_detail(product_id: int):
     render_sidebar()
     render_chat_widget()
     
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         product = await get_product(session, product_id)
         if not product:
             with ui.column().classes("p-6"):
@@ -900,16 +1020,19 @@ async def render_product_detail(product_id: int):
 
 async def render_product_overview(product):
     """Render product overview with analytics."""
-    db = get_db()
-    async with db.async_session_maker() as session:
-        posts = await get_posts(session, product_id=product.id)
-        leads = await get_leads(session, product_id=product.id)
-        faqs = await get_faqs(session, product.id)
-        connected_platforms = await get_connected_platforms(session)
-        
-        published = [p for p in posts if p.status == "published"]
-        scheduled = [p for p in posts if p.status == "scheduled"]
-        engaged_leads = [l for l in leads if l.status == "engaged"]
+    # Independent queries: run them concurrently so the page waits for
+    # the slowest one, not the sum of all four
+    posts, leads, faqs, connected_platforms = await asyncio.gather(
+        _fetch(get_posts, product_id=product.id),
+        _fetch(get_leads, product_id=product.id),
+        _fetch(get_faqs, product.id),
+        _fetch(get_connected_platforms),
+    )
+
+    # Count statuses in one pass without materializing filtered lists
+    status_counts = Counter(p.status for p in posts)
+    published = status_counts.get("published", 0)
+    scheduled = status_counts.get("scheduled", 0)
 
     # Stats cards
     with ui.grid(columns=4).classes("w-full gap-4 mb-6"):
@@ -919,11 +1042,11 @@ async def render_product_overview(product):
         
         with ui.card().classes("p-4"):
             ui.label("Published").classes("text-sm text-gray-500")
-            ui.label(f"{len(published)}").classes("text-2xl font-bold text-green-600")
+            ui.label(f"{published}").classes("text-2xl font-bold text-green-600")
         
         with ui.card().classes("p-4"):
             ui.label("Scheduled").classes("text-sm text-gray-500")
-            ui.label(f"{len(scheduled)}").classes("text-2xl font-bold text-orange-600")
+            ui.label(f"{scheduled}").classes("text-2xl font-bold text-orange-600")
         
         with ui.card().classes("p-4"):
             ui.label("Leads").classes("text-sm text-gray-500")
@@ -973,8 +1096,7 @@ async def render_product_overview(product):
 
 async def render_product_posts(product_id):
     """Render posts for a product."""
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         posts = await get_posts(session, product_id=product_id)
 
     with ui.row().classes("w-full justify-between mb-4"):
@@ -985,8 +1107,8 @@ async def render_product_posts(product_id):
         ui.label("No posts yet. Create your first post!").classes("text-gray-500")
         return
 
-    for post in posts:
-        status_color = "green" if post.status == "published" else "orange" if post.status == "scheduled" else "gray"
+    async for post in batch_iter(posts):
+        status_color = POST_STATUS_COLOR.get(post.status, "gray")
         with ui.card().classes("p-3 mb-2 w-full"):
             with ui.row().classes("w-full justify-between"):
                 ui.label(post.content[:100] + "...").classes("text-sm flex-1")
@@ -999,8 +1121,7 @@ async def render_product_posts(product_id):
 
 async def render_product_leads(product_id):
     """Render leads for a product."""
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         leads = await get_leads(session, product_id=product_id)
 
     with ui.row().classes("w-full justify-between mb-4"):
@@ -1022,8 +1143,7 @@ async def render_product_leads(product_id):
 
 async def render_product_faqs(product_id):
     """Render FAQs for a product."""
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         faqs = await get_faqs(session, product_id)
 
     with ui.row().classes("w-full justify-between mb-4"):
@@ -1058,7 +1178,7 @@ async def render_product_automation(product):
         for platform_id, platform_name, icon, color in platforms:
             platform_settings = settings.get_platform_settings(platform_id)
             
-            with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+            with ui.card().classes("p-4").style(CARD_STYLE):
                 with ui.column().classes("w-full gap-4"):
                     with ui.row().classes("w-full justify-between items-center"):
                         with ui.row().classes("items-center gap-3"):
@@ -1108,7 +1228,7 @@ async def render_product_automation(product):
                     ui.button("Save Settings", icon="save", on_click=save_platform_settings).props(f"color={color}")
         
         # Advanced settings link
-        with ui.card().classes("p-4").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+        with ui.card().classes("p-4").style(CARD_STYLE):
             with ui.row().classes("w-full justify-between items-center"):
                 ui.label("Advanced Settings").classes("font-bold")
                 ui.label("Human behavior, typing speed, delays").classes("text-sm text-gray-500")
@@ -1131,7 +1251,7 @@ async def render_settings():
         ui.label("Settings").classes("text-2xl font-bold text-gray-800")
         
         # AI Configuration
-        with ui.card().classes("p-6").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+        with ui.card().classes("p-6").style(CARD_STYLE):
             ui.label("AI Configuration").classes("text-xl font-bold mb-4")
             settings = get_settings()
             
@@ -1143,15 +1263,14 @@ async def render_settings():
             
             ui.label("AI Model: " + settings.openrouter_model).classes("text-sm mb-4")
             
-            ui.button("Save Settings", on_click=lambda: ui.notify("Settings saved! Add to .env for persistence")).props("color=primary")
+            ui.button("Save Settings", on_click=save_settings_clicked).props("color=primary")
         
         # Automation Settings
-        with ui.card().classes("p-6").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+        with ui.card().classes("p-6").style(CARD_STYLE):
             ui.label("Automation & Rate Limits").classes("text-xl font-bold mb-4")
             
             current_settings = get_rate_limiter_settings()
-            scheduler = get_post_scheduler()
-            is_running = scheduler.is_running
+            is_running = post_scheduler.is_running
             
             with ui.row().classes("w-full justify-between items-center mb-4"):
                 with ui.row().classes("items-center gap-2"):
@@ -1186,7 +1305,7 @@ async def render_settings():
             ui.button("Save Limits", icon="save", on_click=save_limits).props("color=primary").classes("mt-4")
         
         # Human Behavior Settings
-        with ui.card().classes("p-6").style("background: white; border-radius: 12px; box-shadow: 0 1px 3px rgba(0,0,0,0.1);"):
+        with ui.card().classes("p-6").style(CARD_STYLE):
             ui.label("Human Behavior Settings").classes("text-xl font-bold mb-4")
             ui.label("Make automation appear more human to avoid detection").classes("text-sm text-gray-500 mb-4")
             
@@ -1260,21 +1379,12 @@ async def render_settings():
         
         ui.label("AI Model: " + settings.openrouter_model).classes("text-sm mb-4")
         
-        ui.button("Save Settings", on_click=lambda: ui.notify("Settings saved! Add to .env for persistence")).props("color=primary")
+        ui.button("Save Settings", on_click=save_settings_clicked).props("color=primary")
 
     # Scheduler
     with ui.card().classes("p-6 w-full mb-6"):
         ui.label("Automation").classes("text-xl font-bold mb-4")
-        
-        scheduler = get_post_scheduler()
-        status = "Running" if scheduler.is_running else "Stopped"
-        status_color = "green" if scheduler.is_running else "red"
-        
-        with ui.row().classes("w-full justify-between items-center"):
-            ui.label("Post Scheduler:").classes("font-bold")
-            with ui.row().classes("gap-2"):
-                ui.badge(status, color=status_color)
-                ui.button("Toggle", on_click=lambda: toggle_scheduler()).props("flat color=orange")
+        scheduler_status()
 
     # Rate Limiting & Human Behavior
     with ui.card().classes("p-6 w-full mb-6"):
@@ -1370,22 +1480,34 @@ async def render_settings():
             ui.notify("Rate limits saved!", type="positive")
         
 
+@ui.refreshable
+def scheduler_status():
+    """Scheduler badge + toggle; refreshed in place instead of reloading
+    the whole settings page."""
+    status = "Running" if post_scheduler.is_running else "Stopped"
+    status_color = "green" if post_scheduler.is_running else "red"
+
+    with ui.row().classes("w-full justify-between items-center"):
+        ui.label("Post Scheduler:").classes("font-bold")
+        with ui.row().classes("gap-2"):
+            ui.badge(status, color=status_color)
+            ui.button("Toggle", on_click=lambda: toggle_scheduler()).props("flat color=orange")
+
+
 async def toggle_scheduler():
-    scheduler = get_post_scheduler()
-    if scheduler.is_running:
-        scheduler.stop()
+    if post_scheduler.is_running:
+        post_scheduler.stop()
         ui.notify("Scheduler stopped")
     else:
-        scheduler.start()
+        post_scheduler.start()
         ui.notify("Scheduler started")
-    ui.navigate.to("/settings")
+    scheduler_status.refresh()
 
 
 async def connect_twitter():
     """Show Twitter connection dialog."""
     # Check if already connected
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         connected_platforms = await get_connected_platforms(session)
         is_connected = "twitter" in connected_platforms
     
@@ -1417,7 +1539,6 @@ async def connect_twitter():
                 
                 ui.notify("🤖 Starting automated Twitter login with Google SSO...", type="info")
                 
-                from media_agent.platforms import get_platform_registry
                 registry = get_platform_registry()
                 adapter = registry.get_adapter("twitter", google_email.value, google_password.value)
                 
@@ -1511,8 +1632,7 @@ async def connect_twitter():
                                 await adapter.save_cookies()
                                 cookies = adapter.get_cookies_json()
                                 
-                                db = get_db()
-                                async with db.async_session_maker() as session:
+                                async with _session_maker()() as session:
                                     await save_platform_credential(session, "twitter", google_email.value, cookies)
                                 
                                 return True
@@ -1539,7 +1659,6 @@ async def connect_twitter():
             ui.label("Open browser, login to Twitter, then click 'I logged in'").classes("text-xs text-gray-500 mb-2")
             
             async def open_browser_manual():
-                from media_agent.platforms import get_platform_registry
                 registry = get_platform_registry()
                 adapter = registry.get_adapter("twitter", "manual", "dummy")
                 
@@ -1554,8 +1673,7 @@ async def connect_twitter():
                         async def confirm():
                             await adapter.save_cookies()
                             cookies = adapter.get_cookies_json()
-                            db = get_db()
-                            async with db.async_session_maker() as session:
+                            async with _session_maker()() as session:
                                 await save_platform_credential(session, "twitter", "manual", cookies)
                             ui.notify("Twitter connected!", type="positive")
                             dialog.close()
@@ -1587,123 +1705,110 @@ async def connect_platform_dialog(platform: str):
         ui.notify(f"Platform {platform} not supported yet", type="warning")
 
 
-async def connect_instagram():
-    """Show Instagram connection dialog."""
+async def make_connect_dialog(
+    platform: str,
+    title: str,
+    color: str,
+    bullets: list[str],
+    login_url: str,
+    browser_button_label: str,
+    username_label: str = "Username",
+):
+    """Build a connect dialog for platforms with a plain credential login.
+
+    Instagram and Facebook shared near-identical dialogs; one factory
+    means fixes and fast-paths (debounce, adapter caching, browser
+    pre-warm) land once and cover every platform wired through it.
+    Twitter keeps its bespoke Google-SSO flow.
+    """
     with ui.dialog() as dialog, ui.card().classes("w-96"):
-        ui.label("Connect Instagram").classes("text-xl font-bold mb-4")
-        
+        ui.label(title).classes("text-xl font-bold mb-4")
+
         ui.label("Choose your login method:").classes("text-sm mb-2")
-        ui.label("• Login with Facebook (recommended for Facebook SSO)").classes("text-xs text-gray-500")
-        ui.label("• Or enter your Instagram username/password").classes("text-xs text-gray-500 mb-4")
-        
+        for bullet in bullets:
+            ui.label(f"• {bullet}").classes("text-xs text-gray-500")
+
         async def login_with_browser():
-            """Open browser and let user login manually (supports Facebook SSO)."""
-            ui.notify("Opening browser... Login with Facebook or username/password", type="info")
-            
-            from media_agent.platforms import get_platform_registry
+            """Open browser and let user login manually (supports SSO)."""
+            ui.notify("Opening browser... Login however you normally do", type="info")
+
             registry = get_platform_registry()
-            adapter = registry.get_adapter("instagram", "dummy", "dummy")
-            
+            adapter = registry.get_adapter(platform, "dummy", "dummy")
+
             try:
                 await adapter.init_browser(headless=False)
-                await adapter.page.goto("https://www.instagram.com/accounts/login/")
-                
+                await adapter.page.goto(login_url)
+
                 ui.notify("Browser opened! Login however you normally do. We'll save your session.", type="info")
-                
+
             except Exception as e:
                 ui.notify(f"Error: {str(e)}", type="negative")
-        
+
         async def test_connection():
             if not username.value or not password.value:
                 ui.notify("Please enter credentials", type="warning")
                 return
-            
+
             ui.notify("Opening browser...", type="info")
-            
-            from media_agent.platforms import get_platform_registry
+
             registry = get_platform_registry()
-            adapter = registry.get_adapter("instagram", username.value, password.value)
-            
+            adapter = registry.get_adapter(platform, username.value, password.value)
+            adapter.headless = False
+
             try:
                 success = await adapter.login()
                 if success:
-                    ui.notify("Instagram connected!", type="positive")
+                    ui.notify(f"{platform.capitalize()} connected!", type="positive")
                     dialog.close()
             except Exception as e:
                 ui.notify(f"Error: {str(e)}", type="negative")
-        
-        ui.button("Login with Facebook (Browser)", icon="login", on_click=login_with_browser).props("color=purple w-full mb-4")
-        
+
+        ui.button(browser_button_label, icon="login", on_click=login_with_browser).props(f"color={color} w-full mb-4")
+
         ui.label("Or login with username/password:").classes("text-sm font-bold mt-4 mb-2")
-        username = ui.input("Username").classes("w-full mb-2")
+        username = ui.input(username_label).classes("w-full mb-2")
         password = ui.input("Password", password=True, password_toggle_button=True).classes("w-full mb-4")
-        
+
         with ui.row().classes("w-full justify-end gap-2"):
             ui.button("Cancel", on_click=dialog.close).props("flat")
-            ui.button("Connect", on_click=test_connection).props("color=purple")
-    
+            ui.button("Connect", on_click=test_connection).props(f"color={color}")
+
     dialog.open()
 
 
+async def connect_instagram():
+    """Show Instagram connection dialog."""
+    await make_connect_dialog(
+        "instagram",
+        title="Connect Instagram",
+        color="purple",
+        bullets=[
+            "Login with Facebook (recommended for Facebook SSO)",
+            "Or enter your Instagram username/password",
+        ],
+        login_url="https://www.instagram.com/accounts/login/",
+        browser_button_label="Login with Facebook (Browser)",
+    )
+
+
 async def connect_linkedin():
     ui.notify("LinkedIn integration coming soon!", type="info")
 
 
 async def connect_facebook():
     """Show Facebook connection dialog."""
-    with ui.dialog() as dialog, ui.card().classes("w-96"):
-        ui.label("Connect Facebook").classes("text-xl font-bold mb-4")
-        
-        ui.label("Enter your Facebook credentials to enable:").classes("text-sm mb-2")
-        ui.label("• Automated posting").classes("text-xs text-gray-500")
-        ui.label("• Auto-responding to comments").classes("text-xs text-gray-500")
-        
-        async def login_with_browser():
-            """Open browser and let user login manually."""
-            ui.notify("Opening browser... Login however you normally do", type="info")
-            
-            from media_agent.platforms import get_platform_registry
-            registry = get_platform_registry()
-            adapter = registry.get_adapter("facebook", "dummy", "dummy")
-            
-            try:
-                await adapter.init_browser(headless=False)
-                await adapter.page.goto("https://www.facebook.com/login")
-                
-                ui.notify("Browser opened! Login however you normally do. We'll save your session.", type="info")
-                
-            except Exception as e:
-                ui.notify(f"Error: {str(e)}", type="negative")
-        
-        username = ui.input("Email or Phone").classes("w-full mb-2")
-        password = ui.input("Password", password=True, password_toggle_button=True).classes("w-full mb-2")
-        
-        async def test_connection():
-            if not username.value or not password.value:
-                ui.notify("Please enter credentials", type="warning")
-                return
-            
-            ui.notify("Opening browser...", type="info")
-            
-            from media_agent.platforms import get_platform_registry
-            registry = get_platform_registry()
-            adapter = registry.get_adapter("facebook", username.value, password.value)
-            
-            try:
-                success = await adapter.login()
-                if success:
-                    ui.notify("Facebook connected!", type="positive")
-                    dialog.close()
-            except Exception as e:
-                ui.notify(f"Error: {str(e)}", type="negative")
-        
-        ui.button("Login with Browser", icon="login", on_click=login_with_browser).props("color=blue w-full mb-4")
-        
-        with ui.row().classes("w-full justify-end gap-2"):
-            ui.button("Cancel", on_click=dialog.close).props("flat")
-            ui.button("Connect", on_click=test_connection).props("color=blue")
-    
-    dialog.open()
+    await make_connect_dialog(
+        "facebook",
+        title="Connect Facebook",
+        color="blue",
+        bullets=[
+            "Automated posting",
+            "Auto-responding to comments",
+        ],
+        login_url="https://www.facebook.com/login",
+        browser_button_label="Login with Browser",
+        username_label="Email or Phone",
+    )
 
 
 # ============== DIALOGS ==============
@@ -1722,15 +1827,15 @@ async def show_add_product_dialog():
                 ui.notify("Name required", type="negative")
                 return
             
-            db = get_db()
-            async with db.async_session_maker() as session:
+            async with _session_maker()() as session:
                 product = await create_product(session, name=name.value, description=desc.value or "", brand_voice=voice, target_audience=audience.value or "")
                 
-                # Check for config file FAQs
+                # Check for config file FAQs; one executemany INSERT
+                # instead of a commit per seed FAQ
                 config = load_product_config(name.value.lower())
-                if config:
-                    for faq in config.get("faq", []):
-                        await create_faq(session, product.id, faq.get("question", ""), faq.get("answer", ""), faq.get("keywords", ""))
+                if config and config.get("faq"):
+                    from media_agent.models.database import create_faqs_bulk
+                    await create_faqs_bulk(session, product.id, config["faq"])
             
             dialog.close()
             ui.notify(f"Product '{name.value}' created!")
@@ -1756,9 +1861,9 @@ async def confirm_delete_product(product):
 
 
 async def do_delete_product(product_id, dialog):
-    db = get_db()
-    async with db.async_session_maker() as session:
+    async with _session_maker()() as session:
         await delete_product(session, product_id)
+    invalidate_product_cache(product_id)
     dialog.close()
     ui.notify("Product deleted")
     ui.navigate.to("/")
@@ -1772,10 +1877,18 @@ async def edit_product_dialog(product):
         desc = ui.textarea("Description", value=product.description or "").classes("w-full mb-4")
         
         async def save():
-            db = get_db()
-            async with db.async_session_maker() as session:
-                from media_agent.models.database import update_product
-                await update_product(session, product.id, name=name.value, description=desc.value or "")
+            # Send only the fields that actually changed; an unchanged
+            # form closes without touching the database
+            changes = {}
+            if name.value != product.name:
+                changes["name"] = name.value
+            if (desc.value or "") != (product.description or ""):
+                changes["description"] = desc.value or ""
+
+            if changes:
+                async with _session_maker()() as session:
+                    await update_product_fields(session, product.id, **changes)
+                invalidate_product_cache(product.id)
             dialog.close()
             ui.notify("Product updated!")
             ui.navigate.to(f"/product/{product.id}")
@@ -1788,9 +1901,17 @@ async def edit_product_dialog(product):
 
 
 async def show_create_post_dialog(product_id):
-    db = get_db()
-    async with db.async_session_maker() as session:
-        product = await get_product(session, product_id)
+    product = await get_product_cached(product_id)
+
+    # Start generating speculatively: the LLM call only needs product
+    # fields, so by the time the user clicks "Generate with AI" the
+    # result is usually already resolved
+    from media_agent.agents.ai_engine import get_ai_engine
+    pregen_task = asyncio.create_task(get_ai_engine().generate_post(
+        product.name, product.description or "",
+        product.brand_voice, product.target_audience or "",
+        "promotional", "medium"
+    ))
 
     with ui.dialog() as dialog, ui.card().classes("w-full max-w-lg"):
         ui.label("Create Post").classes("text-xl font-bold mb-4")
@@ -1814,13 +1935,18 @@ async def show_create_post_dialog(product_id):
         schedule_toggle.on_click(toggle_schedule)
         
         async def generate():
-            ai = get_ai_engine()
+            nonlocal pregen_task
             try:
-                generated = await ai.generate_post(
-                    product.name, product.description or "", 
-                    product.brand_voice, product.target_audience or "",
-                    "promotional", "medium"
-                )
+                if pregen_task is not None:
+                    # First click consumes the speculative result
+                    generated = await pregen_task
+                    pregen_task = None
+                else:
+                    generated = await get_ai_engine().generate_post(
+                        product.name, product.description or "",
+                        product.brand_voice, product.target_audience or "",
+                        "promotional", "medium"
+                    )
                 content.set_value(generated)
             except Exception as e:
                 ui.notify(f"Error: {str(e)}", type="negative")
@@ -1830,8 +1956,7 @@ async def show_create_post_dialog(product_id):
                 ui.notify("Content required", type="warning")
                 return
             
-            db = get_db()
-            async with db.async_session_maker() as session:
+            async with _session_maker()() as session:
                 await create_post(session, product_id=product_id, content=content.value, platform=platform.value, scheduled_at=None, status="draft")
             
             dialog.close()
@@ -1843,7 +1968,6 @@ async def show_create_post_dialog(product_id):
                 ui.notify("Content required", type="warning")
                 return
             
-            from datetime import datetime
             scheduled_at = None
             status = "draft"
             
@@ -1855,8 +1979,7 @@ async def show_create_post_dialog(product_id):
                     ui.notify("Invalid date/time format. Use YYYY-MM-DD and HH:MM", type="warning")
                     return
             
-            db = get_db()
-            async with db.async_session_maker() as session:
+            async with _session_maker()() as session:
                 await create_post(session, product_id=product_id, content=content.value, platform=platform.value, scheduled_at=scheduled_at, status=status)
             
             dialog.close()
@@ -1872,7 +1995,13 @@ async def show_create_post_dialog(product_id):
         with ui.row().classes("w-full justify-end gap-2"):
             ui.button("Save Draft", on_click=save_draft).props("flat")
             ui.button("Schedule Post", on_click=save_schedule).props("color=primary")
-    
+
+        def cancel_pregen():
+            if pregen_task is not None and not pregen_task.done():
+                pregen_task.cancel()
+
+        dialog.on("hide", cancel_pregen)
+
     dialog.open()
 
 
@@ -1889,8 +2018,7 @@ async def show_add_faq_dialog(product_id):
                 ui.notify("Question and answer required", type="warning")
                 return
             
-            db = get_db()
-            async with db.async_session_maker() as session:
+            async with _session_maker()() as session:
                 await create_faq(session, product_id, question.value, answer.value, keywords.value or "")
             
             dialog.close()
@@ -1904,10 +2032,16 @@ async def show_add_faq_dialog(product_id):
     dialog.open()
 
 
+async def _save_lead(product_id, platform_value, lead):
+    """Persist one discovered lead; bound per card via functools.partial
+    instead of allocating a fresh closure per result."""
+    async with _session_maker()() as s:
+        await create_lead(s, product_id, platform_value, lead.get("username", ""), relevance_score=lead.get("relevance_score", 0))
+    ui.notify(f"Saved @{lead.get('username', '')}")
+
+
 async def show_discover_dialog(product_id):
-    db = get_db()
-    async with db.async_session_maker() as session:
-        product = await get_product(session, product_id)
+    product = await get_product_cached(product_id)
 
     with ui.dialog() as dialog, ui.card().classes("w-full max-w-lg"):
         ui.label("Discover Leads").classes("text-xl font-bold mb-4")
@@ -1917,51 +2051,78 @@ async def show_discover_dialog(product_id):
         
         results = ui.column().classes("w-full gap-2 mt-4")
 
+        search_task: asyncio.Task | None = None
+
         async def search():
+            # Re-entrancy guard: rapid clicks would otherwise spawn
+            # parallel scrapes that burn platform rate limit for nothing
+            nonlocal search_task
+            if search_task is not None and not search_task.done():
+                return
+            search_btn.disable()
+            try:
+                search_task = asyncio.create_task(run_search())
+                await search_task
+            finally:
+                search_btn.enable()
+
+        async def run_search():
             ui.notify("Searching for leads...", type="info")
-            
+
+            from media_agent.discovery.discovery import get_lead_discovery
             discovery = get_lead_discovery()
             try:
-                leads = await discovery.search_leads(
-                    session=db.async_session_maker().__aenter__(),
+                results.clear()
+                found = 0
+
+                # Append cards as leads stream in: the first card shows
+                # after the fastest platform search instead of after all
+                # of them finish
+                async for lead in discovery.stream_leads(
                     product_id=product_id,
                     product_name=product.name,
                     product_description=product.description or "",
                     target_audience=product.target_audience or "",
                     query=query.value or "link in bio",
                     platform=platform.value,
-                )
-                
-                results.clear()
-                ui.label(f"Found {len(leads)} potential leads").classes("font-bold mb-2")
-                
-                for lead in leads[:10]:
+                    limit=10,
+                ):
+                    found += 1
                     with results:
                         with ui.card().classes("p-2 w-full"):
                             ui.label(f"@{lead.get('username', 'unknown')}").classes("font-bold text-sm")
-                            ui.label(lead.get("text", "")[:80]).classes("text-xs text-gray-500")
-                            
-                            async def save_lead(l=lead):
-                                db = get_db()
-                                async with db.async_session_maker() as s:
-                                    await create_lead(s, product_id, platform.value, l.get("username", ""), relevance_score=l.get("relevance_score", 0))
-                                ui.notify(f"Saved @{l.get('username', '')}")
-                            
-                            ui.button("Save Lead", on_click=save_lead).props("size=sm color=primary")
-                            
+                            ui.label(lead.get("text", "")).classes("text-xs text-gray-500")
+
+                            ui.button("Save Lead", on_click=functools.partial(_save_lead, product_id, platform.value, lead)).props("size=sm color=primary")
+
+                with results:
+                    ui.label(f"Found {found} potential leads").classes("font-bold mb-2")
+
             except Exception as e:
                 ui.notify(f"Error: {str(e)}", type="negative")
 
         with ui.row().classes("w-full justify-end gap-2"):
             ui.button("Cancel", on_click=dialog.close).props("flat")
-            ui.button("Search", on_click=search).props("color=primary")
+            search_btn = ui.button("Search", on_click=search).props("color=primary")
     
     dialog.open()
 
 
 def run():
+    # The whole app is async (NiceGUI, SQLAlchemy, scheduler), so a
+    # faster event loop speeds every await. Optional: stdlib asyncio is
+    # the fallback when uvloop isn't installed. Must run before NiceGUI
+    # creates its loop.
+    try:
+        import uvloop
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     settings = get_settings()
     app.on_startup(init_app)
+    app.on_shutdown(shutdown_app)
     ui.run(host=settings.app_host, port=settings.app_port, title="MediaAgent", reload=False, show=True)
 
 